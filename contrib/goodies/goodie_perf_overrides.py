@@ -32,23 +32,9 @@ def override_tt_remove_alias(tp):
 #print "   overriding type_traits.remove_alias"
 
 # --------------- create_identifier --------------- #
-import pyplusplus.code_creators.algorithm
-import pyplusplus.decl_wrappers.algorithm
-import pyplusplus.code_creators
-import pyplusplus.code_creators.class_declaration
-
-def override_create_identifier(creator, full_name ):
-    """
-    This function will find all relevant namespace aliases and will return new 
-    full name that takes into account namespace aliases. 
-    Override: Temporary.  Hack that is not portable.
-    """
-    return full_name
-
-pyplusplus.decl_wrappers.algorithm.create_identifier = override_create_identifier
-pyplusplus.code_creators.algorithm.create_identifier = override_create_identifier
-
-print "   overriding decl_wrapper.algorithm.create_identifier."
+# The override is not needed any more: namespace aliases are resolved by
+# pyplusplus.decl_wrappers.algorithm.namespace_aliases_affect_on_me, which
+# does not walk over all left siblings of the code creator.
 
 # -------------- MB Cache --------------- #
 import pyplusplus.module_builder
@@ -17,12 +17,16 @@ The base class for all code creators is :class:`code_creators.code_creator_t`.
 
 from .code_creator import code_creator_t
 from .code_creator import separator_t
+from .sink import sink_t
+from .sink import string_sink_t
+
 from .compound import compound_t
 
 from .algorithm import (make_flatten, make_flatten_list, make_flatten_generator)
 from .algorithm import creator_finder
 from .algorithm import create_identifier
 from .algorithm import creators_affect_on_me
+from .algorithm import namespace_aliases_affect_on_me
 
 from .custom import custom_t
 from .custom import custom_text_t
@@ -47,8 +51,10 @@ from .namespace import namespace_as_pyclass_t
 from .enum import enum_t
 from .enum import pyenum_t
 
+from .calldef import calldef_t
 from .calldef import free_function_t
 from .calldef import mem_fun_t
+from .calldef import release_gil_wrapper_t
 from .calldef import make_constructor_t
 
 from .calldef import mem_fun_pv_t
@@ -110,6 +116,8 @@ from .member_variable import bit_field_t
 from .member_variable import bit_field_wrapper_t
 from .member_variable import array_mv_t
 from .member_variable import array_mv_wrapper_t
+from .member_variable import array_mv_buffer_t
+from .member_variable import array_mv_buffer_wrapper_t
 from .member_variable import mem_var_ref_t
 from .member_variable import mem_var_ref_wrapper_t
 from .member_variable import member_variable_addressof_t
@@ -159,3 +167,5 @@ from .name_mappings import name_mappings_t
 
 from .typedef_as_pyvar import typedef_as_pyvar_t
 from .embedded_code_repository import embedded_code_repository_t
+
+from .call_stats import call_stats_registration_t
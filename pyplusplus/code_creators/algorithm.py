@@ -9,6 +9,7 @@ tree.
 """
 
 from pyplusplus.decl_wrappers.algorithm import *
+from pygccxml import declarations
 
 
 import types
@@ -63,6 +64,38 @@ make_flatten - function that will create flat representation of code creators tr
 make_flatten_list = _make_flatten_list
 make_flatten = _make_flatten_list
 
+def _sort_in_tree_order( root, creators ):
+    #sorts descendants of the root in the order, make_flatten_generator returns them
+    positions = {} #id( parent ) : { id( child ) : index }
+    def path( creator ):
+        answer = []
+        while creator is not root:
+            parent = creator.parent
+            if id( parent ) not in positions:
+                positions[ id( parent ) ] \
+                    = dict( [ ( id( child ), index ) for index, child in enumerate( parent.creators ) ] )
+            answer.append( positions[ id( parent ) ][ id( creator ) ] )
+            creator = parent
+        answer.reverse()
+        return answer
+    return sorted( creators, key=path )
+
+def _find_in_tree( where, is_my_case, find_descendants ):
+    #finds all creators within the where( creator or list of creators ), using
+    #indexes, maintained by compound_t, instead of walking the whole tree
+    from . import compound
+    roots = where
+    if not isinstance( where, list ):
+        roots = [ where ]
+    answer = []
+    for root in roots:
+        if is_my_case( root ):
+            answer.append( root )
+        if isinstance( root, compound.compound_t ):
+            found = [ inst for inst in find_descendants( root ) if is_my_case( inst ) ]
+            answer.extend( _sort_in_tree_order( root, found ) )
+    return answer
+
 class creator_finder:
     """
     This class is used as container for different find algorithms.
@@ -73,16 +106,25 @@ class creator_finder:
     def find_by_declaration( declaration_matcher, where, recursive=True ):
         """Finds code creator by declaration.
         declaration_matcher should be callable, that takes single argument
-        declaration, and returns True or False
+        declaration, and returns True or False, or the declaration itself
         where - code creator or list of code creators
         This function returns a list of all relevant code creators
         """
         from . import declaration_based #prevent cyclic import
-        search_area = where
+        if isinstance( declaration_matcher, declarations.declaration_t ):
+            declaration = declaration_matcher
+            declaration_matcher = lambda decl: decl is declaration
+            find_descendants = lambda root: root.find_descendants_by_declaration( declaration )
+        else:
+            find_descendants = lambda root: root.find_descendants_by_class( declaration_based.declaration_based_t )
+        is_my_case = lambda inst: isinstance( inst, declaration_based.declaration_based_t ) \
+                                  and declaration_matcher( inst.declaration )
         if recursive:
-            search_area = make_flatten_generator( where )
-        return [inst for inst in search_area if isinstance( inst, declaration_based.declaration_based_t ) \
-                                    and declaration_matcher( inst.declaration )]
+            return _find_in_tree( where, is_my_case, find_descendants )
+        search_area = where
+        if not isinstance( where, list ):
+            search_area = [ where ] #keep backward compatibility
+        return [inst for inst in search_area if is_my_case( inst )]
 
     @staticmethod
     def find_by_declaration_single( declaration_matcher, where, recursive=True ):
@@ -93,10 +135,11 @@ class creator_finder:
 
     @staticmethod
     def find_by_class_instance( what, where, recursive=True ):
-        search_area = where
         if recursive:
-            search_area = make_flatten_generator( where )
-        return [inst for inst in search_area if isinstance( inst, what )]
+            return _find_in_tree( where
+                                  , lambda inst: isinstance( inst, what )
+                                  , lambda root: root.find_descendants_by_class( what ) )
+        return [inst for inst in where if isinstance( inst, what )]
 
 def make_id_creator( code_creator ):
     return lambda decl_string: create_identifier( code_creator, decl_string )
@@ -0,0 +1,21 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+from . import algorithm
+from . import registration_based
+from pyplusplus import code_repository
+
+class call_stats_registration_t( registration_based.registration_based_t ):
+    """creates code, which exposes the function calls statistics table to Python"""
+    def __init__( self, function_name='__pypp_stats__' ):
+        registration_based.registration_based_t.__init__( self )
+        self.function_name = function_name
+
+    def _create_impl( self ):
+        register = algorithm.create_identifier( self, '::pyplusplus::call_stats::register_stats' )
+        return '%s( "%s" );' % ( register, self.function_name )
+
+    def _get_system_files_impl( self ):
+        return [ code_repository.call_stats.file_name ]
@@ -11,6 +11,8 @@ from . import declaration_based
 from . import registration_based
 from pygccxml import declarations
 from pyplusplus import decl_wrappers
+from pyplusplus import code_repository
+from pyplusplus import function_transformers
 
 #TODO:
 #Add to docs:
@@ -25,6 +27,7 @@ class calldef_t( registration_based.registration_based_t
         declaration_based.declaration_based_t.__init__( self, declaration=function )
         self._wrapper = wrapper
         self._associated_decl_creators = []
+        self.count_calls = False
 
     @property
     def associated_decl_creators( self ):
@@ -57,6 +60,20 @@ class calldef_t( registration_based.registration_based_t
         else:
             return self.declaration.call_policies.create( self )
 
+    def create_counting_call_policies( self, call_policies_code ):
+        """wraps the call policies, so the function calls are counted in the statistics table"""
+        from pyplusplus.utils import call_profile
+        counting = algorithm.create_identifier( self, '::pyplusplus::call_stats::counting_policies' )
+        entry = '%s( "%s" )' % ( algorithm.create_identifier( self, '::pyplusplus::call_stats::entry' )
+                                 , call_profile.call_profile_t.key( self.declaration ) )
+        if not call_policies_code:
+            return '%s<>( %s )' % ( counting, entry )
+        return '%s< %s >( %s, %s )' \
+               % ( counting
+                   , self.declaration.call_policies.create_template_arg( self )
+                   , entry
+                   , call_policies_code )
+
     def create_def_code( self ):
         if not self.works_on_instance:
             return '%s.def' % self.parent.class_var_name
@@ -109,6 +126,8 @@ class calldef_t( registration_based.registration_based_t
 
         if self.declaration.call_policies:
             c_p_code = self.create_call_policies()
+            if self.count_calls:
+                c_p_code = self.create_counting_call_policies( c_p_code )
             if c_p_code:
                 result.append( self.param_sep() )
                 result.append( c_p_code )
@@ -139,6 +158,8 @@ class calldef_t( registration_based.registration_based_t
         files = []
         if self.declaration.call_policies:
             files.append( self.declaration.call_policies.header_file )
+        if self.count_calls:
+            files.append( code_repository.call_stats.file_name )
         return files
 
 class calldef_wrapper_t( code_creator.code_creator_t
@@ -161,6 +182,55 @@ class calldef_wrapper_t( code_creator.code_creator_t
     def wrapped_class_identifier( self ):
         return algorithm.create_identifier( self, self.declaration.parent.partial_decl_string )
 
+    def uses_override_cache(self):
+        """returns True, if the override caches the Python override lookup result and takes the GIL only to call it"""
+        return False
+
+    def override_cache_name(self):
+        return 'm_pypp_%s_override' % self.declaration.alias
+
+    def declares_override_cache(self):
+        """returns True, if the creator declares the override cache, shared by all overloads with the same alias"""
+        if not self.uses_override_cache():
+            return False
+        for creator in self.parent.creators:
+            if isinstance( creator, calldef_wrapper_t ) \
+               and creator.uses_override_cache() \
+               and creator.declaration.alias == self.declaration.alias:
+                return creator is self
+        return False
+
+    def create_override_cache_declaration(self):
+        cache_class = algorithm.create_identifier( self, 'pyplusplus::threading::override_cache_t' )
+        answer = [ '//if "%s" is not overridden in Python, C++ calls do not take the GIL.' % self.declaration.alias ]
+        answer.append( '//Python overrides, added after the first call, are looked up only' )
+        answer.append( '//after %s::invalidate_all() call.' % cache_class )
+        answer.append( 'mutable %s %s;' % ( cache_class, self.override_cache_name() ) )
+        return os.linesep.join( answer )
+
+    def create_thread_safe_virtual_body(self):
+        template = []
+        precall_code = self.declaration.override_precall_code
+        if precall_code:
+            template.append( os.linesep.join( precall_code ) )
+        template.append( 'if( %(cache)s.may_exist() ){' )
+        template.append( self.indent( '%(gil_guard)s gil_guard( true );' ) )
+        template.append( self.indent( 'if( %(override)s func_%(alias)s = this->get_override( "%(alias)s" ) ){' ) )
+        template.append( self.indent( '%(cache)s.set( true );', 2 ) )
+        if declarations.is_void( self.declaration.return_type ):
+            template.append( self.indent( 'func_%(alias)s( %(args)s );', 2 ) )
+            template.append( self.indent( 'return;', 2 ) )
+        else:
+            template.append( self.indent( 'return func_%(alias)s( %(args)s );', 2 ) )
+        template.append( self.indent( '}' ) )
+        template.append( self.indent( '%(cache)s.set( false );' ) )
+        template.append( '}' )
+        native_precall_code = self.declaration.override_native_precall_code
+        if native_precall_code:
+            template.append( os.linesep.join( native_precall_code ) )
+        template.append( '%(return_)sthis->%(wrapped_class)s::%(name)s( %(args)s );' )
+        return os.linesep.join( template )
+
     def unoverriden_function_body( self ):
         return 'throw std::logic_error("%s");' % self.declaration.non_overridable_reason
 
@@ -184,24 +254,32 @@ class calldef_wrapper_t( code_creator.code_creator_t
         return files
 
 class free_function_t( calldef_t ):
-    def __init__( self, function ):
-        calldef_t.__init__( self, function=function )
+    def __init__( self, function, wrapper=None ):
+        calldef_t.__init__( self, function=function, wrapper=wrapper )
         self.works_on_instance = False
 
     def create_def_code( self ):
         return self.def_identifier()
 
     def create_function_type_alias_code( self, exported_class_alias=None  ):
-        f_type = self.declaration.function_type()
+        if self.wrapper:
+            f_type = self.wrapper.function_type()
+        else:
+            f_type = self.declaration.function_type()
         return 'typedef ' + f_type.create_typedef( self.function_type_alias, with_defaults=False ) + ';'
 
     def create_function_ref_code(self, use_function_alias=False):
-        fname = declarations.full_name( self.declaration, with_defaults=False )
+        if self.wrapper:
+            fname = self.wrapper.full_name()
+            ftype = self.wrapper.function_type()
+        else:
+            fname = declarations.full_name( self.declaration, with_defaults=False )
+            ftype = self.declaration.function_type()
         result = ''
         if use_function_alias:
             result = '%s( &%s )' % ( self.function_type_alias, fname )
         elif self.declaration.create_with_signature:
-            result = '(%s)( &%s )' % ( self.declaration.function_type().partial_decl_string, fname )
+            result = '(%s)( &%s )' % ( ftype.partial_decl_string, fname )
         else:
             result = '&%s' % fname
         if self.declaration.adaptor:
@@ -209,26 +287,127 @@ class free_function_t( calldef_t ):
         return result
 
 class mem_fun_t( calldef_t ):
-    def __init__( self, function ):
-        calldef_t.__init__( self, function=function )
+    def __init__( self, function, wrapper=None ):
+        calldef_t.__init__( self, function=function, wrapper=wrapper )
 
     def create_function_type_alias_code( self, exported_class_alias=None  ):
+        if self.wrapper:
+            ftype = self.wrapper.function_type()
+            return 'typedef %s;' % ftype.create_typedef( self.function_type_alias, with_defaults=False )
         ftype = self.declaration.function_type()
         return 'typedef %s;' % ftype.create_typedef( self.function_type_alias, exported_class_alias, with_defaults=False )
 
     def create_function_ref_code(self, use_function_alias=False):
-        fname = declarations.full_name( self.declaration, with_defaults=False )
+        if self.wrapper:
+            fname = self.wrapper.full_name()
+            ftype = self.wrapper.function_type()
+        else:
+            fname = declarations.full_name( self.declaration, with_defaults=False )
+            ftype = self.declaration.function_type()
         result = ''
         if use_function_alias:
             result = '%s( &%s )' % ( self.function_type_alias, fname )
         elif self.declaration.create_with_signature:
-            result = '(%s)( &%s )' % ( self.declaration.function_type().partial_decl_string, fname )
+            result = '(%s)( &%s )' % ( ftype.partial_decl_string, fname )
         else:
             result = '&%s' % fname
         if hasattr( self.declaration, 'adaptor' ) and self.declaration.adaptor:
             result = "%s( %s )" % ( self.declaration.adaptor, result )
         return result
 
+class release_gil_wrapper_t( calldef_wrapper_t ):
+    """creates free or member function wrapper, which releases the GIL while the function is running
+
+    The GIL is reacquired, when the wrapper returns, before `Boost.Python`
+    converts the result.
+    """
+    def __init__( self, function ):
+        calldef_wrapper_t.__init__( self, function=function )
+
+    @property
+    def has_inst_arg( self ):
+        return isinstance( self.declaration, declarations.member_calldef_t ) \
+               and not self.declaration.has_static
+
+    def inst_arg_name( self ):
+        names = set( [ arg.name for arg in self.declaration.arguments ] )
+        name = 'inst'
+        while name in names:
+            name = '_' + name
+        return name
+
+    def inst_arg_type( self ):
+        constness = ''
+        if self.declaration.has_const:
+            constness = 'const '
+        return declarations.dummy_type_t( '%s%s &' % ( constness, self.wrapped_class_identifier() ) )
+
+    def wrapper_name( self ):
+        return function_transformers.function_transformation.create_unique_name( self.declaration )
+
+    def full_name( self ):
+        return self.wrapper_name()
+
+    def function_type( self ):
+        args = [ arg.decl_type for arg in self.declaration.arguments ]
+        if self.has_inst_arg:
+            args.insert( 0, self.inst_arg_type() )
+        return declarations.free_function_type_t(
+                  return_type=self.declaration.return_type
+                , arguments_types=args )
+
+    def create_declaration( self ):
+        template = 'static %(return_type)s %(name)s( %(args)s )%(throw)s'
+
+        args = self.args_declaration()
+        if self.has_inst_arg:
+            inst_arg = self.inst_arg_type().decl_string + ' ' + self.inst_arg_name()
+            if args:
+                args = self.PARAM_SEPARATOR.join( [ inst_arg, args ] )
+            else:
+                args = inst_arg
+
+        return template % {
+            'return_type' : self.declaration.return_type.partial_decl_string
+            , 'name' : self.wrapper_name()
+            , 'args' : args
+            , 'throw' : self.throw_specifier_code()
+        }
+
+    def create_body( self ):
+        tmpl = [ '%(gil_release)s gil_release;' ]
+        tmpl.append( '%(return_)s%(function)s( %(args)s );' )
+
+        return_ = ''
+        if not declarations.is_void( self.declaration.return_type ):
+            return_ = 'return '
+
+        if self.has_inst_arg:
+            function = self.inst_arg_name() + '.' + self.declaration.name
+        else:
+            function = declarations.full_name( self.declaration, with_defaults=False )
+
+        return os.linesep.join( tmpl ) % {
+            'gil_release' : algorithm.create_identifier( self, 'pyplusplus::threading::gil_release_t' )
+            , 'return_' : return_
+            , 'function' : function
+            , 'args' : self.function_call_args()
+        }
+
+    def create_function( self ):
+        answer = [ self.create_declaration() + '{' ]
+        answer.append( self.indent( self.create_body() ) )
+        answer.append( '}' )
+        return os.linesep.join( answer )
+
+    def _create_impl( self ):
+        return self.create_function()
+
+    def _get_system_files_impl( self ):
+        files = calldef_wrapper_t._get_system_files_impl( self )
+        files.append( code_repository.gil_guard.file_name )
+        return files
+
 class make_constructor_t( calldef_t ):
     def __init__( self, function ):
         calldef_t.__init__( self, function=function )
@@ -360,6 +539,8 @@ class mem_fun_pv_wrapper_t( calldef_wrapper_t ):
         precall_code = self.declaration.override_precall_code
         if precall_code:
             template.append( os.linesep.join( precall_code ) )
+        if self.declaration.does_thread_safe_override():
+            template.append( '%(gil_guard)s gil_guard( true );' )
         template.append( '%(override)s func_%(alias)s = this->get_override( "%(alias)s" );' )
         if self.declaration.return_type \
            and auto_ptr_traits.is_smart_pointer( self.declaration.return_type ):
@@ -379,6 +560,7 @@ class mem_fun_pv_wrapper_t( calldef_wrapper_t ):
 
         return template % {
             'override' : self.override_identifier()
+            , 'gil_guard' : algorithm.create_identifier( self, 'pyplusplus::threading::gil_guard_t' )
             , 'alias' : self.declaration.alias
             , 'return_' : return_
             , 'args' : self.function_call_args()
@@ -391,6 +573,12 @@ class mem_fun_pv_wrapper_t( calldef_wrapper_t ):
         answer.append( '}' )
         return os.linesep.join( answer )
 
+    def _get_system_files_impl( self ):
+        files = calldef_wrapper_t._get_system_files_impl( self )
+        if self.declaration.does_thread_safe_override():
+            files.append( code_repository.gil_guard.file_name )
+        return files
+
 class mem_fun_v_t( calldef_t ):
     def __init__( self, function, wrapper=None ):
         calldef_t.__init__( self, function=function, wrapper=wrapper )
@@ -474,20 +662,26 @@ class mem_fun_v_wrapper_t( calldef_wrapper_t ):
             , 'throw' : self.throw_specifier_code()
         }
 
+    def uses_override_cache(self):
+        return self.declaration.does_thread_safe_override()
+
     def create_virtual_body(self):
-        template = []
-        precall_code = self.declaration.override_precall_code
-        if precall_code:
-            template.append( os.linesep.join( precall_code ) )
-        template.append( 'if( %(override)s func_%(alias)s = this->get_override( "%(alias)s" ) )' )
-        template.append( self.indent('%(return_)sfunc_%(alias)s( %(args)s );') )
-        template.append( 'else{' )
-        native_precall_code = self.declaration.override_native_precall_code
-        if native_precall_code:
-            template.append( self.indent( os.linesep.join( native_precall_code ) ) )
-        template.append( self.indent('%(return_)sthis->%(wrapped_class)s::%(name)s( %(args)s );') )
-        template.append( '}' )
-        template = os.linesep.join( template )
+        if self.uses_override_cache():
+            template = self.create_thread_safe_virtual_body()
+        else:
+            template = []
+            precall_code = self.declaration.override_precall_code
+            if precall_code:
+                template.append( os.linesep.join( precall_code ) )
+            template.append( 'if( %(override)s func_%(alias)s = this->get_override( "%(alias)s" ) )' )
+            template.append( self.indent('%(return_)sfunc_%(alias)s( %(args)s );') )
+            template.append( 'else{' )
+            native_precall_code = self.declaration.override_native_precall_code
+            if native_precall_code:
+                template.append( self.indent( os.linesep.join( native_precall_code ) ) )
+            template.append( self.indent('%(return_)sthis->%(wrapped_class)s::%(name)s( %(args)s );') )
+            template.append( '}' )
+            template = os.linesep.join( template )
 
         return_ = ''
         if not declarations.is_void( self.declaration.return_type ):
@@ -495,6 +689,8 @@ class mem_fun_v_wrapper_t( calldef_wrapper_t ):
 
         return template % {
             'override' : self.override_identifier()
+            , 'gil_guard' : algorithm.create_identifier( self, 'pyplusplus::threading::gil_guard_t' )
+            , 'cache' : self.override_cache_name()
             , 'name' : self.declaration.partial_name
             , 'alias' : self.declaration.alias
             , 'return_' : return_
@@ -530,8 +726,18 @@ class mem_fun_v_wrapper_t( calldef_wrapper_t ):
         answer = [ self.create_function() ]
         answer.append( '' )
         answer.append( self.create_default_function() )
+        if self.declares_override_cache():
+            answer.append( '' )
+            answer.append( self.create_override_cache_declaration() )
         return os.linesep.join( answer )
 
+    def _get_system_files_impl( self ):
+        files = calldef_wrapper_t._get_system_files_impl( self )
+        if self.uses_override_cache():
+            files.append( code_repository.gil_guard.file_name )
+            files.append( code_repository.override_cache.file_name )
+        return files
+
 
 class mem_fun_protected_t( calldef_t ):
     def __init__( self, function, wrapper ):
@@ -718,22 +924,28 @@ class mem_fun_protected_v_wrapper_t( calldef_wrapper_t ):
             , 'throw' : self.throw_specifier_code()
         }
 
-    def create_virtual_body(self):
-        template = []
+    def uses_override_cache(self):
+        return self.declaration.does_thread_safe_override()
 
-        precall_code = self.declaration.override_precall_code
-        if precall_code:
-            template.append( os.linesep.join( precall_code ) )
-
-        template.append( 'if( %(override)s func_%(alias)s = this->get_override( "%(alias)s" ) )' )
-        template.append( self.indent('%(return_)sfunc_%(alias)s( %(args)s );') )
-        template.append( 'else{' )
-        native_precall_code = self.declaration.override_native_precall_code
-        if native_precall_code:
-            template.append( self.indent( os.linesep.join( native_precall_code ) ) )
-        template.append( self.indent('%(return_)sthis->%(wrapped_class)s::%(name)s( %(args)s );') )
-        template.append( '}' )
-        template = os.linesep.join( template )
+    def create_virtual_body(self):
+        if self.uses_override_cache():
+            template = self.create_thread_safe_virtual_body()
+        else:
+            template = []
+
+            precall_code = self.declaration.override_precall_code
+            if precall_code:
+                template.append( os.linesep.join( precall_code ) )
+
+            template.append( 'if( %(override)s func_%(alias)s = this->get_override( "%(alias)s" ) )' )
+            template.append( self.indent('%(return_)sfunc_%(alias)s( %(args)s );') )
+            template.append( 'else{' )
+            native_precall_code = self.declaration.override_native_precall_code
+            if native_precall_code:
+                template.append( self.indent( os.linesep.join( native_precall_code ) ) )
+            template.append( self.indent('%(return_)sthis->%(wrapped_class)s::%(name)s( %(args)s );') )
+            template.append( '}' )
+            template = os.linesep.join( template )
 
         return_ = ''
         if not declarations.is_void( self.declaration.return_type ):
@@ -741,6 +953,8 @@ class mem_fun_protected_v_wrapper_t( calldef_wrapper_t ):
 
         return template % {
             'override' : self.override_identifier()
+            , 'gil_guard' : algorithm.create_identifier( self, 'pyplusplus::threading::gil_guard_t' )
+            , 'cache' : self.override_cache_name()
             , 'name' : self.declaration.partial_name
             , 'alias' : self.declaration.alias
             , 'return_' : return_
@@ -776,8 +990,18 @@ class mem_fun_protected_v_wrapper_t( calldef_wrapper_t ):
         answer = [ self.create_function() ]
         answer.append( '' )
         answer.append( self.create_default_function() )
+        if self.declares_override_cache():
+            answer.append( '' )
+            answer.append( self.create_override_cache_declaration() )
         return os.linesep.join( answer )
 
+    def _get_system_files_impl( self ):
+        files = calldef_wrapper_t._get_system_files_impl( self )
+        if self.uses_override_cache():
+            files.append( code_repository.gil_guard.file_name )
+            files.append( code_repository.override_cache.file_name )
+        return files
+
 
 class mem_fun_protected_pv_t( calldef_t ):
     def __init__( self, function, wrapper ):
@@ -836,6 +1060,8 @@ class mem_fun_protected_pv_wrapper_t( calldef_wrapper_t ):
         if precall_code:
             template.append( os.linesep.join( precall_code ) )
 
+        if self.declaration.does_thread_safe_override():
+            template.append( '%(gil_guard)s gil_guard( true );' )
         template.append( '%(override)s func_%(alias)s = this->get_override( "%(alias)s" );' )
         template.append( '%(return_)sfunc_%(alias)s( %(args)s );')
         template = os.linesep.join( template )
@@ -846,6 +1072,7 @@ class mem_fun_protected_pv_wrapper_t( calldef_wrapper_t ):
 
         return template % {
             'override' : self.override_identifier()
+            , 'gil_guard' : algorithm.create_identifier( self, 'pyplusplus::threading::gil_guard_t' )
             , 'alias' : self.declaration.alias
             , 'return_' : return_
             , 'args' : self.function_call_args()
@@ -857,6 +1084,12 @@ class mem_fun_protected_pv_wrapper_t( calldef_wrapper_t ):
         answer.append( '}' )
         return os.linesep.join( answer )
 
+    def _get_system_files_impl( self ):
+        files = calldef_wrapper_t._get_system_files_impl( self )
+        if self.declaration.does_thread_safe_override():
+            files.append( code_repository.gil_guard.file_name )
+        return files
+
 class mem_fun_private_v_wrapper_t( calldef_wrapper_t ):
     def __init__( self, function):
         calldef_wrapper_t.__init__( self, function=function )
@@ -896,6 +1129,8 @@ class mem_fun_private_v_wrapper_t( calldef_wrapper_t ):
         if precall_code:
             template.append( os.linesep.join( precall_code ) )
 
+        if self.declaration.does_thread_safe_override():
+            template.append( '%(gil_guard)s gil_guard( true );' )
         template.append( '%(override)s func_%(alias)s = this->get_override( "%(alias)s" );' )
         template.append( '%(return_)sfunc_%(alias)s( %(args)s );')
         template = os.linesep.join( template )
@@ -906,6 +1141,7 @@ class mem_fun_private_v_wrapper_t( calldef_wrapper_t ):
 
         return template % {
             'override' : self.override_identifier()
+            , 'gil_guard' : algorithm.create_identifier( self, 'pyplusplus::threading::gil_guard_t' )
             , 'alias' : self.declaration.alias
             , 'return_' : return_
             , 'args' : self.function_call_args()
@@ -917,6 +1153,12 @@ class mem_fun_private_v_wrapper_t( calldef_wrapper_t ):
         answer.append( '}' )
         return os.linesep.join( answer )
 
+    def _get_system_files_impl( self ):
+        files = calldef_wrapper_t._get_system_files_impl( self )
+        if self.declaration.does_thread_safe_override():
+            files.append( code_repository.gil_guard.file_name )
+        return files
+
 mem_fun_private_pv_wrapper_t = mem_fun_private_v_wrapper_t
 
 class constructor_t( calldef_t ):
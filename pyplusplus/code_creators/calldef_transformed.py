@@ -85,7 +85,16 @@ class sealed_fun_transformed_wrapper_t( calldef_wrapper_t ):
         tmpl_values['declare_variables'] \
             = os.linesep + os.linesep.join( [self.indent( var.declare_var_string() ) for var in cntrl.variables] )
                 
-        tmpl_values['pre_call'] = os.linesep + self.indent( os.linesep.join( cntrl.pre_call ) )
+        pre_call = cntrl.pre_call[:]
+        post_call = cntrl.post_call[:]
+        if self.declaration.does_release_gil():
+            #the GIL is released only for the native function call, pre and
+            #post call code works on Python objects
+            gil_release = algorithm.create_identifier( self, 'pyplusplus::threading::gil_release_t' )
+            pre_call.append( '%s %s;' % ( gil_release, cntrl.gil_release_variable ) )
+            post_call.insert( 0, '%s.restore();' % cntrl.gil_release_variable )
+
+        tmpl_values['pre_call'] = os.linesep + self.indent( os.linesep.join( pre_call ) )
 
         tmpl_values['save_result'] = ''
         if not declarations.is_void( self.declaration.return_type ):
@@ -104,7 +113,7 @@ class sealed_fun_transformed_wrapper_t( calldef_wrapper_t ):
                                     , self.controller.result_variable
                                     , self.controller.return_variables )
 
-        tmpl_values['post_call'] = os.linesep + self.indent( os.linesep.join( cntrl.post_call ) )
+        tmpl_values['post_call'] = os.linesep + self.indent( os.linesep.join( post_call ) )
         if return_stmt_creator.pre_return_code:
             tmpl_values['post_call'] \
                 = os.linesep.join([ tmpl_values['post_call']
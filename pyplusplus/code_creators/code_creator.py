@@ -26,6 +26,9 @@ class code_creator_t(object):
     LINE_LENGTH = 80
     PARAM_SEPARATOR = ', '
     CODE_GENERATOR_TYPES = decl_wrappers.CODE_GENERATOR_TYPES
+    #object, which measures the time spent by the code creators in the "create"
+    #method, see utils.profiler_t.rendering_phase
+    renderer = None
 
     def __init__(self):
         """Constructor.
@@ -104,10 +107,37 @@ class code_creator_t(object):
 
         :rtype: str
         """
+        if None is code_creator_t.renderer:
+            return self.__create()
+        return code_creator_t.renderer.render( self, self.__create )
+
+    def __create(self):
         code = self._create_impl()
         assert isinstance( code, str )
         return self.beautify( code )
 
+    def _write_impl(self, sink):
+        """
+        writes generated code to the sink.
+
+        Derived classes, which contain a lot of other code creators, could
+        implement this method to avoid building the whole code in memory.
+        The written code should be the same :meth:`create` returns.
+        """
+        sink.write( self.create() )
+
+    def write(self, sink):
+        """
+        writes generated code to the sink
+
+        :param sink: :class:`code_creators.sink_t` instance
+        """
+        if 'create' in vars( self ):
+            #create method was replaced, usually by a file writer
+            sink.write( self.create() )
+        else:
+            self._write_impl( sink )
+
     @staticmethod
     def unique_headers( headers ):
         used = set()
@@ -5,6 +5,7 @@
 
 import os
 from . import code_creator
+from . import declaration_based
 
 class compound_t(code_creator.code_creator_t):
     def __init__(self ):
@@ -15,6 +16,14 @@ class compound_t(code_creator.code_creator_t):
         """
         code_creator.code_creator_t.__init__( self )
         self._creators = []
+        #indexes of all descendant creators, they are updated by adopt_creator and
+        #remove_creator methods and used by :class:`creator_finder` algorithms
+        self._creators_by_decl = {} #id( declaration ) : { id( creator ) : creator }
+        self._creators_by_class = {} #creator class : { id( creator ) : creator }
+        #positions of the children creators and namespace aliases, defined by them,
+        #calculated on demand and used by :func:`create_identifier`
+        self._positions = None #id( creator ) : index
+        self._namespace_aliases = None #[ ( index, namespace_alias_t ) ]
 
     def _get_creators(self):
         return self._creators
@@ -33,8 +42,12 @@ class compound_t(code_creator.code_creator_t):
         creator.parent = self
         if index or index == 0:
             self._creators.insert( index, creator )
+            self._positions = None
         else:
             self._creators.append( creator )
+            if None is not self._positions:
+                self.__register_position( len( self._creators ) - 1, creator )
+        self.__update_indexes( creator, True )
 
     def adopt_creators( self, creators, index=None):
         """Add a creators to the list of children creators.
@@ -57,8 +70,78 @@ class compound_t(code_creator.code_creator_t):
         :param creator: The creator node to remove
         :type creator: :class:`code_creators.code_creator_t`
         """
+        self.__update_indexes( creator, False )
         creator.parent = None
         del self._creators[ self._creators.index( creator ) ]
+        self._positions = None
+
+    def __register_position( self, index, creator ):
+        from . import namespace #prevent cyclic import
+        self._positions[ id( creator ) ] = index
+        if isinstance( creator, namespace.namespace_alias_t ):
+            self._namespace_aliases.append( ( index, creator ) )
+
+    def __build_positions( self ):
+        if None is self._positions:
+            self._positions = {}
+            self._namespace_aliases = []
+            for index, creator in enumerate( self._creators ):
+                self.__register_position( index, creator )
+
+    def get_creator_index( self, creator ):
+        """returns position of the child creator, in constant time"""
+        self.__build_positions()
+        return self._positions[ id( creator ) ]
+
+    def get_namespace_aliases( self, before=None ):
+        """returns list of namespace aliases, defined by the children creators
+
+        :param before: child creator, if given only aliases, defined before it, are returned
+        """
+        self.__build_positions()
+        if None is before:
+            return [ alias for index, alias in self._namespace_aliases ]
+        position = self._positions[ id( before ) ]
+        return [ alias for index, alias in self._namespace_aliases if index < position ]
+
+    def get_descendants( self ):
+        """returns list of all descendant creators, in no particular order"""
+        answer = []
+        for creators in self._creators_by_class.values():
+            answer.extend( creators.values() )
+        return answer
+
+    def find_descendants_by_declaration( self, declaration ):
+        """returns list of descendant creators, based on the declaration, in no particular order"""
+        return list( self._creators_by_decl.get( id( declaration ), {} ).values() )
+
+    def find_descendants_by_class( self, class_ ):
+        """returns list of descendant creators, which are instances of the class( es ), in no particular order"""
+        answer = []
+        for creator_class, creators in self._creators_by_class.items():
+            if issubclass( creator_class, class_ ):
+                answer.extend( creators.values() )
+        return answer
+
+    def __update_indexes( self, creator, add ):
+        subtree = [ creator ]
+        if isinstance( creator, compound_t ):
+            subtree.extend( creator.get_descendants() )
+        node = self
+        while None is not node:
+            for cc in subtree:
+                keys = [ ( node._creators_by_class, cc.__class__ ) ]
+                if isinstance( cc, declaration_based.declaration_based_t ):
+                    keys.append( ( node._creators_by_decl, id( cc.declaration ) ) )
+                for index, key in keys:
+                    if add:
+                        index.setdefault( key, {} )[ id( cc ) ] = cc
+                    else:
+                        creators = index.get( key, {} )
+                        creators.pop( id( cc ), None )
+                        if not creators:
+                            index.pop( key, None )
+            node = node.parent
 
     @staticmethod
     def create_internal_code( creators, indent_code=True ):
@@ -77,6 +160,28 @@ class compound_t(code_creator.code_creator_t):
             internals[index] = internals[index] + os.linesep
         return os.linesep.join( internals )
 
+    @staticmethod
+    def write_internal_code( sink, creators, indent_code=True, separator='' ):
+        """
+        writes the code of a list of code creators to the sink.
+
+        The written code is the same :meth:`create_internal_code` returns, but
+        it is never concatenated in memory.
+
+        :param separator: text, written before the code, if it is not empty
+        :rtype: bool - True, if the code is not empty
+        """
+        written = False
+        for creator in creators:
+            if written:
+                sink.begin_block( os.linesep * 2, indent_code )
+            else:
+                sink.begin_block( separator, indent_code )
+            creator.write( sink )
+            if sink.end_block():
+                written = True
+        return written
+
     def get_system_files( self, recursive=False, unique=False, language='any' ):
         files = super( compound_t, self ).get_system_files(recursive, unique=False, language=language)
         if recursive:
@@ -10,6 +10,8 @@ from . import code_creator
 from . import declaration_based
 from . import registration_based
 from pygccxml import declarations
+from pyplusplus import code_repository
+from pyplusplus.decl_wrappers import call_policies
 
 class indexing_suite1_t( registration_based.registration_based_t
                          , declaration_based.declaration_based_t ):
@@ -54,26 +56,34 @@ class indexing_suite1_t( registration_based.registration_based_t
 
 class indexing_suite2_t( registration_based.registration_based_t
                          , declaration_based.declaration_based_t ):
-    def __init__(self, container ):
+    def __init__(self, container, read_only=None ):
         registration_based.registration_based_t.__init__( self )
         declaration_based.declaration_based_t.__init__( self, declaration=container )
         self.__method_mask_var_name = "methods_mask"
+        if None is read_only:
+            read_only = bool( container.indexing_suite.read_only )
+        self.read_only = read_only
         self.works_on_instance = not self.does_user_disable_methods()
 
     def does_user_disable_methods( self ):
         return bool( self.declaration.indexing_suite.disabled_methods_groups ) \
                or bool( self.declaration.indexing_suite.disable_methods )
 
-    def generate_algorithm_mask( self ):
+    def generate_algorithm_mask_expression( self ):
+        isuite = self.declaration.indexing_suite
+        groups = list( isuite.disabled_methods_groups )
+        methods = list( isuite.disable_methods )
+        if self.read_only:
+            groups.extend( [ group for group in isuite.MODIFYING_METHOD_GROUPS if group not in groups ] )
+            methods.extend( [ method for method in isuite.MODIFYING_METHODS if method not in methods ] )
         disable = []
-        for group in self.declaration.indexing_suite.disabled_methods_groups:
+        for group in groups:
             group_id = algorithm.create_identifier(self, "::boost::python::indexing::%s_methods" % group )
             disable.append( group_id )
-        for method in self.declaration.indexing_suite.disable_methods:
+        for method in methods:
             method_id = algorithm.create_identifier(self, "::boost::python::indexing::method_" + method )
             disable.append( method_id )
-        answer = [ 'unsigned long const %s = ' % self.__method_mask_var_name ]
-        answer.append( algorithm.create_identifier(self, "::boost::python::indexing::all_methods" ) )
+        answer = [ algorithm.create_identifier(self, "::boost::python::indexing::all_methods" ) ]
         answer.append( ' & ~' )
         if 1 == len ( disable ):
             answer.append( disable[0] )
@@ -81,17 +91,42 @@ class indexing_suite2_t( registration_based.registration_based_t
             answer.append( '( ' )
             answer.append( ' |  '.join( disable ) )
             answer.append( ' ) ' )
-        answer.append( ';' )
         return ''.join( answer )
 
+    def generate_algorithm_mask( self ):
+        return 'unsigned long const %s = %s;' \
+               % ( self.__method_mask_var_name, self.generate_algorithm_mask_expression() )
+
+    @property
+    def element_call_policies( self ):
+        """call policies, which are used by the container class to return the elements"""
+        policies = self.declaration.indexing_suite.call_policies
+        if policies and not policies.is_default():
+            return policies
+        if not self.read_only:
+            return policies
+        try:
+            element_type = self.declaration.indexing_suite.element_type
+        except:
+            return policies
+        if declarations.is_class( element_type ) \
+           and self.declaration.indexing_suite.container_traits in declarations.sequential_container_traits:
+            #elements of read only container could be referenced without proxies
+            return call_policies.return_internal_reference()
+        return policies
+
     def _create_impl( self ):
         if self.declaration.already_exposed:
             return ''
 
         answer = []
+        mask = None
         if self.does_user_disable_methods():
             answer.append( self.generate_algorithm_mask() )
             answer.append( os.linesep )
+            mask = self.__method_mask_var_name
+        elif self.read_only:
+            mask = self.generate_algorithm_mask_expression()
         if not self.works_on_instance:
             answer.append( '%s.def( ' % self.parent.class_var_name)
         else:
@@ -106,23 +141,32 @@ class indexing_suite2_t( registration_based.registration_based_t
             answer.append( bpi + '::' + container_name + '_suite' )
         answer.append( '< ' )
         answer.append( self.decl_identifier )
-        if self.does_user_disable_methods():
+        if mask:
             answer.append( self.PARAM_SEPARATOR )
-            answer.append( self.__method_mask_var_name )
+            answer.append( mask )
         answer.append( ' >' )
-        if self.declaration.indexing_suite.call_policies \
-           and not self.declaration.indexing_suite.call_policies.is_default():
-            answer.append( '::with_policies(%s)'
-                           % self.declaration.indexing_suite.call_policies.create( self )  )
+        element_call_policies = self.element_call_policies
+        if element_call_policies and not element_call_policies.is_default():
+            answer.append( '::with_policies(%s)' % element_call_policies.create( self )  )
         else:
             answer.append( '()' )
         answer.append( ' )' )
+        if self.declaration.indexing_suite.does_bulk_access():
+            bulk_access = algorithm.create_identifier( self, "::pyplusplus::containers::vector_bulk_access_t" )
+            args = [ self.decl_identifier ]
+            if mask:
+                args.append( mask )
+            answer.append( '.def( %s< %s >() )' % ( bulk_access, self.PARAM_SEPARATOR.join( args ) ) )
         if not self.works_on_instance:
             answer.append( ';' )
         return ''.join( answer )
 
     def _get_system_files_impl( self ):
-        return self.declaration.indexing_suite.include_files
+        include_files = self.declaration.indexing_suite.include_files
+        if self.declaration.indexing_suite.does_bulk_access():
+            include_files = include_files + [ code_repository.buffers.file_name
+                                              , code_repository.bulk_access.file_name ]
+        return include_files
 
 class value_traits_t( code_creator.code_creator_t
                       , declaration_based.declaration_based_t ):
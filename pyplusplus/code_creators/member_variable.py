@@ -414,8 +414,10 @@ class array_mv_t( member_variable_base_t ):
         temp.append( '( ' )
         temp.append( 'array_wrapper_creator(&%s)' % self.wrapper.wrapper_creator_full_name )
         if not self.declaration.type_qualifiers.has_static:
-            temp.append( os.linesep + self.indent( self.PARAM_SEPARATOR, 6 ) )
-            temp.append( call_policies.with_custodian_and_ward_postcall( 0, 1 ).create(self) )
+            policies = self._create_call_policies()
+            if policies:
+                temp.append( os.linesep + self.indent( self.PARAM_SEPARATOR, 6 ) )
+                temp.append( policies )
         temp.append( ' )' )
         answer.append( ''.join( temp ) )
         if doc:
@@ -425,6 +427,10 @@ class array_mv_t( member_variable_base_t ):
         answer.append( ' );' )
         return ''.join( answer )
 
+    def _create_call_policies( self ):
+        #the array wrapper keeps reference to the variable
+        return call_policies.with_custodian_and_ward_postcall( 0, 1 ).create(self)
+
     def _create_impl( self ):
         answer = []
         answer.append( '{ //%s, type=%s' % ( self.declaration, self.declaration.decl_type ) )
@@ -512,6 +518,68 @@ class array_mv_wrapper_t( code_creator.code_creator_t
         return [code_repository.array_1.file_name]
 
 
+class array_mv_buffer_t( array_mv_t ):
+    """
+    Creates boost.python code that exposes array member variable as memoryview object.
+    """
+    def __init__(self, variable, wrapper ):
+        array_mv_t.__init__( self, variable=variable, wrapper=wrapper )
+
+    def _create_call_policies( self ):
+        #the memoryview keeps reference to the instance
+        return ''
+
+
+class array_mv_buffer_wrapper_t( array_mv_wrapper_t ):
+    """creates function, which returns memoryview object over array member variable"""
+    def __init__(self, variable ):
+        array_mv_wrapper_t.__init__( self, variable=variable )
+
+    @property
+    def wrapper_type( self ):
+        return declarations.dummy_type_t( 'boost::python::object' )
+
+    @property
+    def wrapped_class_type( self ):
+        return declarations.dummy_type_t( 'boost::python::object' )
+
+    @property
+    def wrapper_creator_name(self):
+        return '_'.join( ['pyplusplus', self.declaration.name, 'buffer'] )
+
+    def _create_impl( self ):
+        shape = python_traits.buffer_shape( self.declaration.decl_type )
+        tmpl = [ "static %(wrapper_type)s" ]
+        if self.declaration.type_qualifiers.has_static:
+            tmpl.append( "%(wrapper_creator_name)s(){" )
+            data = '%(parent_class_type)s::%(mem_var_ref)s'
+            owner = '0'
+        else:
+            tmpl.append( "%(wrapper_creator_name)s( %(wrapped_class_type)s inst ){" )
+            tmpl.append( self.indent( "%(parent_class_type)s & self = %(extract)s< %(parent_class_type)s & >( inst );" ) )
+            data = 'self.%(mem_var_ref)s'
+            owner = 'inst.ptr()'
+        data = '&' + data + '[0]' * len( shape )
+        args = [ data ] + [ str( dim ) for dim in shape ] + [ owner ]
+        tmpl.append( self.indent( "return %(make_memoryview)s( " + ', '.join( args ) + " );" ) )
+        tmpl.append( "}" )
+
+        tmpl = os.linesep.join( tmpl )
+
+        return tmpl % {
+                'wrapper_type' : self.wrapper_type.decl_string
+              , 'parent_class_type' : self.parent.declaration.partial_decl_string
+              , 'wrapper_creator_name' : self.wrapper_creator_name
+              , 'wrapped_class_type' : self.wrapped_class_type.decl_string
+              , 'mem_var_ref' : self.declaration.name
+              , 'extract' : algorithm.create_identifier( self, 'boost::python::extract' )
+              , 'make_memoryview' : algorithm.create_identifier( self, code_repository.buffers.namespace + '::make_memoryview' )
+            }
+
+    def _get_system_files_impl( self ):
+        return [code_repository.buffers.file_name]
+
+
 class mem_var_ref_t( member_variable_base_t ):
     """
     creates get/set accessors for class member variable, that has type reference.
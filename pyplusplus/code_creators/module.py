@@ -204,6 +204,20 @@ class bpmodule_t(module_t):
         code.append( os.linesep )
         return os.linesep.join( code )
 
+    def _write_impl(self, sink):
+        self.do_include_dirs_optimization()
+        index = 0
+        separator = ''
+        for index in range( len( self.creators ) ):
+            if not isinstance( self.creators[index], include.include_t ):
+                break
+            else:
+                sink.write( separator + self.creators[index].create() )
+                separator = os.linesep
+        if separator:
+            separator = os.linesep + 2* os.linesep + os.linesep
+        self.write_internal_code( sink, self.creators[index:], indent_code=False, separator=separator )
+
     def add_include( self, header, user_defined=True, system=False ):
         creator = include.include_t( header=header, user_defined=user_defined, system=system )
         self.adopt_include( creator )
@@ -240,6 +254,9 @@ class ctypes_module_t(module_t):
     def _create_impl(self):
         return self.create_internal_code( self.creators, indent_code=False )
 
+    def _write_impl(self, sink):
+        self.write_internal_code( sink, self.creators, indent_code=False )
+
     @utils.cached
     def library_var_name(self):
         for creator in self.creators:
@@ -21,6 +21,11 @@ class module_body_t(compound.compound_t):
         result.append( compound.compound_t.create_internal_code( self.creators ) )
         result.append( "}" )
         return os.linesep.join( result )
+
+    def _write_impl(self, sink):
+        sink.write( "BOOST_PYTHON_MODULE(%s){" % self.name + os.linesep )
+        compound.compound_t.write_internal_code( sink, self.creators )
+        sink.write( os.linesep + "}" )
     
     def _get_system_files_impl( self ):
         return []
@@ -0,0 +1,93 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""
+defines classes, code creators write generated code to
+
+Code creators, which contain a lot of other creators ( module, module body ),
+do not build the whole code in memory. Instead, they write the code of every
+child to a sink, which applies indentation on the fly and passes the code
+further: to a file, to a list of strings, etc.
+"""
+
+import os
+
+class sink_t( object ):
+    """
+    base class for all sinks
+
+    The written code is indented according to the current indentation level.
+    Derived classes should implement :meth:`_write_impl` method.
+    """
+
+    INDENTATION = '    '
+
+    def __init__( self ):
+        object.__init__( self )
+        self.__indentation = ''
+        self.__blocks = [] #( number of deferred prefixes, indentation ) of the open blocks
+        self.__deferred = [] #prefixes of the open blocks, which were not written yet
+
+    def _write_impl( self, text ):
+        """writes already indented text"""
+        raise NotImplementedError( self.__class__.__name__ )
+
+    def __indent( self, text ):
+        if self.__indentation:
+            return text.replace( os.linesep, os.linesep + self.__indentation )
+        return text
+
+    def write( self, text ):
+        """writes the text, applying current indentation after every new line"""
+        if not text:
+            return
+        if self.__deferred:
+            self._write_impl( ''.join( self.__deferred ) )
+            self.__deferred = []
+        self._write_impl( self.__indent( text ) )
+
+    def begin_block( self, separator='', indent=False ):
+        """
+        starts block of code
+
+        The separator and the block indentation are written only if the
+        block is not empty.
+
+        :param separator: text, written before the block
+        :param indent: if True, the block code is indented by one level
+        """
+        prefix = self.__indent( separator )
+        if indent:
+            prefix = prefix + self.INDENTATION
+        self.__deferred.append( prefix )
+        self.__blocks.append( ( len( self.__deferred ), self.__indentation ) )
+        if indent:
+            self.__indentation = self.__indentation + self.INDENTATION
+
+    def end_block( self ):
+        """ends block of code, returns True if the block is not empty"""
+        deferred_count, self.__indentation = self.__blocks.pop()
+        if len( self.__deferred ) == deferred_count:
+            #nothing was written since the block was started
+            self.__deferred.pop()
+            return False
+        return True
+
+    def close( self ):
+        pass
+
+class string_sink_t( sink_t ):
+    """collects the written code in memory"""
+
+    def __init__( self ):
+        sink_t.__init__( self )
+        self.__fragments = []
+
+    def _write_impl( self, text ):
+        self.__fragments.append( text )
+
+    def get_value( self ):
+        """returns the written code"""
+        return ''.join( self.__fragments )
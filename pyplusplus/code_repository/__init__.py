@@ -9,21 +9,29 @@ Those classes/functions solve problems, that are typical to most projects.
 """
 
 from . import array_1
+from . import buffers
 from . import gil_guard
+from . import call_stats
+from . import bulk_access
 from . import named_tuple
 from . import convenience
 from . import return_range
+from . import override_cache
 from . import ctypes_utils
 from . import call_policies
 from . import indexing_suite
 from . import ctypes_integration
 
 all = [ array_1
+        , buffers
         , gil_guard
+        , call_stats
+        , bulk_access
         , convenience
         , call_policies
         , named_tuple
         , return_range
+        , override_cache
         , ctypes_utils
         , ctypes_integration ]
 
@@ -38,6 +46,6 @@ def i_depend_on_them( fname ):
         del result[ indexing_suite.headers.index( fname ) ]
         return result
     elif fname == return_range.file_name:
-        return indexing_suite.all[:]
+        return indexing_suite.all[:] + [ buffers ]
     else:
         return []
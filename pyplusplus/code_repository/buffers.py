@@ -0,0 +1,395 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""
+This file contains C++ code, which exposes C++ memory to Python, using the
+buffer protocol, without copying it.
+"""
+
+namespace = "pyplusplus::buffers"
+
+file_name = "__buffers.pypp.hpp"
+
+code = \
+"""// Copyright 2004-2008 Roman Yakovenko.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#ifndef __buffers_pyplusplus_hpp__
+#define __buffers_pyplusplus_hpp__
+
+#include "boost/python.hpp"
+#include "boost/type_traits/is_const.hpp"
+#include "boost/type_traits/remove_const.hpp"
+#include <vector>
+#include <sstream>
+
+namespace pyplusplus{ namespace buffers{
+
+//format_t< T >::value() returns "struct" module format character of T
+template< class T > struct format_t;
+
+#define PYPLUSPLUS_BUFFER_FORMAT( type, format_str )        \\
+    template<> struct format_t< type >{                     \\
+        static const char* value(){ return format_str; }    \\
+    };                                                      \\
+    template<> struct format_t< const type >{               \\
+        static const char* value(){ return format_str; }    \\
+    };
+
+PYPLUSPLUS_BUFFER_FORMAT( bool, "?" )
+PYPLUSPLUS_BUFFER_FORMAT( char, "c" )
+PYPLUSPLUS_BUFFER_FORMAT( signed char, "b" )
+PYPLUSPLUS_BUFFER_FORMAT( unsigned char, "B" )
+PYPLUSPLUS_BUFFER_FORMAT( short, "h" )
+PYPLUSPLUS_BUFFER_FORMAT( unsigned short, "H" )
+PYPLUSPLUS_BUFFER_FORMAT( int, "i" )
+PYPLUSPLUS_BUFFER_FORMAT( unsigned int, "I" )
+PYPLUSPLUS_BUFFER_FORMAT( long, "l" )
+PYPLUSPLUS_BUFFER_FORMAT( unsigned long, "L" )
+PYPLUSPLUS_BUFFER_FORMAT( long long, "q" )
+PYPLUSPLUS_BUFFER_FORMAT( unsigned long long, "Q" )
+PYPLUSPLUS_BUFFER_FORMAT( float, "f" )
+PYPLUSPLUS_BUFFER_FORMAT( double, "d" )
+PYPLUSPLUS_BUFFER_FORMAT( long double, "g" )
+
+#undef PYPLUSPLUS_BUFFER_FORMAT
+
+namespace details{
+
+//Python object, which exports C++ memory and keeps its owner alive
+struct exporter_t{
+    PyObject_HEAD
+    PyObject* owner;
+    void* data;
+    Py_ssize_t itemsize;
+    int readonly;
+    const char* format;
+    int ndim;
+    Py_ssize_t shape[2];
+    Py_ssize_t strides[2];
+};
+
+inline int exporter_getbuffer( PyObject* obj, Py_buffer* view, int flags ){
+    exporter_t* self = reinterpret_cast< exporter_t* >( obj );
+    if( ( flags & PyBUF_WRITABLE ) == PyBUF_WRITABLE && self->readonly ){
+        PyErr_SetString( PyExc_BufferError, "the buffer is read-only" );
+        view->obj = 0;
+        return -1;
+    }
+    Py_ssize_t len = self->itemsize;
+    for( int i = 0; i < self->ndim; ++i ){
+        len *= self->shape[i];
+    }
+    view->obj = obj;
+    Py_INCREF( obj );
+    view->buf = self->data;
+    view->len = len;
+    view->readonly = self->readonly;
+    view->itemsize = self->itemsize;
+    view->format = ( flags & PyBUF_FORMAT ) ? const_cast< char* >( self->format ) : 0;
+    view->ndim = self->ndim;
+    view->shape = ( flags & PyBUF_ND ) == PyBUF_ND ? self->shape : 0;
+    view->strides = ( flags & PyBUF_STRIDES ) == PyBUF_STRIDES ? self->strides : 0;
+    view->suboffsets = 0;
+    view->internal = 0;
+    return 0;
+}
+
+inline void exporter_dealloc( PyObject* obj ){
+    Py_XDECREF( reinterpret_cast< exporter_t* >( obj )->owner );
+    PyObject_Del( obj );
+}
+
+inline PyTypeObject* exporter_type(){
+    static PyBufferProcs buffer_procs;
+    static PyTypeObject type = { PyVarObject_HEAD_INIT( 0, 0 ) };
+    if( !type.tp_name ){
+        buffer_procs.bf_getbuffer = &exporter_getbuffer;
+        type.tp_name = "pyplusplus.buffer";
+        type.tp_basicsize = sizeof( exporter_t );
+        type.tp_flags = Py_TPFLAGS_DEFAULT;
+        type.tp_dealloc = &exporter_dealloc;
+        type.tp_as_buffer = &buffer_procs;
+        if( PyType_Ready( &type ) < 0 ){
+            boost::python::throw_error_already_set();
+        }
+    }
+    return &type;
+}
+
+inline boost::python::object
+make_memoryview( void* data, Py_ssize_t itemsize, const char* format, bool readonly
+                 , int ndim, const Py_ssize_t* shape, PyObject* owner )
+{
+    exporter_t* exporter = PyObject_New( exporter_t, exporter_type() );
+    if( !exporter ){
+        boost::python::throw_error_already_set();
+    }
+    Py_XINCREF( owner );
+    exporter->owner = owner;
+    exporter->data = data;
+    exporter->itemsize = itemsize;
+    exporter->readonly = readonly ? 1 : 0;
+    exporter->format = format;
+    exporter->ndim = ndim;
+    Py_ssize_t stride = itemsize;
+    for( int i = ndim - 1; 0 <= i; --i ){
+        exporter->shape[i] = shape[i];
+        exporter->strides[i] = stride;
+        stride *= shape[i];
+    }
+    boost::python::handle<> holder( reinterpret_cast< PyObject* >( exporter ) );
+    return boost::python::object( boost::python::handle<>( PyMemoryView_FromObject( holder.get() ) ) );
+}
+
+} //details
+
+//returns memoryview over "size" items, which starts at "data"
+//"owner" is kept alive, while the memoryview ( or buffer, created from it ) exists
+template< class T >
+boost::python::object
+make_memoryview( T* data, Py_ssize_t size, PyObject* owner ){
+    Py_ssize_t shape[1] = { size };
+    return details::make_memoryview( const_cast< void* >( static_cast< const void* >( data ) )
+                                     , sizeof( T ), format_t< T >::value(), false
+                                     , 1, shape, owner );
+}
+
+template< class T >
+boost::python::object
+make_memoryview( const T* data, Py_ssize_t size, PyObject* owner ){
+    Py_ssize_t shape[1] = { size };
+    return details::make_memoryview( const_cast< void* >( static_cast< const void* >( data ) )
+                                     , sizeof( T ), format_t< T >::value(), true
+                                     , 1, shape, owner );
+}
+
+//returns memoryview over "rows" x "columns" matrix, stored in C order
+template< class T >
+boost::python::object
+make_memoryview( T* data, Py_ssize_t rows, Py_ssize_t columns, PyObject* owner ){
+    Py_ssize_t shape[2] = { rows, columns };
+    return details::make_memoryview( const_cast< void* >( static_cast< const void* >( data ) )
+                                     , sizeof( T ), format_t< T >::value(), false
+                                     , 2, shape, owner );
+}
+
+template< class T >
+boost::python::object
+make_memoryview( const T* data, Py_ssize_t rows, Py_ssize_t columns, PyObject* owner ){
+    Py_ssize_t shape[2] = { rows, columns };
+    return details::make_memoryview( const_cast< void* >( static_cast< const void* >( data ) )
+                                     , sizeof( T ), format_t< T >::value(), true
+                                     , 2, shape, owner );
+}
+
+namespace details{
+
+inline void raise_error( PyObject* exception, const std::string& message ){
+    PyErr_SetString( exception, message.c_str() );
+    boost::python::throw_error_already_set();
+}
+
+//returns kind of the "struct" module format character: 'i' - signed integer,
+//'u' - unsigned integer, 'f' - floating point, '?' - bool, 'c' - char
+inline char format_kind( char format ){
+    switch( format ){
+        case 'b': case 'h': case 'i': case 'l': case 'q': case 'n':
+            return 'i';
+        case 'B': case 'H': case 'I': case 'L': case 'Q': case 'N':
+            return 'u';
+        case 'e': case 'f': case 'd': case 'g':
+            return 'f';
+        case '?':
+            return '?';
+        case 'c':
+            return 'c';
+        default:
+            return 0;
+    }
+}
+
+//returns true, if the buffer items could be used as T
+template< class T >
+bool is_compatible( const Py_buffer& view ){
+    if( view.itemsize != static_cast< Py_ssize_t >( sizeof( T ) ) ){
+        return false;
+    }
+    const char* format = view.format ? view.format : "B";
+    if( *format == '@' ){
+        ++format;
+    }
+    if( !*format || *( format + 1 ) ){
+        return false; //structured or multi-item format
+    }
+    char expected = format_kind( *format_t< T >::value() );
+    char actual = format_kind( *format );
+    if( !actual ){
+        return false;
+    }
+    if( expected == actual ){
+        return true;
+    }
+    //bytes like objects export "B" format, char arrays - "c"
+    return 1 == sizeof( T ) && ( 'c' == expected || 'c' == actual ) && '?' != expected && '?' != actual;
+}
+
+//owns the acquired buffer and releases it in the destructor, so the buffer
+//is released, even if the constructor of its owner throws
+class buffer_view_t{
+    public:
+    buffer_view_t()
+    : m_acquired( false )
+    {}
+
+    ~buffer_view_t(){
+        release();
+    }
+
+    //returns false and leaves the Python error set, if the buffer was not acquired
+    bool acquire( PyObject* obj, int flags ){
+        m_acquired = 0 == PyObject_GetBuffer( obj, &m_view, flags );
+        return m_acquired;
+    }
+
+    void release(){
+        if( m_acquired ){
+            PyBuffer_Release( &m_view );
+            m_acquired = false;
+        }
+    }
+
+    Py_buffer& get(){
+        return m_view;
+    }
+
+    private:
+    buffer_view_t( const buffer_view_t& );
+    buffer_view_t& operator=( const buffer_view_t& );
+
+    Py_buffer m_view;
+    bool m_acquired;
+};
+
+} //details
+
+//gives access to the memory of object, which supports buffer protocol
+//
+//If the object memory is C contiguous, the pointer to it is used directly.
+//Otherwise, if "allow_copy" is true, the memory is copied.
+//T should be const, if the function does not modify the memory. Otherwise
+//the object should export writable buffer.
+template< class T >
+class input_buffer_t{
+    public:
+    typedef typename boost::remove_const< T >::type value_type;
+
+    input_buffer_t( boost::python::object obj, bool allow_copy=false, Py_ssize_t expected_size=-1 )
+    : m_data( 0 )
+      , m_size( 0 )
+    {
+        int flags = PyBUF_FORMAT | PyBUF_C_CONTIGUOUS;
+        if( !boost::is_const< T >::value ){
+            flags |= PyBUF_WRITABLE;
+        }
+        if( m_view.acquire( obj.ptr(), flags ) ){
+            ensure_compatible();
+            m_data = static_cast< T* >( m_view.get().buf );
+            m_size = m_view.get().len / m_view.get().itemsize;
+        }
+        else if( allow_copy && boost::is_const< T >::value && PyObject_CheckBuffer( obj.ptr() ) ){
+            PyErr_Clear();
+            if( !m_view.acquire( obj.ptr(), PyBUF_FORMAT | PyBUF_STRIDES ) ){
+                boost::python::throw_error_already_set();
+            }
+            ensure_compatible();
+            m_size = m_view.get().len / m_view.get().itemsize;
+            m_copy.resize( m_size );
+            if( m_size && 0 != PyBuffer_ToContiguous( &m_copy[0], &m_view.get(), m_view.get().len, 'C' ) ){
+                boost::python::throw_error_already_set();
+            }
+            m_view.release();
+            m_data = m_size ? &m_copy[0] : 0;
+        }
+        else{
+            boost::python::throw_error_already_set();
+        }
+        if( 0 <= expected_size && m_size != expected_size ){
+            std::stringstream err;
+            err << "Expected buffer length is " << expected_size << ". "
+                << "Actual buffer length is " << m_size << ".";
+            details::raise_error( PyExc_ValueError, err.str() );
+        }
+    }
+
+    T* data() const {
+        return m_data;
+    }
+
+    Py_ssize_t size() const {
+        return m_size;
+    }
+
+    private:
+    input_buffer_t( const input_buffer_t& );
+    input_buffer_t& operator=( const input_buffer_t& );
+
+    void ensure_compatible(){
+        const Py_buffer& view = m_view.get();
+        if( !details::is_compatible< value_type >( view ) ){
+            std::stringstream err;
+            err << "Buffer items type( format \\"" << ( view.format ? view.format : "B" )
+                << "\\", size " << view.itemsize << " ) does not match the expected one"
+                << "( format \\"" << format_t< T >::value() << "\\", size " << sizeof( T ) << " ).";
+            details::raise_error( PyExc_TypeError, err.str() );
+        }
+    }
+
+    details::buffer_view_t m_view;
+    std::vector< value_type > m_copy;
+    T* m_data;
+    Py_ssize_t m_size;
+};
+
+//allocates memory for "rows" x "columns" items of T, which is owned by Python
+//bytearray object. The memory could be passed to C++ function as an output
+//argument and then returned to Python as memoryview, without copying.
+template< class T >
+class output_buffer_t{
+    public:
+    explicit output_buffer_t( Py_ssize_t rows, Py_ssize_t columns=-1 )
+    : m_rows( rows )
+      , m_columns( columns )
+    {
+        Py_ssize_t size = 0 <= columns ? rows * columns : rows;
+        m_storage = boost::python::object(
+            boost::python::handle<>( PyByteArray_FromStringAndSize( 0, size * sizeof( T ) ) ) );
+    }
+
+    T* data() const {
+        return reinterpret_cast< T* >( PyByteArray_AS_STRING( m_storage.ptr() ) );
+    }
+
+    boost::python::object memoryview() const {
+        if( 0 <= m_columns ){
+            return make_memoryview( data(), m_rows, m_columns, m_storage.ptr() );
+        }
+        else{
+            return make_memoryview( data(), m_rows, m_storage.ptr() );
+        }
+    }
+
+    private:
+    Py_ssize_t m_rows;
+    Py_ssize_t m_columns;
+    boost::python::object m_storage;
+};
+
+} /*buffers*/ } /*pyplusplus*/
+
+#endif//__buffers_pyplusplus_hpp__
+"""
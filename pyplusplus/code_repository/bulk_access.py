@@ -0,0 +1,366 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""
+This file contains C++ code, which adds bulk access methods to "std::vector"
+of fundamental types, exposed using indexing suite V2: buffer protocol export,
+"extend" from buffer and slice get/set, which copy memory, instead of
+converting every item.
+"""
+
+namespace = "pyplusplus::containers"
+
+file_name = "__bulk_access.pypp.hpp"
+
+code = \
+"""// Copyright 2004-2008 Roman Yakovenko.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#ifndef __bulk_access_pyplusplus_hpp__
+#define __bulk_access_pyplusplus_hpp__
+
+#include "boost/python.hpp"
+#include "__buffers.pypp.hpp"
+#include "indexing_suite/methods.hpp"
+#include <algorithm>
+#include <cstring>
+#include <map>
+#include <sstream>
+
+namespace pyplusplus{ namespace containers{
+
+namespace bpl = boost::python;
+
+namespace details{
+
+//holds Python object, which exports buffer of T items.
+//Function overloads, which take buffer_source_t< T >, are selected by
+//Boost.Python only for such objects, all other objects are handled by
+//indexing suite, item by item.
+template< class T >
+struct buffer_source_t{
+    explicit buffer_source_t( PyObject* obj )
+    : object( bpl::handle<>( bpl::borrowed( obj ) ) )
+    {}
+
+    bpl::object object;
+};
+
+template< class T >
+struct buffer_source_from_python{
+
+    buffer_source_from_python(){
+        bpl::converter::registry::push_back( &convertible
+                                             , &construct
+                                             , bpl::type_id< buffer_source_t< T > >() );
+    }
+
+    static void* convertible( PyObject* obj ){
+        if( !PyObject_CheckBuffer( obj ) ){
+            return 0;
+        }
+        Py_buffer view;
+        if( 0 != PyObject_GetBuffer( obj, &view, PyBUF_FORMAT | PyBUF_STRIDES ) ){
+            PyErr_Clear();
+            return 0;
+        }
+        bool compatible = pyplusplus::buffers::details::is_compatible< T >( view );
+        PyBuffer_Release( &view );
+        return compatible ? obj : 0;
+    }
+
+    static void construct( PyObject* obj, bpl::converter::rvalue_from_python_stage1_data* data ){
+        typedef bpl::converter::rvalue_from_python_storage< buffer_source_t< T > > storage_t;
+        void* storage = reinterpret_cast< storage_t* >( data )->storage.bytes;
+        new (storage) buffer_source_t< T >( obj );
+        data->convertible = storage;
+    }
+
+};
+
+//counts the buffers, exported by every container, which are not released yet
+template< class Container >
+struct exports_t{
+
+    typedef std::map< const Container*, Py_ssize_t > counts_t;
+
+    static counts_t& counts(){
+        static counts_t counts_;
+        return counts_;
+    }
+
+    static bool has_exports( const Container* container ){
+        return counts().find( container ) != counts().end();
+    }
+
+    static void add( const Container* container ){
+        ++counts()[ container ];
+    }
+
+    static void remove( const Container* container ){
+        typename counts_t::iterator i = counts().find( container );
+        if( i != counts().end() && 0 == --( i->second ) ){
+            counts().erase( i );
+        }
+    }
+
+};
+
+//Function overloads, which take exported_container_t< Container >, are selected
+//by Boost.Python only for the containers with exported buffers. They raise
+//BufferError, like "bytearray" does. All other containers are handled by the
+//next overload.
+template< class Container >
+struct exported_container_t{
+};
+
+template< class Container >
+struct exported_container_from_python{
+
+    exported_container_from_python(){
+        bpl::converter::registry::push_back( &convertible
+                                             , &construct
+                                             , bpl::type_id< exported_container_t< Container > >() );
+    }
+
+    static void* convertible( PyObject* obj ){
+        void* container = bpl::converter::get_lvalue_from_python(
+            obj, bpl::converter::registered< Container >::converters );
+        if( !container || !exports_t< Container >::has_exports( static_cast< Container* >( container ) ) ){
+            return 0;
+        }
+        return obj;
+    }
+
+    static void construct( PyObject*, bpl::converter::rvalue_from_python_stage1_data* data ){
+        typedef bpl::converter::rvalue_from_python_storage< exported_container_t< Container > > storage_t;
+        void* storage = reinterpret_cast< storage_t* >( data )->storage.bytes;
+        new (storage) exported_container_t< Container >();
+        data->convertible = storage;
+    }
+
+};
+
+inline void get_slice_indices( bpl::slice slice, Py_ssize_t size
+                               , Py_ssize_t& start, Py_ssize_t& stop, Py_ssize_t& step, Py_ssize_t& length )
+{
+#if PY_VERSION_HEX >= 0x03020000
+    PyObject* slice_obj = slice.ptr();
+#else
+    PySliceObject* slice_obj = reinterpret_cast< PySliceObject* >( slice.ptr() );
+#endif
+    if( 0 != PySlice_GetIndicesEx( slice_obj, size, &start, &stop, &step, &length ) ){
+        bpl::throw_error_already_set();
+    }
+}
+
+} //details
+
+//Boost.Python "def_visitor", which adds bulk access methods to the exposed
+//"std::vector< T >", where T is a fundamental type:
+//
+//  * buffer protocol - memoryview( vector ), numpy.asarray( vector ) do not
+//    copy the memory. While the buffer is exported, the methods, which could
+//    resize the vector( append, extend, insert, __delitem__ and slice
+//    assignment ), raise BufferError
+//  * extend( buffer ) - appends all buffer items at once
+//  * vector[ slice ] - returns new vector, the items are copied at once
+//  * vector[ slice ] = buffer - replaces the slice items at once
+//
+//The visitor should be applied after the indexing suite. MethodMask has the
+//same meaning as in the indexing suite: "extend", "__getitem__" and "__setitem__"
+//overloads are added only for the enabled methods.
+template< class Container, unsigned long MethodMask = bpl::indexing::all_methods >
+class vector_bulk_access_t : public bpl::def_visitor< vector_bulk_access_t< Container, MethodMask > >{
+    friend class bpl::def_visitor_access;
+
+public:
+
+    typedef typename Container::value_type value_type;
+    typedef details::buffer_source_t< value_type > source_type;
+    typedef details::exported_container_t< Container > exported_type;
+    typedef details::exports_t< Container > exports_type;
+    typedef pyplusplus::buffers::input_buffer_t< const value_type > input_buffer_type;
+
+private:
+
+    template< class Class >
+    void visit( Class& cl ) const {
+        static details::buffer_source_from_python< value_type > source_registration;
+        static details::exported_container_from_python< Container > exported_registration;
+        enable_buffer_protocol( reinterpret_cast< PyTypeObject* >( cl.ptr() ) );
+        if( MethodMask & bpl::indexing::method_extend ){
+            cl.def( "extend", &extend );
+        }
+        if( MethodMask & bpl::indexing::method_getitem_slice ){
+            cl.def( "__getitem__", &get_slice );
+        }
+        if( MethodMask & bpl::indexing::method_setitem_slice ){
+            cl.def( "__setitem__", &set_slice );
+        }
+        //Boost.Python tries the last defined overloads first
+        if( MethodMask & bpl::indexing::method_append ){
+            cl.def( "append", &raise_resize_error );
+        }
+        if( MethodMask & bpl::indexing::method_extend ){
+            cl.def( "extend", &raise_resize_error );
+        }
+        if( MethodMask & bpl::indexing::method_insert ){
+            cl.def( "insert", &raise_insert_error );
+        }
+        if( MethodMask & ( bpl::indexing::method_delitem | bpl::indexing::method_delitem_slice ) ){
+            cl.def( "__delitem__", &raise_resize_error );
+        }
+        if( MethodMask & bpl::indexing::method_setitem_slice ){
+            cl.def( "__setitem__", &raise_set_slice_error );
+        }
+    }
+
+    static void raise_resize_error( exported_type, bpl::object ){
+        pyplusplus::buffers::details::raise_error(
+            PyExc_BufferError, "Existing exports of data: object cannot be re-sized" );
+    }
+
+    static void raise_insert_error( exported_type, bpl::object, bpl::object ){
+        raise_resize_error( exported_type(), bpl::object() );
+    }
+
+    static void raise_set_slice_error( exported_type, bpl::slice, bpl::object ){
+        raise_resize_error( exported_type(), bpl::object() );
+    }
+
+    //the buffer is read-only, if "__setitem__" is not exposed
+    static bool is_read_only(){
+        return 0 == ( MethodMask & bpl::indexing::method_setitem );
+    }
+
+    static Container* extract_container( PyObject* obj ){
+        return static_cast< Container* >(
+            bpl::converter::get_lvalue_from_python( obj, bpl::converter::registered< Container >::converters ) );
+    }
+
+    static int get_buffer( PyObject* obj, Py_buffer* view, int flags ){
+        Container* container = extract_container( obj );
+        if( !container ){
+            PyErr_SetString( PyExc_BufferError, "unable to get access to the container" );
+            view->obj = 0;
+            return -1;
+        }
+        if( ( flags & PyBUF_WRITABLE ) == PyBUF_WRITABLE && is_read_only() ){
+            PyErr_SetString( PyExc_BufferError, "the container is read-only" );
+            view->obj = 0;
+            return -1;
+        }
+        //shape and strides
+        Py_ssize_t* dimensions = new Py_ssize_t[2];
+        dimensions[0] = static_cast< Py_ssize_t >( container->size() );
+        dimensions[1] = sizeof( value_type );
+        view->obj = obj;
+        Py_INCREF( obj );
+        view->buf = container->empty() ? 0 : &( *container )[0];
+        view->len = dimensions[0] * dimensions[1];
+        view->readonly = is_read_only() ? 1 : 0;
+        view->itemsize = sizeof( value_type );
+        view->format = ( flags & PyBUF_FORMAT ) ? const_cast< char* >( pyplusplus::buffers::format_t< value_type >::value() ) : 0;
+        view->ndim = 1;
+        view->shape = ( flags & PyBUF_ND ) == PyBUF_ND ? dimensions : 0;
+        view->strides = ( flags & PyBUF_STRIDES ) == PyBUF_STRIDES ? dimensions + 1 : 0;
+        view->suboffsets = 0;
+        view->internal = dimensions;
+        exports_type::add( container );
+        return 0;
+    }
+
+    static void release_buffer( PyObject* obj, Py_buffer* view ){
+        delete[] static_cast< Py_ssize_t* >( view->internal );
+        view->internal = 0;
+        Container* container = extract_container( obj );
+        if( container ){
+            exports_type::remove( container );
+        }
+    }
+
+    static void enable_buffer_protocol( PyTypeObject* type ){
+        static PyBufferProcs buffer_procs;
+        buffer_procs.bf_getbuffer = &get_buffer;
+        buffer_procs.bf_releasebuffer = &release_buffer;
+        type->tp_as_buffer = &buffer_procs;
+#if PY_MAJOR_VERSION < 3
+        type->tp_flags |= Py_TPFLAGS_HAVE_NEWBUFFER;
+#endif
+    }
+
+    //returns true, if the buffer memory belongs to the container
+    static bool is_aliased( const Container& container, const input_buffer_type& buffer ){
+        if( container.empty() || !buffer.size() ){
+            return false;
+        }
+        const value_type* begin = &container[0];
+        return buffer.data() < begin + container.size() && begin < buffer.data() + buffer.size();
+    }
+
+    static void extend( Container& container, source_type source ){
+        input_buffer_type buffer( source.object, true );
+        if( is_aliased( container, buffer ) ){
+            Container tmp( buffer.data(), buffer.data() + buffer.size() );
+            container.insert( container.end(), tmp.begin(), tmp.end() );
+        }
+        else{
+            container.insert( container.end(), buffer.data(), buffer.data() + buffer.size() );
+        }
+    }
+
+    static Container get_slice( Container& container, bpl::slice slice ){
+        Py_ssize_t start, stop, step, length;
+        details::get_slice_indices( slice, container.size(), start, stop, step, length );
+        if( 1 == step ){
+            return Container( container.begin() + start, container.begin() + start + length );
+        }
+        Container result;
+        result.reserve( length );
+        for( Py_ssize_t i = 0; i < length; ++i ){
+            result.push_back( container[ start + i * step ] );
+        }
+        return result;
+    }
+
+    static void set_slice( Container& container, bpl::slice slice, source_type source ){
+        Py_ssize_t start, stop, step, length;
+        details::get_slice_indices( slice, container.size(), start, stop, step, length );
+        input_buffer_type buffer( source.object, true );
+        if( 1 == step ){
+            if( buffer.size() == length ){
+                if( length ){
+                    std::memmove( &container[ start ], buffer.data(), length * sizeof( value_type ) );
+                }
+            }
+            else{
+                Container tmp( buffer.data(), buffer.data() + buffer.size() );
+                container.erase( container.begin() + start, container.begin() + start + length );
+                container.insert( container.begin() + start, tmp.begin(), tmp.end() );
+            }
+            return;
+        }
+        if( buffer.size() != length ){
+            std::stringstream err;
+            err << "attempt to assign sequence of size " << buffer.size()
+                << " to extended slice of size " << length;
+            pyplusplus::buffers::details::raise_error( PyExc_ValueError, err.str() );
+        }
+        Container tmp( buffer.data(), buffer.data() + buffer.size() );
+        for( Py_ssize_t i = 0; i < length; ++i ){
+            container[ start + i * step ] = tmp[ i ];
+        }
+    }
+
+};
+
+} /*containers*/ } /*pyplusplus*/
+
+#endif//__bulk_access_pyplusplus_hpp__
+
+"""
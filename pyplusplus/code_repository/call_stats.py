@@ -0,0 +1,164 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""
+This file contains C++ code, which counts calls of the exposed functions and
+the time spent on them, including the arguments and the result conversion.
+"""
+
+namespace = "pyplusplus::call_stats"
+
+file_name = "__call_stats.pypp.hpp"
+
+code = \
+"""// Copyright 2004-2008 Roman Yakovenko.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#ifndef __call_stats_pyplusplus_hpp__
+#define __call_stats_pyplusplus_hpp__
+
+#include "boost/python.hpp"
+#include <map>
+#include <string>
+#include <vector>
+#if __cplusplus >= 201103L
+    #include <chrono>
+#else
+    #include <ctime>
+#endif
+
+namespace pyplusplus{ namespace call_stats{
+
+namespace bpl = boost::python;
+
+inline double now(){
+#if __cplusplus >= 201103L
+    typedef std::chrono::steady_clock clock_t;
+    return std::chrono::duration< double >( clock_t::now().time_since_epoch() ).count();
+#else
+    return static_cast< double >( std::clock() ) / CLOCKS_PER_SEC;
+#endif
+}
+
+//statistics of the single exposed function
+class entry_t{
+public:
+    entry_t()
+    : m_calls( 0 )
+      , m_seconds( 0.0 )
+    {}
+
+    void start(){
+        ++m_calls;
+        if( m_started.size() > max_depth ){
+            //the calls, which raised an exception, never stop
+            m_started.clear();
+        }
+        m_started.push_back( now() );
+    }
+
+    void stop(){
+        if( !m_started.empty() ){
+            m_seconds += now() - m_started.back();
+            m_started.pop_back();
+        }
+    }
+
+    void reset(){
+        m_calls = 0;
+        m_seconds = 0.0;
+        m_started.clear();
+    }
+
+    unsigned long long calls() const { return m_calls; }
+    double seconds() const { return m_seconds; }
+
+private:
+    static const std::size_t max_depth = 256;
+
+    unsigned long long m_calls;
+    double m_seconds;
+    std::vector< double > m_started;
+};
+
+typedef std::map< std::string, entry_t > table_t;
+
+inline table_t& table(){
+    static table_t the_table;
+    return the_table;
+}
+
+//returns statistics entry of the function, "name" is the function key
+inline entry_t& entry( const char* name ){
+    return table()[ name ];
+}
+
+//Call policies, which update the function statistics entry. The time between
+//"precall" and "postcall" includes the arguments and the result conversion.
+template< class BasePolicies = bpl::default_call_policies >
+struct counting_policies : BasePolicies{
+
+    explicit counting_policies( entry_t& entry, BasePolicies const& base = BasePolicies() )
+    : BasePolicies( base )
+      , m_entry( &entry )
+    {}
+
+    template< class ArgumentPackage >
+    bool precall( ArgumentPackage const& args ) const{
+        if( !BasePolicies::precall( args ) ){
+            return false;
+        }
+        m_entry->start();
+        return true;
+    }
+
+    template< class ArgumentPackage >
+    PyObject* postcall( ArgumentPackage const& args, PyObject* result ) const{
+        m_entry->stop();
+        return BasePolicies::postcall( args, result );
+    }
+
+private:
+    entry_t* m_entry;
+};
+
+//returns the statistics table as dictionary:
+//  { "functions" : [ { "name" : ..., "calls" : ..., "seconds" : ... }, ... ] }
+//Functions, which were never called, are not reported.
+inline bpl::dict stats( bool reset=false ){
+    bpl::list functions;
+    table_t& the_table = table();
+    for( table_t::iterator i = the_table.begin(); i != the_table.end(); ++i ){
+        if( !i->second.calls() ){
+            continue;
+        }
+        bpl::dict item;
+        item[ "name" ] = i->first;
+        item[ "calls" ] = i->second.calls();
+        item[ "seconds" ] = i->second.seconds();
+        functions.append( item );
+        if( reset ){
+            i->second.reset();
+        }
+    }
+    bpl::dict result;
+    result[ "functions" ] = functions;
+    return result;
+}
+
+BOOST_PYTHON_FUNCTION_OVERLOADS( stats_overloads, stats, 0, 1 )
+
+//exposes "stats" function under the given name
+inline void register_stats( const char* name ){
+    bpl::def( name, &stats, stats_overloads( bpl::args( "reset" ) ) );
+}
+
+} /*call_stats*/ } /*pyplusplus*/
+
+#endif//__call_stats_pyplusplus_hpp__
+
+"""
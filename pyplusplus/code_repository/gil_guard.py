@@ -55,6 +55,32 @@ class gil_guard_t
     PyGILState_STATE m_gstate;
 };
 
+class gil_release_t
+{
+    public:
+    gil_release_t()
+     : m_thread_state( PyEval_SaveThread() )
+    {}
+
+    ~gil_release_t() {
+        restore();
+    }
+
+    void restore() {
+        if( m_thread_state )
+        {
+             PyEval_RestoreThread(m_thread_state);
+             m_thread_state = 0;
+        }
+    }
+
+    private:
+    gil_release_t( const gil_release_t& );
+    gil_release_t& operator=( const gil_release_t& );
+
+    PyThreadState* m_thread_state;
+};
+
 } /* threading */ } /* pyplusplus*/ 
 
 
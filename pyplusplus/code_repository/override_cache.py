@@ -0,0 +1,82 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""
+This file contains C++ code, which caches the result of the Python override
+lookup, so thread safe overrides do not take the GIL, if the virtual function
+is not overridden in Python.
+"""
+
+file_name = "__override_cache.pypp.hpp"
+
+code = \
+"""// Copyright 2004-2008 Roman Yakovenko.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#ifndef __override_cache_pyplusplus_hpp__
+#define __override_cache_pyplusplus_hpp__
+
+#include "boost/atomic.hpp"
+
+namespace pyplusplus{ namespace threading {
+
+//remembers, that the Python override of the virtual function does not exist,
+//so the C++ threads could call the C++ implementation without taking the GIL.
+//
+//may_exist() is called without the GIL, so the state is atomic. The state is
+//set under the GIL, after the override lookup. It is set to "absent" together
+//with the current generation. invalidate_all() starts new generation, so every
+//cache of the extension module looks the override up once again. Call it, after
+//Python overrides were added to the existing objects or their classes.
+class override_cache_t
+{
+    public:
+    override_cache_t()
+     : m_absent_generation( 0 )
+    {}
+
+    bool may_exist() const {
+        return m_absent_generation.load( boost::memory_order_acquire )
+               != generation().load( boost::memory_order_acquire );
+    }
+
+    void set( bool exists ) {
+        unsigned long absent_generation = 0;
+        if( !exists ){
+            absent_generation = generation().load( boost::memory_order_acquire );
+        }
+        m_absent_generation.store( absent_generation, boost::memory_order_release );
+    }
+
+    static void invalidate_all(){
+        generation().fetch_add( 1, boost::memory_order_acq_rel );
+    }
+
+    //the copy belongs to another Python object, so it looks the override up once again
+    override_cache_t( const override_cache_t& )
+     : m_absent_generation( 0 )
+    {}
+
+    override_cache_t& operator=( const override_cache_t& ){
+        return *this;
+    }
+
+    private:
+    //starts from 1, so 0 means that the override may exist
+    static boost::atomic< unsigned long >& generation(){
+        static boost::atomic< unsigned long > value( 1 );
+        return value;
+    }
+
+    boost::atomic< unsigned long > m_absent_generation;
+};
+
+} /* threading */ } /* pyplusplus*/
+
+
+#endif//__override_cache_pyplusplus_hpp__
+"""
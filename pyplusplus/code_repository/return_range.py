@@ -24,10 +24,13 @@ code = \
 
 #include "boost/python.hpp"
 #include "boost/mpl/int.hpp"
+#include "boost/mpl/bool.hpp"
 #include "boost/function.hpp"
 #include "indexing_suite/iterator_range.hpp"
 #include "boost/python/object/class_detail.hpp"
 #include "boost/type_traits/is_same.hpp"
+#include "boost/type_traits/is_const.hpp"
+#include "__buffers.pypp.hpp"
 namespace pyplusplus{ namespace call_policies{
 
 namespace bpl = boost::python;
@@ -73,6 +76,21 @@ struct return_raw_data_ref
     };
 };
 
+template< class TValueType >
+TValueType* extract_raw_data( PyObject* result ){
+#ifdef Py_CAPSULE_H
+    if( !PyCapsule_CheckExact( result ) ){
+        throw std::runtime_error( "Internal error: expected to get PyCapsule" );
+    }
+    return reinterpret_cast<TValueType*>( PyCapsule_GetPointer( result, "pypp._C_API_" ) );
+#else
+    if( !PyCObject_Check( result ) ){
+        throw std::runtime_error( "Internal error: expected to get PyCObject" );
+    }
+    return reinterpret_cast<TValueType*>( PyCObject_AsVoidPtr( result ) );
+#endif
+}
+
 } //detail
 
 template < typename TGetSize, typename TValueType, typename TValuePolicies=bpl::default_call_policies >
@@ -95,17 +113,7 @@ public:
         if( result == bpl::detail::none() ){
             return result;
         }
-#ifdef Py_CAPSULE_H
-        if( !PyCapsule_CheckExact( result ) ){
-            throw std::runtime_error( "Internal error: expected to get PyCapsule" );
-        }
-        value_type* raw_data = reinterpret_cast<value_type*>( PyCapsule_GetPointer( result, "pypp._C_API_" ) );
-#else
-        if( !PyCObject_Check( result ) ){
-            throw std::runtime_error( "Internal error: expected to get PyCObject" );
-        }
-        value_type* raw_data = reinterpret_cast<value_type*>( PyCObject_AsVoidPtr( result ) );
-#endif
+        value_type* raw_data = detail::extract_raw_data< value_type >( result );
         Py_DECREF(result);//we don't need result anymore
 
         bpl::tuple args_w( bpl::handle<>( bpl::borrowed( args ) ) );
@@ -150,6 +158,55 @@ private:
 
 };
 
+//returns memoryview over the range, instead of iterator_range class instance.
+//The memory is not copied. The argument with index TCustodian( 1 - "self" for
+//member functions ) is kept alive while the memoryview exists.
+//If TAsBytes is true, the range items are exposed as "raw" bytes: the memoryview
+//has shape ( size, sizeof( TValueType ) ).
+template < typename TGetSize, typename TValueType, int TCustodian=1, bool TAsBytes=false >
+struct return_range_buffer : bpl::default_call_policies{
+
+    typedef typename detail::return_raw_data_ref result_converter;
+
+    typedef TValueType value_type;
+    typedef TGetSize get_size_type;
+
+    template <class ArgumentPackage>
+    static PyObject* postcall(ArgumentPackage const& args, PyObject* result){
+        if( result == bpl::detail::none() ){
+            return result;
+        }
+        value_type* raw_data = detail::extract_raw_data< value_type >( result );
+        Py_DECREF(result);//we don't need result anymore
+
+        bpl::tuple args_w( bpl::handle<>( bpl::borrowed( args ) ) );
+
+        PyObject* custodian = 0;
+        if( 0 < TCustodian && TCustodian <= bpl::len( args_w ) ){
+            custodian = bpl::object( args_w[ TCustodian - 1 ] ).ptr();
+        }
+
+        get_size_type get_size;
+        bpl::object view = make_view( raw_data, get_size( args_w ), custodian, boost::mpl::bool_< TAsBytes >() );
+        return bpl::incref( view.ptr() );
+    }
+
+private:
+
+    static bpl::object make_view( value_type* raw_data, Py_ssize_t size, PyObject* custodian, boost::mpl::false_ ){
+        return pyplusplus::buffers::make_memoryview( raw_data, size, custodian );
+    }
+
+    static bpl::object make_view( value_type* raw_data, Py_ssize_t size, PyObject* custodian, boost::mpl::true_ ){
+        Py_ssize_t shape[2] = { size, static_cast< Py_ssize_t >( sizeof( value_type ) ) };
+        return pyplusplus::buffers::details::make_memoryview(
+                    const_cast< void* >( static_cast< const void* >( raw_data ) )
+                    , 1, "B", boost::is_const< value_type >::value
+                    , 2, shape, custodian );
+    }
+
+};
+
 } /*pyplusplus*/ } /*call_policies*/
 
 
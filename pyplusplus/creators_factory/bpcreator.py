@@ -15,11 +15,14 @@ from pygccxml import declarations
 from pyplusplus import decl_wrappers
 from pyplusplus import code_creators
 from pyplusplus import code_repository
+from pyplusplus import utils
 from pyplusplus import _logging_
 
 ACCESS_TYPES = declarations.ACCESS_TYPES
 VIRTUALITY_TYPES = declarations.VIRTUALITY_TYPES
 
+timer = utils.profiler.timer
+
 class bpcreator_t( declarations.decl_visitor_t ):
     """
     code creators factory for Boost.Python library
@@ -37,7 +40,11 @@ class bpcreator_t( declarations.decl_visitor_t ):
                   , call_policies_resolver_=None
                   , types_db=None
                   , target_configuration=None
-                  , enable_indexing_suite=True ):
+                  , enable_indexing_suite=True
+                  , profiler=None
+                  , order_overloads=False
+                  , calls_profile=None
+                  , count_calls=False ):
         """Constructor.
 
         :param decls: Declarations that should be exposed in the final module.
@@ -47,6 +54,10 @@ class bpcreator_t( declarations.decl_visitor_t ):
         :param types_db: ...todo...
         :param target_configuration: A target configuration object can be used to customize the generated source code to a particular compiler or a particular version of Boost.Python.
         :param already_exposed_dbs: list of files/directories other modules, this module depends on, generated their code too
+        :param profiler: :class:`utils.profiler_t` instance, which measures time of code creators tree construction
+        :param order_overloads: if True, overloaded functions are registered in the order, that makes Boost.Python to try the most specific and the most frequently called overload first
+        :param calls_profile: :class:`utils.call_profile_t` instance, which provides the number of calls of the exposed functions. It implies "order_overloads".
+        :param count_calls: if True, the generated code counts calls of the exposed functions and the time spent on them. The statistics is available via "__pypp_stats__" module function.
         :type decls: list of declaration_t
         :type module_name: str
         :type boost_python_ns_name: str
@@ -60,6 +71,13 @@ class bpcreator_t( declarations.decl_visitor_t ):
         self.decl_logger = _logging_.loggers.declarations
 
         self.__enable_indexing_suite = enable_indexing_suite
+        self.__count_calls = count_calls
+        self.__calldef_organizer = None
+        if order_overloads or calls_profile:
+            self.__calldef_organizer = sort_algorithms.calldef_organizer_t( calls_profile )
+        self.__profiler = profiler
+        if not self.__profiler:
+            self.__profiler = utils.dummy_profiler_t()
         self.__target_configuration = target_configuration
         if not self.__target_configuration:
             self.__target_configuration = code_creators.target_configuration_t()
@@ -88,8 +106,10 @@ class bpcreator_t( declarations.decl_visitor_t ):
         self.__opaque_types_manager = opaque_types_manager.manager_t( self.__extmodule )
         self.__dependencies_manager = dependencies_manager.manager_t(self.decl_logger)
 
-        prepared_decls = self._prepare_decls( decls )
-        self.__decls = sort_algorithms.sort( prepared_decls )
+        with self.__profiler.phase( 'preparing declarations' ):
+            prepared_decls = self._prepare_decls( decls )
+        with self.__profiler.phase( 'sorting declarations' ):
+            self.__decls = self._sort_decls( prepared_decls )
 
         self.curr_code_creator = self.__module_body
         self.curr_decl = None
@@ -112,6 +132,9 @@ class bpcreator_t( declarations.decl_visitor_t ):
         for msg in readme:
             self.decl_logger.warning( "%s;%s" % ( declaration, msg ) )
 
+    def _sort_decls( self, decls ):
+        return sort_algorithms.sort( decls, self.__calldef_organizer )
+
     def _prepare_decls( self, decls ):
         to_be_exposed = []
         for declaration in declarations.make_flatten( decls ):
@@ -171,8 +194,7 @@ class bpcreator_t( declarations.decl_visitor_t ):
                 assert not "Found %d class code creators" % len(creator)
         find = code_creators.creator_finder.find_by_declaration
         if operator.target_class and operator.target_class.ignore == False:
-            found = find( lambda declaration: operator.target_class is declaration
-                          , self.__extmodule.body.creators )
+            found = find( operator.target_class, self.__extmodule.body.creators )
             adopt_operator_impl( operator, found )
 
     def _is_registered_smart_pointer_creator( self, creator, db ):
@@ -293,7 +315,10 @@ class bpcreator_t( declarations.decl_visitor_t ):
                         created_value_traits.add( value_cls )
                         element_type_cc = code_creators.value_traits_t( value_cls )
                         self.__extmodule.adopt_declaration_creator( element_type_cc )
-                cls_creator.adopt_creator( code_creators.indexing_suite2_t(cls) )
+                read_only = cls.indexing_suite.read_only
+                if None is read_only:
+                    read_only = cls in self.__types_db.read_only_containers
+                cls_creator.adopt_creator( code_creators.indexing_suite2_t(cls, read_only) )
 
             scfo = self.__std_containers_free_operators
             if cls in scfo:
@@ -304,6 +329,12 @@ class bpcreator_t( declarations.decl_visitor_t ):
         creators.reverse()
         self.__module_body.adopt_creators( creators, 0 )
 
+    def _treat_call_stats( self ):
+        for creator in code_creators.make_flatten_generator( self.__extmodule ):
+            if isinstance( creator, code_creators.calldef_t ):
+                creator.count_calls = True
+        self.__module_body.adopt_creator( code_creators.call_stats_registration_t() )
+
     def create(self, decl_headers=None):
         """
         create and return the module for the extension - code creators tree root.
@@ -313,31 +344,42 @@ class bpcreator_t( declarations.decl_visitor_t ):
         :rtype: :class:`code_creators.module_t`
         """
         # Invoke the appropriate visit_*() method on all decls
-        for declaration in self.__decls:
-            self.curr_decl = declaration
-            declarations.apply_visitor( self, declaration )
-        for operator in self.__free_operators:
-            self._adopt_free_operator( operator )
-        self._treat_smart_pointers()
+        with self.__profiler.phase( 'visiting declarations' ):
+            for declaration in self.__decls:
+                self.curr_decl = declaration
+                start_time = timer()
+                declarations.apply_visitor( self, declaration )
+                self.__profiler.add_declaration_time( declaration, timer() - start_time )
+        with self.__profiler.phase( 'free operators' ):
+            for operator in self.__free_operators:
+                self._adopt_free_operator( operator )
+        with self.__profiler.phase( 'smart pointers' ):
+            self._treat_smart_pointers()
         if self.__enable_indexing_suite:
-            self._treat_indexing_suite()
+            with self.__profiler.phase( 'indexing suite' ):
+                self._treat_indexing_suite()
+        if self.__count_calls:
+            self._treat_call_stats()
         for creator in code_creators.make_flatten_generator( self.__extmodule ):
             creator.target_configuration = self.__target_configuration
         #last action.
-        self._append_user_code()
-
-        add_include = self.__extmodule.add_include
-        #add system headers
-        system_headers = self.__extmodule.get_system_files( recursive=True, unique=True, language='c++' )
-        for header in system_headers:
-            add_include( header, user_defined=False, system=True )
-        #add user defined header files
-        if decl_headers is None:
-            decl_headers = declarations.declaration_files( self.__decls )
-        for header in decl_headers:
-            add_include( header, user_defined=False, system=False )
-
-        self.__dependencies_manager.inform_user()
+        with self.__profiler.phase( 'user code' ):
+            self._append_user_code()
+
+        with self.__profiler.phase( 'headers' ):
+            add_include = self.__extmodule.add_include
+            #add system headers
+            system_headers = self.__extmodule.get_system_files( recursive=True, unique=True, language='c++' )
+            for header in system_headers:
+                add_include( header, user_defined=False, system=True )
+            #add user defined header files
+            if decl_headers is None:
+                decl_headers = declarations.declaration_files( self.__decls )
+            for header in decl_headers:
+                add_include( header, user_defined=False, system=False )
+
+        with self.__profiler.phase( 'dependencies report' ):
+            self.__dependencies_manager.inform_user()
 
         return self.__extmodule
 
@@ -365,6 +407,9 @@ class bpcreator_t( declarations.decl_visitor_t ):
                 else:
                     self.__extmodule.adopt_declaration_creator( fwrapper )
                     self.curr_code_creator.associated_decl_creators.append(fwrapper)
+            elif fwrapper_cls is code_creators.release_gil_wrapper_t:
+                self.__extmodule.adopt_declaration_creator( fwrapper )
+                self.curr_code_creator.associated_decl_creators.append(fwrapper)
             else:
                 class_wrapper = self.curr_code_creator.wrapper
                 class_wrapper.adopt_creator( fwrapper )
@@ -499,6 +544,11 @@ class bpcreator_t( declarations.decl_visitor_t ):
                 self.__extmodule.adopt_declaration_creator( wrapper )
                 maker = code_creators.free_fun_transformed_t( self.curr_decl, wrapper )
                 maker.associated_decl_creators.append( wrapper )
+            elif self.curr_decl.does_release_gil():
+                wrapper = code_creators.release_gil_wrapper_t( self.curr_decl )
+                self.__extmodule.adopt_declaration_creator( wrapper )
+                maker = code_creators.free_function_t( function=self.curr_decl, wrapper=wrapper )
+                maker.associated_decl_creators.append( wrapper )
             else:
                 maker = code_creators.free_function_t( function=self.curr_decl )
             self.curr_code_creator.adopt_creator( maker )
@@ -562,7 +612,7 @@ class bpcreator_t( declarations.decl_visitor_t ):
         self.__dependencies_manager.add_exported( self.curr_decl )
         cls_decl = self.curr_decl
         cls_parent_cc = self.curr_code_creator
-        exportable_members = self.curr_decl.get_exportable_members(sort_algorithms.sort)
+        exportable_members = self.curr_decl.get_exportable_members(self._sort_decls)
 
         wrapper = None
         cls_cc = None
@@ -691,7 +741,8 @@ class bpcreator_t( declarations.decl_visitor_t ):
         if not self.curr_decl.expose_value:
             return
 
-        if declarations.is_array( self.curr_decl.decl_type ):
+        if declarations.is_array( self.curr_decl.decl_type ) \
+           and not self.curr_decl.does_expose_as_buffer():
             if self._register_array_1( self.curr_decl.decl_type ):
                 array_1_registrator = code_creators.array_1_registrator_t( array_type=self.curr_decl.decl_type )
                 self.curr_code_creator.adopt_creator( array_1_registrator )
@@ -712,6 +763,9 @@ class bpcreator_t( declarations.decl_visitor_t ):
             if self.curr_decl.bits != None:
                 wrapper = code_creators.bit_field_wrapper_t( variable=self.curr_decl )
                 maker = code_creators.bit_field_t( variable=self.curr_decl, wrapper=wrapper )
+            elif self.curr_decl.does_expose_as_buffer():
+                wrapper = code_creators.array_mv_buffer_wrapper_t( variable=self.curr_decl )
+                maker = code_creators.array_mv_buffer_t( variable=self.curr_decl, wrapper=wrapper )
             elif declarations.is_array( self.curr_decl.decl_type ):
                 wrapper = code_creators.array_mv_wrapper_t( variable=self.curr_decl )
                 maker = code_creators.array_mv_t( variable=self.curr_decl, wrapper=wrapper )
@@ -29,6 +29,8 @@ def find_out_mem_fun_creator_classes( declaration ):
                 fwrapper_cls = code_creators.mem_fun_transformed_wrapper_t
             else:
                 maker_cls = code_creators.mem_fun_t
+                if declaration.does_release_gil():
+                    fwrapper_cls = code_creators.release_gil_wrapper_t
         elif declaration.virtuality == VIRTUALITY_TYPES.PURE_VIRTUAL:
             if declaration.transformations:
                 maker_cls = code_creators.mem_fun_v_transformed_t
@@ -4,6 +4,8 @@
 # http://www.boost.org/LICENSE_1_0.txt)
 
 from pygccxml import declarations
+from pyplusplus import messages
+from pyplusplus import _logging_
 from pyplusplus import decl_wrappers
 
 class COLOR:
@@ -12,111 +14,151 @@ class COLOR:
     BLACK = 2
 
 class class_organizer_t(object):
+    """
+    sorts classes, so every class comes after all classes it depends on
+
+    The dependencies graph is built in a single pass over the class members,
+    while the topological sort is iterative, so the algorithm is O(V+E) and
+    it is not limited by Python recursion limit. Dependency cycles are
+    available via :attr:`cycles` property.
+    """
     def __init__( self, decls, include_vars=False):
         object.__init__( self )
 
         self.__include_vars = include_vars
         self.__classes = [x for x in decls if isinstance( x, declarations.class_t )]
         self.__classes.sort( key = lambda cls: cls.decl_string )
+        self.__top_class_inst = {} #id( declaration ) : top class instance
         self.__dependencies_graph = self._build_graph()
-        self.__time = 0
-        self.__colors = dict( list(zip( list(self.__dependencies_graph.keys())
-                              , [ COLOR.WHITE ] * len( self.__dependencies_graph ) )) )
-        self.__class_discovered = dict( list(zip( list(self.__dependencies_graph.keys())
-                                        , [ 0 ] * len( self.__dependencies_graph ) )) )
-        self.__class_treated = dict( list(zip( list(self.__dependencies_graph.keys())
-                                     , [ 0 ] * len( self.__dependencies_graph ) )) )
-
+        self.__cycles = []
         self.__desired_order = []
 
         self._topological_sort()
 
+    @property
+    def cycles( self ):
+        """list of dependency cycles, every cycle is a list of class full names"""
+        return self.__cycles
+
     def _build_graph(self):
         full_name = declarations.full_name
         graph = {} #
         for class_ in self.__classes:
             assert isinstance( class_, declarations.class_t )
             fname = full_name( class_ )
-            graph[ fname ] = self.__find_out_class_dependencies( class_ )
+            dependencies = self.__find_out_class_dependencies( class_ )
+            dependencies.discard( fname ) #class could use itself or its internal declarations
+            graph[ fname ] = sorted( dependencies )
         return graph
 
     def __find_out_class_dependencies( self, class_ ):
+        #class depends on the dependencies of its members and internal classes,
+        #every declaration is visited only once
+        i_depend_on_them = set()
+        to_be_visited = [ class_ ]
+        while to_be_visited:
+            curr_class = to_be_visited.pop()
+            self.__find_out_members_dependencies( curr_class, i_depend_on_them )
+            for declaration in curr_class.declarations:
+                if isinstance( declaration, declarations.class_t ):
+                    to_be_visited.append( declaration )
+        return i_depend_on_them
+
+    def __find_out_members_dependencies( self, class_, i_depend_on_them ):
         full_name = declarations.full_name
         #class depends on it's base classes
-        i_depend_on_them = set( [ full_name( base.related_class ) for base in class_.bases ] )
+        i_depend_on_them.update( [ full_name( base.related_class ) for base in class_.bases ] )
         #class depends on all classes that used in function as argument
         # types and those arguments have default value
-        calldefs = [declaration for declaration in declarations.make_flatten( class_ ) if isinstance( declaration, declarations.calldef_t )]
-        for calldef in calldefs:
-            for arg in calldef.arguments:
-                if declarations.is_enum( arg.decl_type ):
-                    top_class_inst = self.__get_top_class_inst( declarations.enum_declaration( arg.decl_type ) )
-                    if top_class_inst:
-                        i_depend_on_them.add( full_name( top_class_inst ) )
-                    continue
-                if not arg.default_value:
-                    continue
-                if declarations.is_pointer( arg.decl_type ) and arg.default_value == 0:
-                    continue
-                base_type = declarations.base_type( arg.decl_type )
-                if not isinstance( base_type, declarations.declarated_t ):
+        for declaration in class_.declarations:
+            if isinstance( declaration, declarations.calldef_t ):
+                for arg in declaration.arguments:
+                    self.__find_out_argument_dependencies( arg, i_depend_on_them )
+            elif self.__include_vars and isinstance( declaration, declarations.variable_t ):
+                if declarations.is_pointer( declaration.decl_type ):
                     continue
-                top_class_inst = self.__get_top_class_inst( base_type.declaration )
-                if top_class_inst:
-                    i_depend_on_them.add( full_name( top_class_inst ) )
-
-        if self.__include_vars:
-            vars = [declaration for declaration in declarations.make_flatten( class_ ) if isinstance( declaration, declarations.variable_t )]
-            for var in vars:
-                if declarations.is_pointer( var.decl_type ):
-                    continue
-                base_type = declarations.base_type( var.decl_type )
+                base_type = declarations.base_type( declaration.decl_type )
                 if not isinstance( base_type, declarations.declarated_t ):
                     continue
                 top_class_inst = self.__get_top_class_inst( base_type.declaration )
                 if top_class_inst:
                     i_depend_on_them.add( full_name( top_class_inst ) )
 
-        for internal_cls in class_.classes(allow_empty=True):
-            internal_cls_dependencies = self.__find_out_class_dependencies( internal_cls )
-            i_depend_on_them.update( internal_cls_dependencies )
-
-        i_depend_on_them = list( i_depend_on_them )
-        i_depend_on_them.sort()
-        return i_depend_on_them
+    def __find_out_argument_dependencies( self, arg, i_depend_on_them ):
+        full_name = declarations.full_name
+        if declarations.is_enum( arg.decl_type ):
+            top_class_inst = self.__get_top_class_inst( declarations.enum_declaration( arg.decl_type ) )
+            if top_class_inst:
+                i_depend_on_them.add( full_name( top_class_inst ) )
+            return
+        if not arg.default_value:
+            return
+        if declarations.is_pointer( arg.decl_type ) and arg.default_value == 0:
+            return
+        base_type = declarations.base_type( arg.decl_type )
+        if not isinstance( base_type, declarations.declarated_t ):
+            return
+        top_class_inst = self.__get_top_class_inst( base_type.declaration )
+        if top_class_inst:
+            i_depend_on_them.add( full_name( top_class_inst ) )
 
     def __get_top_class_inst( self, declaration ):
-        curr = declaration
-        while isinstance( curr.parent, declarations.class_t ):
-            curr = curr.parent
-        if isinstance( curr, declarations.class_t ):
-            return curr
+        key = id( declaration )
+        if key not in self.__top_class_inst:
+            curr = declaration
+            while isinstance( curr.parent, declarations.class_t ):
+                curr = curr.parent
+            if not isinstance( curr, declarations.class_t ):
+                curr = None
+            self.__top_class_inst[ key ] = curr
+        return self.__top_class_inst[ key ]
 
     def _topological_sort(self):
         self._dfs()
 
     def _dfs( self ):
+        colors = dict( [ ( class_, COLOR.WHITE ) for class_ in self.__dependencies_graph ] )
         for class_ in sorted( self.__dependencies_graph.keys() ):
-            if self.__colors[class_] == COLOR.WHITE:
-                self._dfs_visit(class_)
-
-    def _dfs_visit(self, base):
-        self.__colors[base] = COLOR.GRAY
-        self.__time += 1
-        self.__class_discovered[base] = self.__time
-        for derived in self.__dependencies_graph[base]:
-            if derived in self.__colors and self.__colors[derived] == COLOR.WHITE:
-                self._dfs_visit( derived )
-            else:
-                pass
-                #there is usecase where base class defined within some class
-                #but his derives defined out of the class. right now `Py++`
-                #doesn't supports this situation.
-
-        self.__colors[base] = COLOR.BLACK
-        self.__time += 1
-        self.__class_treated = self.__time
-        self.__desired_order.append(base)
+            if colors[class_] != COLOR.WHITE:
+                continue
+            #iterative version of depth first search, every stack item contains
+            #the class and the index of the next dependency to be visited
+            colors[class_] = COLOR.GRAY
+            stack = [ [ class_, 0 ] ]
+            while stack:
+                item = stack[-1]
+                base, index = item
+                dependencies = self.__dependencies_graph[base]
+                if index < len( dependencies ):
+                    item[1] = index + 1
+                    dependency = dependencies[index]
+                    if dependency not in colors:
+                        #there is usecase where base class defined within some class
+                        #but his derives defined out of the class. right now `Py++`
+                        #doesn't supports this situation.
+                        continue
+                    if colors[dependency] == COLOR.WHITE:
+                        colors[dependency] = COLOR.GRAY
+                        stack.append( [ dependency, 0 ] )
+                    elif colors[dependency] == COLOR.GRAY:
+                        path = [ stack_item[0] for stack_item in stack ]
+                        self.__cycles.append( path[ path.index( dependency ): ] )
+                else:
+                    colors[base] = COLOR.BLACK
+                    self.__desired_order.append(base)
+                    stack.pop()
+
+    def report_cycles( self ):
+        """reports found dependency cycles, using :mod:`messages` subsystem"""
+        full_name = declarations.full_name
+        fname2inst = dict( [ ( full_name( class_inst ), class_inst ) for class_inst in self.__classes ] )
+        logger = _logging_.loggers.declarations
+        for cycle in self.__cycles:
+            class_inst = fname2inst[ cycle[0] ]
+            msg = messages.W1066 % ' -> '.join( cycle + cycle[:1] )
+            disabled_messages = getattr( class_inst, 'disabled_messages', None )
+            if messages.filter_disabled_msgs( [msg], disabled_messages ):
+                logger.warning( "%s;%s" % ( class_inst, msg ) )
 
     def desired_order(self):
         full_name = declarations.full_name
@@ -129,6 +171,9 @@ class class_organizer_t(object):
         return answer
 
 
+def _cmp( x, y ):
+    return ( x > y ) - ( x < y )
+
 def cmp_to_key(mycmp):
     """Convert a cmp= function into a key= function"""
     class K(object):
@@ -153,27 +198,50 @@ class calldef_organizer_t( object ):
     #Take a look on this post:
     #  http://mail.python.org/pipermail/c++-sig/2006-October/011463.html
 
-    #calldef_organizer_t will take into account only required arguments.
-    #Next rules are implemented:
-    #1. calldef( bool ) will be the last registered function
+    #Boost.Python tries overloads in reverse registration order: the last
+    #registered overload is tried first. calldef_organizer_t will take into
+    #account only required arguments. Next rules are implemented:
+    #1. calldef( bool ) will be the last registered function, calldef( int )
+    #   will come after calldef( double )
     #2. T* will come after T ( const T& )
-    def __init__( self ):
+    #3. calldef( derived ) will come after calldef( base )
+    #4. if calls profile is available, the frequently called overloads are
+    #   registered after the rarely called ones. The overloads, which could be
+    #   called with the same Python arguments, are not reordered: the rules 1-3
+    #   or the declaration order define the function, Boost.Python will call
+    def __init__( self, calls_profile=None ):
+        """
+        :param calls_profile: :class:`utils.call_profile_t` instance or None
+        """
         object.__init__( self )
+        self.calls_profile = calls_profile
         #preserve order in which functions where defined
-        self.cmp_calldefs_fallback = lambda d1, d2: cmp( d1.location.line, d2.location.line )
+        self.cmp_calldefs_fallback \
+            = lambda d1, d2: _cmp( self.__get_line( d1 ), self.__get_line( d2 ) )
+
+    @staticmethod
+    def __get_line( decl ):
+        if decl.location:
+            return decl.location.line
+        return 0
+
+    def estimated_calls( self, decl ):
+        """returns number of calls of the function, found in the calls profile"""
+        if not self.calls_profile:
+            return 0
+        return self.calls_profile.calls( decl )
 
     def build_groups( self, decls ):
         groups = { None: [] }
         decl2order = {}
         for index,d in enumerate( decls ):
             decl2order[d] = index
-            if not isinstance( d, declarations.calldef_t ) or 0 == len( d.required_args ):
+            if not isinstance( d, declarations.calldef_t ):
                 groups[ None ].append( d )
             else:
-                key = ( d.name, len( d.required_args ) )
-                if key not in groups:
-                    groups[ key ] = []
-                groups[key].append( d )
+                if d.name not in groups:
+                    groups[ d.name ] = []
+                groups[ d.name ].append( d )
         #keep backward compatibility
         to_be_deleted = []
         for group, group_decls in groups.items():
@@ -187,28 +255,172 @@ class calldef_organizer_t( object ):
         groups[ None ].sort( key=lambda d: decl2order[d] )
         return groups
 
+    @staticmethod
+    def __arithmetic_rank( type_ ):
+        #the overload with the greater rank is more specific: Python bool could
+        #be converted to int and double, Python int - to double
+        if declarations.is_bool( type_ ):
+            return 2
+        elif declarations.is_integral( type_ ):
+            return 1
+        else:
+            return 0
+
+    @staticmethod
+    def __remove_qualifiers( type_ ):
+        return declarations.remove_cv( declarations.remove_reference( declarations.remove_alias( type_ ) ) )
+
     def cmp_args_types( self, t1, t2 ):
-        return decl_wrappers.algorithm.registration_order.is_related( t1, t2 )
+        result = decl_wrappers.algorithm.registration_order.is_related( t1, t2 )
+        if None is not result:
+            return result
+        t1 = self.__remove_qualifiers( t1 )
+        t2 = self.__remove_qualifiers( t2 )
+        if self.__python_kind( t1 ) == self.__python_kind( t2 ) == 'number':
+            return _cmp( self.__arithmetic_rank( t1 ), self.__arithmetic_rank( t2 ) ) or None
+        if declarations.is_pointer( t1 ) and declarations.is_pointer( t2 ):
+            t1 = self.__remove_qualifiers( declarations.remove_pointer( t1 ) )
+            t2 = self.__remove_qualifiers( declarations.remove_pointer( t2 ) )
+        if declarations.is_class( t1 ) and declarations.is_class( t2 ):
+            c1 = declarations.class_traits.get_declaration( t1 )
+            c2 = declarations.class_traits.get_declaration( t2 )
+            if declarations.is_base_and_derived( c2, c1 ):
+                return 1
+            elif declarations.is_base_and_derived( c1, c2 ):
+                return -1
+        return None
 
     def cmp_calldefs( self, f1, f2 ):
-        result = self.cmp_args_types( f1.required_args[-1].decl_type, f2.required_args[-1].decl_type )
-        if None is result:
-            result = self.cmp_calldefs_fallback( f1, f2 )
-        return result
+        """
+        returns -1, if f1 should be registered before f2, 1 if f2 should be
+        registered before f1 and None if the order does not matter
+        """
+        if not f1.required_args or len( f1.required_args ) != len( f2.required_args ):
+            return None
+        results = set()
+        for arg1, arg2 in zip( f1.required_args, f2.required_args ):
+            result = self.cmp_args_types( arg1.decl_type, arg2.decl_type )
+            if None is not result:
+                results.add( result )
+        if 1 == len( results ):
+            return results.pop()
+        return None
+
+    def __has_implicit_conversion( self, class_ ):
+        for constructor in class_.constructors( recursive=False, allow_empty=True ):
+            if not constructor.allow_implicit_conversion:
+                continue
+            arg_type = self.__remove_qualifiers( constructor.arguments[0].decl_type )
+            if declarations.is_class( arg_type ) \
+               and declarations.class_traits.get_declaration( arg_type ) is class_:
+                continue #copy or move constructor
+            return True
+        return False
+
+    def __python_kind( self, type_ ):
+        """
+        returns "number", "string" or class declaration - the kind of Python
+        objects, the argument of type_ could be converted from, or None if it
+        is not known
+        """
+        type_ = self.__remove_qualifiers( type_ )
+        if declarations.is_pointer( type_ ):
+            pointee = self.__remove_qualifiers( declarations.remove_pointer( type_ ) )
+            if declarations.is_same( pointee, declarations.char_t() ) \
+               or declarations.is_same( pointee, declarations.wchar_t() ):
+                return 'string'
+            elif declarations.is_class( pointee ):
+                type_ = pointee
+            else:
+                return None
+        if declarations.is_std_string( type_ ) or declarations.is_std_wstring( type_ ) \
+           or declarations.is_same( type_, declarations.char_t() ) \
+           or declarations.is_same( type_, declarations.wchar_t() ):
+            return 'string'
+        elif declarations.is_arithmetic( type_ ) or declarations.is_enum( type_ ):
+            return 'number'
+        elif declarations.is_class( type_ ):
+            return declarations.class_traits.get_declaration( type_ )
+        else:
+            return None
+
+    def may_convert_from_same_object( self, t1, t2 ):
+        """returns False, if there is no Python object, which could be converted to both types"""
+        k1 = self.__python_kind( t1 )
+        k2 = self.__python_kind( t2 )
+        if None is k1 or None is k2 or k1 == k2:
+            return True
+        classes = [ k for k in ( k1, k2 ) if isinstance( k, declarations.class_t ) ]
+        if [ c for c in classes if self.__has_implicit_conversion( c ) ]:
+            return True
+        if 2 == len( classes ):
+            return declarations.is_base_and_derived( k1, k2 ) \
+                   or declarations.is_base_and_derived( k2, k1 )
+        return False
+
+    def may_accept_same_arguments( self, f1, f2 ):
+        """returns False, if Boost.Python will never try both functions with the same arguments"""
+        args_count = max( len( f1.required_args ), len( f2.required_args ) )
+        if min( len( f1.arguments ), len( f2.arguments ) ) < args_count:
+            return False
+        for arg1, arg2 in zip( f1.arguments[:args_count], f2.arguments[:args_count] ):
+            if not self.may_convert_from_same_object( arg1.decl_type, arg2.decl_type ):
+                return False
+        return True
+
+    def sort_group( self, group_decls ):
+        #function -> functions, which should be registered before it
+        required_before = dict( [ ( f, set() ) for f in group_decls ] )
+        #function -> functions, which keep the declaration order with it
+        declared_before = dict( [ ( f, set() ) for f in group_decls ] )
+        for index, f1 in enumerate( group_decls ):
+            for f2 in group_decls[ index + 1: ]:
+                order = self.cmp_calldefs( f1, f2 )
+                before = required_before
+                if None is order:
+                    if not self.may_accept_same_arguments( f1, f2 ):
+                        continue
+                    #the order defines the function, Boost.Python will call,
+                    #so the calls profile should not change it
+                    order = self.cmp_calldefs_fallback( f1, f2 )
+                    before = declared_before
+                if -1 == order:
+                    before[ f2 ].add( f1 )
+                elif 1 == order:
+                    before[ f1 ].add( f2 )
+
+        remaining = sorted( group_decls
+                            , key=cmp_to_key( lambda f1, f2: _cmp( self.estimated_calls( f1 ), self.estimated_calls( f2 ) )
+                                                             or self.cmp_calldefs_fallback( f1, f2 ) ) )
+        ordered = []
+        #the declaration order could contradict the rules, in this case it is ignored
+        get_constraints = [ lambda f: required_before[ f ] | declared_before[ f ]
+                            , lambda f: required_before[ f ]
+                            , lambda f: set() ]
+        while remaining:
+            registered = set( ordered )
+            for constraints in get_constraints:
+                ready = [ f for f in remaining if constraints( f ).issubset( registered ) ]
+                if ready:
+                    break
+            ordered.append( ready[0] )
+            remaining.remove( ready[0] )
+        return ordered
 
     def sort_groups( self, groups ):
         for group in list(groups.keys()):
             if None is group:
                 continue
-            groups[ group ].sort( key=cmp_to_key(self.cmp_calldefs) )
+            groups[ group ] = self.sort_group( groups[ group ] )
 
     def join_groups( self, groups ):
-        decls = []
+        decls = list( groups[ None ] )
         keys = set(groups.keys())
-        if None in keys:
-            keys.remove(None)
+        keys.remove(None)
         for group in sorted(keys):
             decls.extend( groups[group] )
+        #overloads are kept together and in the desired order
+        decls.sort( key=lambda d: d.name )
         return decls
 
     def sort( self, decls ):
@@ -219,16 +431,26 @@ class calldef_organizer_t( object ):
 
 def sort_classes( classes, include_vars=False ):
     organizer = class_organizer_t( classes, include_vars=include_vars )
+    organizer.report_cycles()
     return organizer.desired_order()
 
-def sort_calldefs( decls ):
-    return calldef_organizer_t().sort( decls )
+def sort_calldefs( decls, calls_profile=None ):
+    return calldef_organizer_t( calls_profile ).sort( decls )
 
 USE_CALLDEF_ORGANIZER = False
 #If you understand what problem calldef_organizer_t solves, than may be you should
 #use this.
 
-def sort( decls ):
+def sort( decls, calldef_organizer=None ):
+    """
+    returns declarations in the order they should be registered
+
+    :param calldef_organizer: :class:`calldef_organizer_t` instance, which
+                              defines the order of the overloaded functions.
+                              If it is None, the functions are sorted by name
+                              and constructors by line number, unless
+                              USE_CALLDEF_ORGANIZER is True.
+    """
     classes = [x for x in decls if isinstance( x, declarations.class_t )]
     ordered = sort_classes( classes )
 
@@ -260,9 +482,11 @@ def sort( decls ):
 
     enums.sort( key=cmp_by_name )
     variables.sort( key=cmp_by_name )
-    if USE_CALLDEF_ORGANIZER:
-        others = sort_calldefs(others)
-        constructors = sort_calldefs(constructors)
+    if None is calldef_organizer and USE_CALLDEF_ORGANIZER:
+        calldef_organizer = calldef_organizer_t()
+    if calldef_organizer:
+        others = calldef_organizer.sort(others)
+        constructors = calldef_organizer.sort(constructors)
     else:
         others.sort( key=cmp_by_name )
         constructors.sort( key=cmp_by_line )
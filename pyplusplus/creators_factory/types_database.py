@@ -19,10 +19,12 @@ class types_database_t( object ):
         self.__fundamental_strs = list(declarations.FUNDAMENTAL_TYPES.keys())
         self.__normalize_data = [ ',', '<', '>', '*', '&', '(', ')', '::' ]
         self.__containers = set()
+        self.__non_const_containers = set() #containers, used not only as type of const variables
 
     def update_containers( self, declaration ):
         assert declaration.indexing_suite
         self.__containers.add( declaration )
+        self.__non_const_containers.add( declaration )
 
     def update( self, declaration ):
         if isinstance( declaration, declarations.calldef_t ):
@@ -31,7 +33,9 @@ class types_database_t( object ):
             for arg in declaration.arguments:
                 self._update_db( self.__arguments_types, arg.decl_type )
         elif isinstance( declaration, declarations.variable_t ):
-            self._update_db( self.__variables, declaration.decl_type )
+            self._update_db( self.__variables
+                             , declaration.decl_type
+                             , declarations.is_const( declaration.decl_type ) )
         else:
             assert not "types_database_t class can not process " + str( declaration )
 
@@ -53,7 +57,7 @@ class types_database_t( object ):
             answer = answer.replace( ' ' + data, data )
         return answer.replace( '  ', ' ' )
 
-    def _update_containers_db( self, type_ ):
+    def _update_containers_db( self, type_, is_const_variable=False ):
         #will return True is type was treated
         type_ = declarations.remove_alias( type_ )
         type_ = declarations.remove_pointer( type_ )
@@ -83,11 +87,13 @@ class types_database_t( object ):
                 return #user disabled property warning
             decls_logger.warning( "%s;%s" % ( container_cls, messages.W1042 ) )
         self.__containers.add( container_cls )
+        if not is_const_variable:
+            self.__non_const_containers.add( container_cls )
         return True
 
 
-    def _update_db( self, db, type_ ):
-        if self._update_containers_db( type_ ):
+    def _update_db( self, db, type_, is_const_variable=False ):
+        if self._update_containers_db( type_, is_const_variable ):
             return
         decl_string = self._normalize( declarations.base_type( type_ ).decl_string )
         if not templates.is_instantiation( decl_string ):
@@ -185,3 +191,8 @@ class types_database_t( object ):
         return self.__containers
     used_containers = property( _get_used_containers)
 
+    @property
+    def read_only_containers( self ):
+        """containers, which are used only as type of const variables"""
+        return self.__containers - self.__non_const_containers
+
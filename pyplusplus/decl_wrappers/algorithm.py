@@ -33,8 +33,7 @@ def creators_affect_on_me( me ):
         def _get_left_siblings( self, child ):
             if not child or not child.parent:
                 return []
-            ids = list(map( id, child.parent.creators ))
-            child_index = ids.index( id( child ) )
+            child_index = child.parent.get_creator_index( child )
             return child.parent.creators[:child_index]
 
         def _get_definition_set( self, child ):
@@ -84,12 +83,26 @@ def create_valid_name(name):
     return name
 
 
+def namespace_aliases_affect_on_me( me ):
+    """
+    find all namespace aliases, which influence on code generated by "me".
+
+    The function returns the same aliases, in the same order, as
+    :func:`creators_affect_on_me` does, but it does not walk over all left
+    siblings: every compound creator keeps the list of namespace aliases it
+    defines, so only the chain of parents is visited.
+    """
+    answer = []
+    child = me
+    while child and child.parent:
+        answer.extend( child.parent.get_namespace_aliases( before=child ) )
+        child = child.parent
+    return answer
+
 def create_identifier(creator, full_name ):
     """Return new full name, which takes into account namespace aliases"""
 
-    from pyplusplus import code_creators
-    dset = creators_affect_on_me( creator )
-    dset = [x for x in dset if isinstance( x, code_creators.namespace_alias_t )]
+    dset = namespace_aliases_affect_on_me( creator )
     full_name = full_name.lstrip( '::' )
     for nsalias in dset:
         fnsname = nsalias.full_namespace_name + '::'
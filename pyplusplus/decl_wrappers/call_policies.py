@@ -371,11 +371,13 @@ class return_range_t( call_policy_t ):
     For complete documentation and usage example see "Call policies" document.
     """
     HEADER_FILE = "__return_range.pypp.hpp"
-    def __init__( self, get_size_class, value_type, value_policies):
+    def __init__( self, get_size_class, value_type, value_policies, as_buffer=False, custodian=1):
         call_policy_t.__init__( self )
         self._value_type = value_type
         self._get_size_class = get_size_class
         self._value_policies = value_policies
+        self._as_buffer = as_buffer
+        self._custodian = custodian
 
     def is_predefined( self ):
         """Returns True if call policy is defined in Boost.Python library, False otherwise"""
@@ -404,25 +406,62 @@ class return_range_t( call_policy_t ):
         self._value_policies = new_value_policies
     value_policies = property( _get_value_policies, _set_value_policies )
 
+    def _get_as_buffer( self ):
+        return self._as_buffer
+    def _set_as_buffer( self, new_as_buffer):
+        self._as_buffer = new_as_buffer
+    as_buffer = property( _get_as_buffer, _set_as_buffer
+                          , doc="if True, the range is returned as memoryview, instead of indexing suite range" )
+
+    def _get_custodian( self ):
+        return self._custodian
+    def _set_custodian( self, new_custodian):
+        self._custodian = new_custodian
+    custodian = property( _get_custodian, _set_custodian
+                          , doc="index of the argument, which is kept alive while the memoryview exists. 1 - \"self\" for member functions, 0 - none" )
+
     def _create_impl(self, function_creator ):
+        if self.as_buffer:
+            name = algorithm.create_identifier( function_creator, '::pyplusplus::call_policies::return_range_buffer' )
+            args = [ self.get_size_class, self.value_type.decl_string ]
+            as_bytes = not python_traits.is_buffer_item( self.value_type )
+            if as_bytes or 1 != self.custodian:
+                args.append( str( self.custodian ) )
+            if as_bytes:
+                args.append( 'true' )
+            return declarations.templates.join( name, args )
         name = algorithm.create_identifier( function_creator, '::pyplusplus::call_policies::return_range' )
         args = [ self.get_size_class, self.value_type.decl_string ]
         if not self.value_policies.is_default():
             args.append( self.value_policies.create_type() )
         return declarations.templates.join( name, args )
 
-def return_range( function, get_size_class, value_policies=None ):
-    """create `Py++` defined return_range call policies code generator"""
+def return_range( function, get_size_class, value_policies=None, as_buffer=False, custodian=1 ):
+    """create `Py++` defined return_range call policies code generator
+
+    If `as_buffer` is True, the range is returned as memoryview, which
+    references the range memory. The items of fundamental types are exposed
+    with the appropriate format, the items of POD classes - as "raw" bytes.
+    Other items could not be copied as raw memory, so TypeError is raised for
+    them, see :func:`python_traits.is_trivial_class`.
+    """
     r_type = function.return_type
     if not declarations.is_pointer( r_type ):
         raise TypeError( 'Function "%s" return type should be pointer, got "%s"'
                          % r_type.decl_string )
 
     value_type = declarations.remove_pointer( r_type )
-    if None is value_policies:
+    if as_buffer:
+        if not python_traits.is_buffer_item( value_type ) \
+           and not python_traits.is_trivial_class( value_type ):
+            raise TypeError( 'Function "%s" return type should be pointer to fundamental or POD class type, got "%s"'
+                             % ( function, r_type.decl_string ) )
+        if None is value_policies:
+            value_policies = default_call_policies()
+    elif None is value_policies:
         if python_traits.is_immutable( value_type ):
             value_policies = default_call_policies()
         else:
             raise RuntimeError( "return_range call policies requieres specification of value_policies" )
-    return return_range_t( get_size_class, value_type, value_policies )
+    return return_range_t( get_size_class, value_type, value_policies, as_buffer, custodian )
 
@@ -24,17 +24,18 @@ class calldef_t(decl_wrapper.decl_wrapper_t):
     For more information see: http://mail.python.org/pipermail/c++-sig/2002-June/001554.html
     """
 
+    _call_policies = None
+    _use_keywords = True
+    _use_default_arguments = True
+    _create_with_signature = None
+    _overridable = None
+    _non_overridable_reason = None
+    _transformations = None
+    _release_gil = False
+
     def __init__(self, *arguments, **keywords):
         decl_wrapper.decl_wrapper_t.__init__( self, *arguments, **keywords )
 
-        self._call_policies = None
-        self._use_keywords = True
-        self._use_default_arguments = True
-        self._create_with_signature = None
-        self._overridable = None
-        self._non_overridable_reason = None
-        self._transformations = None
-
     def get_call_policies(self):
         return self._call_policies
     def set_call_policies(self, call_policies):
@@ -139,6 +140,43 @@ class calldef_t(decl_wrapper.decl_wrapper_t):
         self.overridable = False
         self._non_overridable_reason = messages.W0000 % reason
 
+    def _get_release_gil(self):
+        return self._release_gil
+    def _set_release_gil(self, release_gil):
+        self._release_gil = release_gil
+    release_gil = property( _get_release_gil, _set_release_gil
+                            , doc="boolean, if True, `Py++` will generate function wrapper, which releases the GIL" \
+                                 +" while the function is running and reacquires it before the result is converted." \
+                                 +" The GIL is not released, if the function is not safe to be called without it." \
+                                 +" See :meth:`release_gil_unsafe_reason`. Default value is False.")
+
+    def release_gil_unsafe_reason( self ):
+        """returns the reason, the function could not be called without the GIL, empty string otherwise
+
+        The function is not safe to be called without the GIL, if it takes or
+        returns Python object or it could be overridden in Python.
+        """
+        if isinstance( self, declarations.member_calldef_t ) \
+           and self.virtuality != declarations.VIRTUALITY_TYPES.NOT_VIRTUAL:
+            return messages.W1068
+        all_types = [ arg.decl_type for arg in self.arguments ]
+        all_types.append( self.return_type )
+        for some_type in all_types:
+            if None is some_type:
+                continue #constructor
+            base = declarations.decompose_type( some_type )[-1]
+            if not isinstance( base, declarations.declarated_t ):
+                continue
+            full_name = declarations.full_name( base.declaration )
+            if full_name.startswith( '::boost::python::' ) \
+               or base.declaration.name in ( 'PyObject', '_object' ):
+                return messages.W1067 % some_type.decl_string
+        return ''
+
+    def does_release_gil( self ):
+        """returns True, if the generated code releases the GIL while the function is running"""
+        return self.release_gil and not self.release_gil_unsafe_reason()
+
     @property
     def transformations(self):
         """return list of function transformations that should be applied on the function"""
@@ -212,6 +250,11 @@ class calldef_t(decl_wrapper.decl_wrapper_t):
         if len( self.arguments ) > calldef_t.BOOST_PYTHON_MAX_ARITY:
             msgs.append( messages.W1007 % ( calldef_t.BOOST_PYTHON_MAX_ARITY, len( self.arguments ) ) )
 
+        if self.release_gil:
+            reason = self.release_gil_unsafe_reason()
+            if reason:
+                msgs.append( reason )
+
         if self.transformations:
             #if user defined transformation, than I think it took care of the problems
             ft = self.transformations[0]
@@ -245,14 +288,17 @@ class calldef_t(decl_wrapper.decl_wrapper_t):
 
 class member_function_t( declarations.member_function_t, calldef_t ):
     """defines a set of properties, that will instruct `Py++` how to expose the member function"""
+
+    _use_overload_macro = False
+    _override_precall_code = None
+    _overide_native_precall_code = None
+    _default_precall_code = None
+    _adaptor = None
+    _thread_safe_override = None
+
     def __init__(self, *arguments, **keywords):
         declarations.member_function_t.__init__( self, *arguments, **keywords )
         calldef_t.__init__( self )
-        self._use_overload_macro = False
-        self._override_precall_code = []
-        self._overide_native_precall_code = []
-        self._default_precall_code =  []
-        self._adaptor = None
 
     def _get_adaptor(self):
         return self._adaptor
@@ -264,31 +310,64 @@ class member_function_t( declarations.member_function_t, calldef_t ):
                              +". The property is relevant for public, non virtual member functions." )
 
 
+    def _get_thread_safe_override(self):
+        if None is self._thread_safe_override:
+            return self.parent.thread_safe_overrides
+        return self._thread_safe_override
+    def _set_thread_safe_override(self, thread_safe_override):
+        self._thread_safe_override = thread_safe_override
+    thread_safe_override = property( _get_thread_safe_override, _set_thread_safe_override
+                                     , doc="boolean, if True, the virtual function override could be called from a thread, " \
+                                          +"which does not hold the GIL. The GIL is acquired only to find and call Python " \
+                                          +"override. The lookup result is cached per instance, so calls of the functions, " \
+                                          +"which are not overridden in Python, do not touch Python at all. Python overrides, " \
+                                          +"added to the object or its class after the first call, are found only after " \
+                                          +"pyplusplus::threading::override_cache_t::invalidate_all() call. " \
+                                          +"The functions with transformations are not supported, see " \
+                                          +":meth:`thread_safe_override_unsafe_reason`. " \
+                                          +"Default value is taken from :attr:`class_t.thread_safe_overrides` property." )
+
+    def thread_safe_override_unsafe_reason( self ):
+        """returns the reason, `Py++` can not generate thread safe override of the function, empty string otherwise"""
+        if self.transformations:
+            return messages.W1071
+        return ''
+
+    def does_thread_safe_override( self ):
+        """returns True, if the generated override could be called from a thread, which does not hold the GIL"""
+        return self.thread_safe_override and not self.thread_safe_override_unsafe_reason()
+
     def add_override_precall_code(self, code):
         """add code, which should be executed, before overridden member function call"""
-        self._override_precall_code.append( code )
+        self.override_precall_code.append( code )
 
     @property
     def override_precall_code(self):
         """code, which should be executed, before overrided member function call"""
+        if None is self._override_precall_code:
+            self._override_precall_code = []
         return self._override_precall_code
 
     def add_override_native_precall_code(self, code):
         """add code, which should be executed, before native member function call"""
-        self._overide_native_precall_code.append( code )
+        self.override_native_precall_code.append( code )
 
     @property
     def override_native_precall_code(self):
         """code, which should be executed, before overrided member function call"""
+        if None is self._overide_native_precall_code:
+            self._overide_native_precall_code = []
         return self._overide_native_precall_code
 
     def add_default_precall_code(self, code):
         """add code, which should be executed, before this member function call"""
-        self._default_precall_code.append( code )
+        self.default_precall_code.append( code )
 
     @property
     def default_precall_code(self):
         """code, which should be executed, before this member function call"""
+        if None is self._default_precall_code:
+            self._default_precall_code = []
         return self._default_precall_code
 
     def get_use_overload_macro(self):
@@ -310,15 +389,22 @@ class member_function_t( declarations.member_function_t, calldef_t ):
         if self.does_throw == False \
            and self.virtuality != declarations.VIRTUALITY_TYPES.NOT_VIRTUAL:
             msgs.append( messages.W1046 )
+        if self.thread_safe_override \
+           and self.virtuality != declarations.VIRTUALITY_TYPES.NOT_VIRTUAL:
+            reason = self.thread_safe_override_unsafe_reason()
+            if reason:
+                msgs.append( reason )
         return msgs
 
 class constructor_t( declarations.constructor_t, calldef_t ):
     """defines a set of properties, that will instruct `Py++` how to expose the constructor"""
+
+    _body = ''
+    _allow_implicit_conversion = True
+
     def __init__(self, *arguments, **keywords):
         declarations.constructor_t.__init__( self, *arguments, **keywords )
         calldef_t.__init__( self )
-        self._body = ''
-        self._allow_implicit_conversion = True
 
     def _get_body(self):
         return self._body
@@ -461,34 +547,41 @@ class operators_helper:
 
 class member_operator_t( declarations.member_operator_t, calldef_t ):
     """defines a set of properties, that will instruct `Py++` how to expose the member operator"""
+    _override_precall_code = None
+    _default_precall_code = None
+    _overide_native_precall_code = None
+
     def __init__(self, *arguments, **keywords):
         declarations.member_operator_t.__init__( self, *arguments, **keywords )
         calldef_t.__init__( self )
-        self._override_precall_code = []
-        self._default_precall_code =  []
-        self._overide_native_precall_code = []
         
     def add_override_precall_code(self, code):
-        self._override_precall_code.append( code )
+        self.override_precall_code.append( code )
 
     @property
     def override_precall_code(self):
+        if None is self._override_precall_code:
+            self._override_precall_code = []
         return self._override_precall_code
 
     def add_default_precall_code(self, code):
-        self._default_precall_code.append( code )
+        self.default_precall_code.append( code )
 
     @property
     def default_precall_code(self):
+        if None is self._default_precall_code:
+            self._default_precall_code = []
         return self._default_precall_code
 
     def add_override_native_precall_code(self, code):
         """add code, which should be executed, before native member function call"""
-        self._overide_native_precall_code.append( code )
+        self.override_native_precall_code.append( code )
 
     @property
     def override_native_precall_code(self):
         """code, which should be executed, before overrided member function call"""
+        if None is self._overide_native_precall_code:
+            self._overide_native_precall_code = []
         return self._overide_native_precall_code
 
 
@@ -594,12 +687,14 @@ class casting_operator_t( declarations.casting_operator_t, calldef_t ):
 
 class free_function_t( declarations.free_function_t, calldef_t ):
     """defines a set of properties, that will instruct `Py++` how to expose the free function"""
+
+    _use_overload_macro = False
+    _declaration_code = None
+    _adaptor = None
+
     def __init__(self, *arguments, **keywords):
         declarations.free_function_t.__init__( self, *arguments, **keywords )
         calldef_t.__init__( self )
-        self._use_overload_macro = False
-        self._declaration_code = []
-        self._adaptor = None
 
     def _get_adaptor(self):
         return self._adaptor
@@ -620,6 +715,8 @@ class free_function_t( declarations.free_function_t, calldef_t ):
         the same file in which the registration code for the function will be
         generated
         """
+        if None is self._declaration_code:
+            self._declaration_code = []
         return self._declaration_code
 
     def get_use_overload_macro(self):
@@ -633,10 +730,12 @@ class free_function_t( declarations.free_function_t, calldef_t ):
 
 class free_operator_t( declarations.free_operator_t, calldef_t ):
     """defines a set of properties, that will instruct `Py++` how to expose the free operator"""
+
+    _target_class = None
+
     def __init__(self, *arguments, **keywords):
         declarations.free_operator_t.__init__( self, *arguments, **keywords )
         calldef_t.__init__( self )
-        self._target_class = None
 
     def _exportable_impl_derived( self ):
         return operators_helper.exportable( self )
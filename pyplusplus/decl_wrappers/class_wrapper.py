@@ -195,6 +195,7 @@ class class_t( class_common_details_t
         self._expose_sizeof = None
         self._fake_constructors = []
         self._no_init = None
+        self._thread_safe_overrides = False
 
     @property
     def fake_constructors(self):
@@ -219,6 +220,15 @@ class class_t( class_common_details_t
     redefine_operators = property( _get_redefine_operators, _set_redefine_operators
                                    , doc="tells `Py++` to redefine operators from base class in this class, False by default")
 
+    def _get_thread_safe_overrides( self ):
+        return self._thread_safe_overrides
+    def _set_thread_safe_overrides( self, new_value ):
+        self._thread_safe_overrides = new_value
+    thread_safe_overrides = property( _get_thread_safe_overrides, _set_thread_safe_overrides
+                                      , doc="tells `Py++` to generate virtual functions overrides, which could be called " \
+                                           +"from threads, which do not hold the GIL. False by default. " \
+                                           +"See :attr:`member_function_t.thread_safe_override`" )
+
     def _get_exposed_class_type(self):
         return self._exposed_class_type
     def _set_exposed_class_type(self, class_type):
@@ -642,6 +652,10 @@ class class_t( class_common_details_t
 
     def _readme_impl( self ):
         if self.indexing_suite:
+            if isinstance( self.indexing_suite, isuite2.indexing_suite2_t ) \
+               and self.indexing_suite.bulk_access \
+               and not self.indexing_suite.is_bulk_access_supported():
+                return [ messages.W1070 % self.decl_string ]
             return []
         explanation = self.is_wrapper_needed()
         for fc in self.fake_constructors:
@@ -23,17 +23,21 @@ class decl_wrapper_t(object):
 
     SPECIAL_TYPEDEF_PICK_ANY = True
 
+    #default configuration values are kept by the class, the instance gets its
+    #own value only when the value is set, so the unconfigured declarations of
+    #huge declarations trees do not pay for them
+    _alias = None
+    _ignore = False
+    _already_exposed = False
+    _exportable = None
+    _exportable_reason = None
+    _documentation = None
+    __msgs_to_ignore = None
+    _include_files = None
+    _code_generator = None
+
     def __init__(self):
         object.__init__(self)
-        self._alias = None
-        self._ignore = False
-        self._already_exposed = False
-        self._exportable = None
-        self._exportable_reason = None
-        self._documentation = None
-        self.__msgs_to_ignore = set()
-        self._include_files = []
-        self._code_generator = None
 
     @property
     def code_generator( self ):
@@ -206,6 +210,8 @@ class decl_wrapper_t(object):
     @property
     def disabled_messages( self ):
         """list of messages to ignore"""
+        if None is self.__msgs_to_ignore:
+            self.__msgs_to_ignore = set()
         return self.__msgs_to_ignore
     disabled_messaged = disabled_messages
 
@@ -222,10 +228,12 @@ class decl_wrapper_t(object):
             msg_id = messages.find_out_message_id( msg )
             if not msg_id:
                 raise RuntimeError( "Unable to find out message id. The message is: " + msg )
-            self.__msgs_to_ignore.add( msg )
+            self.disabled_messages.add( msg )
     disable_warnings = disable_messages
 
     @property
     def include_files( self ):
         """list of header files, to be included from the file, the generated code will be placed-in"""
+        if None is self._include_files:
+            self._include_files = []
         return self._include_files
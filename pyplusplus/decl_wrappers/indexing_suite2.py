@@ -7,6 +7,7 @@
 
 from pygccxml import declarations
 from . import call_policies
+from . import python_traits
 """
 method_len
 method_iter
@@ -67,6 +68,11 @@ class indexing_suite2_t( object ):
         , 'insert' : ( 'method_append', 'method_insert', 'method_extend' )
     }
 
+    #Method group names and method names, which modify the container. These
+    #methods are not exposed for read only containers.
+    MODIFYING_METHOD_GROUPS = ( 'reorder', 'insert' )
+    MODIFYING_METHODS = ( 'setitem', 'setitem_slice', 'delitem', 'delitem_slice' )
+
     def __init__( self, container_class ):
         object.__init__( self )
         self.__call_policies = None
@@ -75,6 +81,8 @@ class indexing_suite2_t( object ):
         self._disabled_groups = set()
         self._default_applied = False
         self._use_container_suite = False
+        self._bulk_access = False
+        self._read_only = None
         self.__include_files = None
 
     def get_use_container_suite( self ):
@@ -83,6 +91,41 @@ class indexing_suite2_t( object ):
         self._use_container_suite = value
     use_container_suite = property( get_use_container_suite, set_use_container_suite )
 
+    def get_bulk_access( self ):
+        return self._bulk_access
+    def set_bulk_access( self, value ):
+        self._bulk_access = value
+    bulk_access = property( get_bulk_access, set_bulk_access
+                            , doc="if True, \"std::vector\" of fundamental type will support buffer protocol, "
+                                 +"\"extend\" from buffer and slice get\\set, which copy the memory at once. "
+                                 +"See \"code_repository/bulk_access.py\" file for more information." )
+
+    def get_read_only( self ):
+        return self._read_only
+    def set_read_only( self, value ):
+        self._read_only = value
+    read_only = property( get_read_only, set_read_only
+                          , doc="if True, methods, which modify the container, are not exposed and "
+                               +"the elements are returned as internal references( class types ) "
+                               +"or copies. If None( default ), `Py++` treats the container as read only, "
+                               +"if it is used only as type of const variables." )
+
+    def is_bulk_access_supported( self ):
+        """returns True, if bulk access methods could be generated for the container"""
+        if 'vector' != self.container_class.name.split( '<' )[0]:
+            return False
+        try:
+            element_type = self.element_type
+        except:
+            return False
+        if isinstance( declarations.remove_cv( declarations.remove_alias( element_type ) ), declarations.bool_t ):
+            return False #std::vector< bool > does not hold items in contiguous memory
+        return python_traits.is_buffer_item( element_type )
+
+    def does_bulk_access( self ):
+        """returns True, if bulk access methods should be generated for the container"""
+        return self.bulk_access and self.is_bulk_access_supported()
+
     @property
     def container_class( self ):
         """reference to the parent( STD container ) class"""
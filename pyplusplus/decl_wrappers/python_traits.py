@@ -33,3 +33,88 @@ def call_traits( type_ ):
         return "boost::python::ptr(%s)" #pass by ptr
     else:
         return "%s" #pass by value
+
+BUFFER_ITEM_TYPES = ( declarations.bool_t
+                      , declarations.char_t
+                      , declarations.signed_char_t
+                      , declarations.unsigned_char_t
+                      , declarations.short_int_t
+                      , declarations.short_unsigned_int_t
+                      , declarations.int_t
+                      , declarations.unsigned_int_t
+                      , declarations.long_int_t
+                      , declarations.long_unsigned_int_t
+                      , declarations.long_long_int_t
+                      , declarations.long_long_unsigned_int_t
+                      , declarations.float_t
+                      , declarations.double_t
+                      , declarations.long_double_t )
+
+def is_buffer_item( type_ ):
+    """returns True, if array of `type_` items could be exposed to Python using buffer protocol"""
+    type_ = declarations.remove_cv( declarations.remove_alias( type_ ) )
+    return isinstance( type_, BUFFER_ITEM_TYPES )
+
+def _is_trivial_member_type( type_ ):
+    type_ = declarations.remove_alias( type_ )
+    while isinstance( type_, ( declarations.const_t, declarations.volatile_t, declarations.array_t ) ):
+        type_ = declarations.remove_alias( type_.base )
+    if declarations.is_fundamental( type_ ) \
+       or declarations.is_enum( type_ ) \
+       or declarations.is_pointer( type_ ):
+        return True
+    if declarations.is_class( type_ ):
+        return _is_trivial_class( declarations.class_traits.get_declaration( type_ ) )
+    return False
+
+def _is_trivial_class( class_ ):
+    for base in class_.bases:
+        if base.is_virtual or not _is_trivial_class( base.related_class ):
+            return False
+    for decl in class_.declarations:
+        if isinstance( decl, declarations.member_calldef_t ):
+            if decl.virtuality in ( declarations.VIRTUALITY_TYPES.VIRTUAL
+                                    , declarations.VIRTUALITY_TYPES.PURE_VIRTUAL ):
+                return False
+            if decl.is_artificial:
+                continue
+            if isinstance( decl, declarations.destructor_t ) \
+               or ( isinstance( decl, declarations.constructor_t ) and declarations.is_copy_constructor( decl ) ) \
+               or ( isinstance( decl, declarations.member_operator_t ) and '=' == decl.symbol ):
+                return False
+        elif isinstance( decl, declarations.variable_t ):
+            if decl.type_qualifiers.has_static:
+                continue
+            if not _is_trivial_member_type( decl.decl_type ):
+                return False
+    return True
+
+def is_trivial_class( type_ ):
+    """returns True, if `type_` is a class, which items could be exposed to Python as raw bytes
+
+    The class and its bases should not have virtual functions, virtual bases,
+    user defined copy constructor, assignment operator or destructor. The data
+    members should be of fundamental, enumeration, pointer or such class types,
+    or arrays of them.
+    """
+    type_ = declarations.remove_cv( declarations.remove_alias( type_ ) )
+    if not declarations.is_class( type_ ):
+        return False
+    return _is_trivial_class( declarations.class_traits.get_declaration( type_ ) )
+
+def buffer_shape( type_ ):
+    """returns list of dimensions of one or two dimensional array of buffer items, None otherwise"""
+    def strip( type_ ):
+        #remove_cv does not preserve inner dimensions of multi-dimensional arrays
+        type_ = declarations.remove_alias( type_ )
+        while isinstance( type_, ( declarations.const_t, declarations.volatile_t ) ):
+            type_ = declarations.remove_alias( type_.base )
+        return type_
+    type_ = strip( type_ )
+    shape = []
+    while isinstance( type_, declarations.array_t ) and len( shape ) < 2:
+        shape.append( type_.size )
+        type_ = strip( type_.base )
+    if not shape or not is_buffer_item( type_ ):
+        return None
+    return shape
@@ -15,16 +15,18 @@ from pygccxml import declarations
 class variable_t(decl_wrapper.decl_wrapper_t, declarations.variable_t):
     """defines a set of properties, that will instruct `Py++` how to expose the variable"""
 
+    _getter_call_policies = None
+    _setter_call_policies = None
+    _apply_smart_ptr_wa = False
+    _is_read_only = None
+    _use_make_functions = None
+    _expose_address = None
+    _expose_value = None
+    _expose_as_buffer = False
+
     def __init__(self, *arguments, **keywords):
         declarations.variable_t.__init__(self, *arguments, **keywords )
         decl_wrapper.decl_wrapper_t.__init__( self )
-        self._getter_call_policies = None
-        self._setter_call_policies = None
-        self._apply_smart_ptr_wa = False
-        self._is_read_only = None
-        self._use_make_functions = None
-        self._expose_address = None
-        self._expose_value = None
 
     __call_policies_doc__ = \
     """There are usecase, when exporting member variable forces `Py++` to
@@ -149,6 +151,31 @@ class variable_t(decl_wrapper.decl_wrapper_t, declarations.variable_t):
     expose_value = property( get_expose_value, set_expose_value
                              , doc= __expose_value_doc__ )
 
+    __expose_as_buffer_doc__ = \
+    """By default, `Py++` exposes array member variables, using "array_1_t" class.
+    Every access to the array item, from Python, is a separate call.
+
+    If this property is True, `Py++` exposes the variable as "memoryview" object,
+    created over the variable memory, without copying it. The memoryview has
+    right format, shape and strides and it is read-only, if the array items are
+    constant. It keeps the object, the variable belongs to, alive. For example,
+    NumPy could use it, without copying the data: numpy.asarray( obj.values ).
+
+    Only one and two dimensional arrays of fundamental types are supported.
+    """
+    def get_expose_as_buffer( self ):
+        return self._expose_as_buffer
+    def set_expose_as_buffer( self, value ):
+        self._expose_as_buffer = value
+    expose_as_buffer = property( get_expose_as_buffer, set_expose_as_buffer
+                                 , doc=__expose_as_buffer_doc__ )
+
+    def does_expose_as_buffer( self ):
+        """returns True, if the variable is exposed, using buffer protocol"""
+        return self.expose_as_buffer \
+               and isinstance( self.parent, declarations.class_t ) \
+               and bool( python_traits.buffer_shape( self.decl_type ) )
+
     def __find_out_is_read_only(self):
         type_ = declarations.remove_alias( self.decl_type )
 
@@ -222,6 +249,12 @@ class variable_t(decl_wrapper.decl_wrapper_t, declarations.variable_t):
                     return messages.W1056
         return ''
 
+    def _readme_impl( self ):
+        msgs = []
+        if self.expose_as_buffer and not self.does_expose_as_buffer():
+            msgs.append( messages.W1069 % str( self.decl_type ) )
+        return msgs
+
     def is_wrapper_needed(self):
         """returns an explanation( list of str ) why wrapper is needed.
 
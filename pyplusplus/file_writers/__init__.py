@@ -15,6 +15,11 @@ from .balanced_files import balanced_files_t
 from .class_multiple_files import class_multiple_files_t
 from .md5sum_repository import repository_t
 from .md5sum_repository import cached_repository_t
+from .manifest import manifest_t
+from .creators_cache import creators_cache_t
+from .dependencies import dependencies_t
+from .dependencies import is_generation_required
+from .parallel_renderer import prerender
 
 def has_pypp_extenstion( fname ):
     """returns True if file has `Py++` specific extension, otherwise False"""
@@ -31,20 +36,20 @@ def write_file( data, file_path, encoding='ascii' ):
         sf = single_file_t( data, file_path, encoding=encoding )
         sf.write()
 
-def write_multiple_files( extmodule, dir_path, files_sum_repository=None, encoding='ascii' ):
+def write_multiple_files( extmodule, dir_path, files_sum_repository=None, encoding='ascii', dependencies_file=None ):
     """writes extmodule to multiple files"""
-    mfs = multiple_files_t( extmodule, dir_path, files_sum_repository=files_sum_repository, encoding=encoding )
+    mfs = multiple_files_t( extmodule, dir_path, files_sum_repository=files_sum_repository, encoding=encoding, dependencies_file=dependencies_file )
     mfs.write()
     return mfs.written_files
 
-def write_balanced_files( extmodule, dir_path, number_of_buckets, files_sum_repository=None, encoding='ascii' ):
+def write_balanced_files( extmodule, dir_path, number_of_buckets, files_sum_repository=None, encoding='ascii', dependencies_file=None, balancing=balanced_files_t.BALANCE_BY_COUNT, compile_times=None ):
     """writes extmodule to fixed number of multiple .cpp files"""
-    mfs = balanced_files_t( extmodule, dir_path, number_of_buckets, files_sum_repository=files_sum_repository, encoding=encoding )
+    mfs = balanced_files_t( extmodule, dir_path, number_of_buckets, files_sum_repository=files_sum_repository, encoding=encoding, dependencies_file=dependencies_file, balancing=balancing, compile_times=compile_times )
     mfs.write()
     return mfs.written_files
 
-def write_class_multiple_files( extmodule, dir_path, huge_classes, files_sum_repository, encoding='ascii' ):
+def write_class_multiple_files( extmodule, dir_path, huge_classes, files_sum_repository, encoding='ascii', dependencies_file=None ):
     """writes extmodule to multiple files and splits huge classes to few source files"""
-    mfs = class_multiple_files_t( extmodule, dir_path, huge_classes, files_sum_repository=files_sum_repository, encoding=encoding )
+    mfs = class_multiple_files_t( extmodule, dir_path, huge_classes, files_sum_repository=files_sum_repository, encoding=encoding, dependencies_file=dependencies_file )
     mfs.write()
     return mfs.written_files
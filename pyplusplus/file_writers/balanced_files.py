@@ -7,6 +7,7 @@
 
 import os
 import math
+import json
 from . import multiple_files
 from pyplusplus import messages
 from pyplusplus import _logging_
@@ -14,6 +15,7 @@ from pygccxml import declarations
 from pyplusplus import decl_wrappers
 from pyplusplus import code_creators
 from pyplusplus.utils import split_sequence
+from pyplusplus.utils import split_sequence_by_cost
 
 #TODO: to add namespace_alias_t classes
 class balanced_files_t(multiple_files.multiple_files_t):
@@ -24,13 +26,33 @@ class balanced_files_t(multiple_files.multiple_files_t):
     HEADER_EXT = '.pypp.hpp'
     SOURCE_EXT = '.pypp.cpp'
 
+    #available balancing strategies
+    BALANCE_BY_COUNT = 'count'
+    BALANCE_BY_COST = 'cost'
+
+    #weights, used to estimate compile cost of a class
+    CLASS_COST = 1.0
+    CALLDEF_COST = 1.0
+    WRAPPER_CALLDEF_COST = 1.0
+    TRANSFORMED_CALLDEF_COST = 2.0
+    INDEXING_SUITE_COST = 10.0
+    TEMPLATE_DEPTH_FACTOR = 0.5
+
+    TRANSFORMED_CREATORS = ( code_creators.mem_fun_transformed_t
+                             , code_creators.mem_fun_transformed_wrapper_t
+                             , code_creators.mem_fun_v_transformed_t
+                             , code_creators.mem_fun_v_transformed_wrapper_t )
+
     def __init__( self
                   , extmodule
                   , directory_path
                   , number_of_buckets
                   , write_main=True
                   , files_sum_repository=None
-                  , encoding='ascii'):
+                  , encoding='ascii'
+                  , dependencies_file=None
+                  , balancing=BALANCE_BY_COUNT
+                  , compile_times=None):
         """Constructor.
 
         :param extmodule: The root of a code creator tree
@@ -41,19 +63,123 @@ class balanced_files_t(multiple_files.multiple_files_t):
         :param write_main:  if it is True, the class will write out a main file
             that calls all the registration methods.
         :type write_main: boolean
+
+        :param balancing: "count" - every file contains the same number of classes,
+            "cost" - every file contains classes with the same estimated compile cost
+        :type balancing: str
+
+        :param compile_times: compile time, in seconds, of every source file, generated
+            by the previous run. It is used to correct the estimated compile cost of
+            classes, when balancing is "cost".
+        :type compile_times: dictionary { file name : seconds } or JSON file name
         """
-        multiple_files.multiple_files_t.__init__( self, extmodule, directory_path, write_main, files_sum_repository, encoding)
+        multiple_files.multiple_files_t.__init__( self, extmodule, directory_path, write_main, files_sum_repository, encoding, dependencies_file)
         self.number_of_buckets = number_of_buckets
+        if balancing not in ( self.BALANCE_BY_COUNT, self.BALANCE_BY_COST ):
+            raise RuntimeError( 'unknown balancing strategy "%s"' % balancing )
+        self.balancing = balancing
+        if isinstance( compile_times, str ):
+            with open( compile_times, 'r' ) as f:
+                compile_times = json.load( f )
+        self.compile_times = compile_times or {}
+
+    @property
+    def buckets_file_name( self ):
+        """file, which contains estimated compile cost of classes in every generated source file"""
+        return os.path.join( self.directory_path, self.extmodule.body.name + '.buckets.json' )
+
+    def estimate_compile_cost( self, class_creator ):
+        """returns estimated compile cost of the class registration code
+
+        The estimation takes into account number of registered and wrapped functions,
+        transformed functions, indexing suites and template instantiation depth of
+        the class. Derived classes could redefine it.
+        """
+        cost = self.CLASS_COST
+        creators = code_creators.make_flatten( [ class_creator ] )
+        if isinstance( class_creator, code_creators.class_t ) and class_creator.wrapper:
+            creators.extend( code_creators.make_flatten( [ class_creator.wrapper ] ) )
+        for creator in creators:
+            if isinstance( creator, ( code_creators.indexing_suite1_t, code_creators.indexing_suite2_t ) ):
+                cost += self.INDEXING_SUITE_COST
+            elif isinstance( creator, self.TRANSFORMED_CREATORS ):
+                cost += self.TRANSFORMED_CALLDEF_COST
+            elif isinstance( creator, code_creators.declaration_based_t ) \
+                 and isinstance( creator.declaration, declarations.calldef_t ):
+                if isinstance( creator, code_creators.registration_based_t ):
+                    cost += self.CALLDEF_COST
+                else:
+                    cost += self.WRAPPER_CALLDEF_COST
+        depth = 0
+        max_depth = 0
+        for char in class_creator.declaration.decl_string:
+            if '<' == char:
+                depth += 1
+                max_depth = max( depth, max_depth )
+            elif '>' == char:
+                depth -= 1
+        return cost * ( 1 + self.TEMPLATE_DEPTH_FACTOR * max_depth )
+
+    def __load_buckets( self ):
+        if not os.path.exists( self.buckets_file_name ):
+            return {}
+        try:
+            with open( self.buckets_file_name, 'r' ) as f:
+                return json.load( f )
+        except ( ValueError, IOError ):
+            return {}
+
+    def __learn_compile_costs( self, estimated_costs ):
+        #the compile time of a file is distributed between its classes, proportionally
+        #to their estimated costs, using the file layout of the previous run
+        learned_costs = {}
+        scales = []
+        for file_name, class2cost in self.__load_buckets().items():
+            if file_name not in self.compile_times:
+                continue
+            prev_total = sum( class2cost.values() )
+            if not prev_total:
+                continue
+            scale = float( self.compile_times[ file_name ] ) / prev_total
+            scales.append( scale )
+            for class_name, prev_cost in class2cost.items():
+                learned_costs[ class_name ] = prev_cost * scale
+        if not scales:
+            return estimated_costs
+        scales.sort()
+        median_scale = scales[ len( scales ) // 2 ]
+        answer = {}
+        for class_name, cost in estimated_costs.items():
+            if class_name in learned_costs:
+                answer[ class_name ] = learned_costs[ class_name ]
+            else:
+                answer[ class_name ] = cost * median_scale
+        return answer
 
     def split_classes( self ):
         class_creators = [x for x in self.extmodule.body.creators if isinstance(x, ( code_creators.class_t, code_creators.class_declaration_t ) )]
 
         class_creators = [cc for cc in class_creators if not cc.declaration.already_exposed]
 
-        buckets = split_sequence(class_creators, len(class_creators)/self.number_of_buckets )
-        if len(buckets) > self.number_of_buckets:
-            buckets[len(buckets)-2] += buckets[len(buckets)-1]
-            buckets = buckets[:len(buckets)-1]
+        if self.BALANCE_BY_COST == self.balancing:
+            costs = dict( [ ( cc.declaration.decl_string, self.estimate_compile_cost( cc ) ) for cc in class_creators ] )
+            learned_costs = self.__learn_compile_costs( costs )
+            #the order of the creators is preserved, because base classes should be
+            #registered before the derived ones
+            buckets = split_sequence_by_cost( class_creators
+                                              , [ learned_costs[ cc.declaration.decl_string ] for cc in class_creators ]
+                                              , self.number_of_buckets )
+            layout = {}
+            for index, bucket in enumerate( buckets ):
+                file_name = self.extmodule.body.name + '_classes_%d' % (index+1) + self.SOURCE_EXT
+                layout[ file_name ] = dict( [ ( cc.declaration.decl_string, costs[ cc.declaration.decl_string ] ) for cc in bucket ] )
+            with open( self.buckets_file_name, 'w+' ) as f:
+                json.dump( layout, f, indent=1, sort_keys=True )
+        else:
+            buckets = split_sequence(class_creators, len(class_creators)/self.number_of_buckets )
+            if len(buckets) > self.number_of_buckets:
+                buckets[len(buckets)-2] += buckets[len(buckets)-1]
+                buckets = buckets[:len(buckets)-1]
 
         for index, bucket in enumerate( buckets ):
             self.split_creators( bucket
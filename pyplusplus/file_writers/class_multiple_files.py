@@ -39,12 +39,14 @@ class class_multiple_files_t(multiple_files.multiple_files_t):
                   , huge_classes
                   , num_of_functions_per_file=20
                   , files_sum_repository=None
-                  , encoding='ascii'):
+                  , encoding='ascii'
+                  , dependencies_file=None):
         multiple_files.multiple_files_t.__init__(self
                                                  , extmodule
                                                  , directory_path
                                                  , files_sum_repository=files_sum_repository
-                                                 , encoding=encoding)
+                                                 , encoding=encoding
+                                                 , dependencies_file=dependencies_file)
         self.huge_classes = huge_classes
         self.num_of_functions_per_file = num_of_functions_per_file
         self.internal_splitters = [
@@ -0,0 +1,228 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""
+defines persistent cache of the code, generated by top level code creators
+
+The cache is keyed on the "fingerprint" of the code creator: a hash of the
+code creators sub-tree, the declarations it is based on and their
+configuration ( alias, call policies, transformations, include\\exclude state,
+etc. ). If the fingerprint was not changed since the previous run, the code
+is taken from the cache and the creator is not rendered at all.
+"""
+
+import os
+import json
+import types
+import pyplusplus
+from . import md5sum_repository
+from pyplusplus import _logging_
+from pygccxml import declarations
+from pyplusplus import code_creators
+
+#attributes, which do not affect the generated code or reference the whole tree
+_SKIPPED_ATTRIBUTES = frozenset([
+    '_parent', '_cache', '_comment', '_declarations', '_optimized'
+    , '_all_decls', '_all_decls_not_recursive', '_derived', '_recursive_derived'
+    , '_type2decls', '_type2name2decls', '_type2decls_nr', '_type2name2decls_nr'
+    , '_code_generator', '_target_configuration', 'create'
+    , '_creators_by_decl', '_creators_by_class', '_positions', '_namespace_aliases' ])
+
+_PRIMITIVE_TYPES = ( type(None), bool, int, float, str, bytes )
+
+def _describe( value, depth ):
+    """returns stable, process independent, string representation of the value"""
+    if isinstance( value, _PRIMITIVE_TYPES ):
+        return repr( value )
+    if isinstance( value, declarations.declaration_t ):
+        if isinstance( value, declarations.calldef_t ):
+            return 'decl:%s%s' % ( value.decl_string, value.function_type().decl_string )
+        return 'decl:' + value.decl_string
+    if isinstance( value, declarations.type_t ):
+        return 'type:' + value.decl_string
+    if isinstance( value, declarations.location_t ):
+        return 'location:%s:%d' % value.as_tuple()
+    if isinstance( value, code_creators.code_creator_t ):
+        if isinstance( value, code_creators.declaration_based_t ):
+            return 'cc:%s(%s)' % ( value.__class__.__name__, _describe( value.declaration, 0 ) )
+        return 'cc:' + value.__class__.__name__
+    if isinstance( value, ( types.FunctionType, types.MethodType ) ):
+        return 'callable:' + value.__name__
+    if isinstance( value, ( list, tuple ) ):
+        return '[%s]' % ','.join( [ _describe( item, depth ) for item in value ] )
+    if isinstance( value, ( set, frozenset ) ):
+        return '{%s}' % ','.join( sorted( [ _describe( item, depth ) for item in value ] ) )
+    if isinstance( value, dict ):
+        items = [ '%s:%s' % ( _describe( k, depth ), _describe( v, depth ) ) for k, v in value.items() ]
+        return '{%s}' % ','.join( sorted( items ) )
+    class_name = value.__class__.__module__ + '.' + value.__class__.__name__
+    if depth <= 0 or not hasattr( value, '__dict__' ):
+        return class_name
+    return '%s(%s)' % ( class_name, _describe_vars( value, depth - 1 ) )
+
+def _describe_vars( inst, depth ):
+    items = []
+    for name, value in sorted( vars( inst ).items() ):
+        if name in _SKIPPED_ATTRIBUTES:
+            continue
+        items.append( '%s=%s' % ( name, _describe( value, depth ) ) )
+    return ';'.join( items )
+
+def describe_declaration( decl ):
+    """returns description of the declaration signature, location and configuration"""
+    return _describe_vars( decl, 4 )
+
+def describe_creator( creator ):
+    """returns description of the code creators sub-tree and their declarations"""
+    answer = []
+    for cc in code_creators.make_flatten_generator( creator ):
+        answer.append( cc.__class__.__name__ )
+        answer.append( _describe_vars( cc, 2 ) )
+        if isinstance( cc, code_creators.declaration_based_t ):
+            answer.append( describe_declaration( cc.declaration ) )
+    return os.linesep.join( answer )
+
+def describe_creators( creators ):
+    """returns description of the code creators, including replaced :meth:`create` methods
+
+    Writers replace :meth:`code_creators.code_creator_t.create` method of
+    already written creators, so the generated code depends on it too.
+    """
+    answer = []
+    for creator in creators:
+        answer.append( describe_creator( creator ) )
+        if 'create' in vars( creator ):
+            answer.append( 'create=' + _describe( creator.create, 0 ) )
+    return os.linesep.join( answer )
+
+def create_context( extmodule ):
+    """returns description of the module wide settings, which affect the generated code"""
+    context = [ pyplusplus.__version__, extmodule.body.name ]
+    ns_types = ( code_creators.namespace_alias_t, code_creators.namespace_using_t )
+    for creator in extmodule.creators:
+        if isinstance( creator, ns_types ):
+            context.append( creator.create() )
+    if extmodule.body.target_configuration:
+        context.append( _describe_vars( extmodule.body.target_configuration, 1 ) )
+    return os.linesep.join( context ) + os.linesep
+
+def is_cacheable( creator ):
+    """returns True, if the code generated by the creator sub-tree could be cached
+
+    Writers replace :meth:`code_creators.code_creator_t.create` method of
+    already written creators. Sub-trees, which contain such creators, are
+    rendered as is.
+    """
+    for cc in code_creators.make_flatten_generator( creator ):
+        if cc is not creator and 'create' in vars( cc ):
+            return False
+    return True
+
+class creators_cache_t( object ):
+    """persistent cache of the code, generated by top level code creators
+
+    Usage example::
+
+      cache = creators_cache_t( 'my_module.creators.cache' )
+      cache.apply( extmodule )
+      ...write extmodule to file(s)...
+      cache.save()
+    """
+
+    logger = _logging_.loggers.file_writer
+
+    #top level code creators, which code is cached
+    CACHEABLE_CREATORS = ( code_creators.class_t
+                           , code_creators.class_wrapper_t
+                           , code_creators.free_function_t )
+
+    def __init__( self, file_name ):
+        object.__init__( self )
+        self.__file_name = file_name
+        self.__entries = {} #fingerprint : code
+        self.__used_entries = {}
+        self.__context = ''
+        self.hits = 0
+        self.misses = 0
+        if os.path.exists( self.__file_name ):
+            try:
+                with open( self.__file_name, 'r' ) as f:
+                    self.__entries = json.load( f )
+            except ( ValueError, IOError ) as error:
+                self.logger.info( 'unable to load code creators cache "%s": %s'
+                                  % ( self.__file_name, str( error ) ) )
+                self.__entries = {}
+
+    @property
+    def file_name( self ):
+        """file name, the cache is stored in"""
+        return self.__file_name
+
+    def fingerprint( self, creator ):
+        """returns fingerprint( hash ) of the code creator"""
+        return md5sum_repository.get_md5_text_value( self.__context + describe_creator( creator ) )
+
+    def __wrap( self, creator ):
+        #many properties calculate their value on first access and keep it in
+        #"_<name>" attribute. The fingerprint is calculated before any creator
+        #is rendered, so it does not depend on the rendering order.
+        key = self.fingerprint( creator )
+        original_create = creator.create
+        def create():
+            if not is_cacheable( creator ):
+                return original_create()
+            code = self.__entries.get( key )
+            if code is None:
+                self.misses += 1
+                code = original_create()
+            else:
+                self.hits += 1
+            self.__used_entries[ key ] = code
+            return code
+        creator.create = create
+
+    def apply( self, extmodule ):
+        """replaces :meth:`create` method of all cacheable top level code creators
+
+        The method should be called before the module is rendered.
+        """
+        self.__context = create_context( extmodule )
+        for creator in extmodule.body.creators:
+            if isinstance( creator, self.CACHEABLE_CREATORS ):
+                self.__wrap( creator )
+        for creator in extmodule.creators:
+            if isinstance( creator, self.CACHEABLE_CREATORS ):
+                self.__wrap( creator )
+
+    def pop_state( self ):
+        """returns and clears statistics and entries, collected since the previous call
+
+        The method is used to transfer the state of the cache from worker processes.
+        """
+        state = ( self.hits, self.misses, self.__used_entries )
+        self.hits = 0
+        self.misses = 0
+        self.__used_entries = {}
+        return state
+
+    def merge_state( self, state ):
+        """merges the state, returned by :meth:`pop_state`, into the cache"""
+        hits, misses, used_entries = state
+        self.hits += hits
+        self.misses += misses
+        self.__used_entries.update( used_entries )
+
+    def save( self ):
+        """writes code, generated during this run, to the cache file"""
+        self.logger.debug( 'code creators cache: %d hits, %d misses' % ( self.hits, self.misses ) )
+        #write to temporary file and rename it, so the cache is never left half written
+        tmp_file_name = self.__file_name + '.tmp'
+        try:
+            with open( tmp_file_name, 'w+' ) as f:
+                json.dump( self.__used_entries, f, sort_keys=True )
+            os.replace( tmp_file_name, self.__file_name )
+        finally:
+            if os.path.exists( tmp_file_name ):
+                os.remove( tmp_file_name )
@@ -0,0 +1,186 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""
+defines class, which collects dependencies of the generated translation units
+
+The dependencies are saved in two formats:
+
+  * Make\\Ninja "depfile" - every generated translation unit depends on the
+    input and generated headers it includes
+  * JSON manifest - maps every generated translation unit to its input and
+    generated headers. The manifest also keeps modification time of the
+    input headers, so :func:`is_generation_required` could tell whether the
+    code should be generated again.
+"""
+
+import os
+import re
+import json
+
+INCLUDE_RE = re.compile( r'^\s*#\s*include\s*[<"]([^>"]+)[>"]', re.MULTILINE )
+
+TRANSLATION_UNIT_EXTENSIONS = ( '.cpp', '.cxx', '.cc' )
+
+def _escape_depfile_path( path ):
+    return path.replace( '\\', '/' ).replace( ' ', '\\ ' ).replace( '$', '$$' )
+
+def _replace_file( file_name, content ):
+    #write to temporary file and rename it, so the file is never left half written
+    tmp_file_name = file_name + '.tmp'
+    try:
+        with open( tmp_file_name, 'w+' ) as f:
+            f.write( content )
+        os.replace( tmp_file_name, file_name )
+    finally:
+        if os.path.exists( tmp_file_name ):
+            os.remove( tmp_file_name )
+
+def is_generation_required( file_name ):
+    """
+    returns True, if one of the input headers was changed or one of the
+    generated files does not exist, since the dependencies were saved
+
+    Only headers are checked, so the code should be generated again if the
+    `Py++` script itself was changed.
+
+    :param file_name: JSON manifest, saved by :class:`dependencies_t`
+    """
+    if not os.path.exists( file_name ):
+        return True
+    try:
+        with open( file_name, 'r' ) as f:
+            data = json.load( f )
+    except ( ValueError, IOError ):
+        return True
+    for fpath in data.get( 'files', {} ):
+        if not os.path.exists( fpath ):
+            return True
+    for header, mtime in data.get( 'input_headers', {} ).items():
+        try:
+            if os.path.getmtime( header ) != mtime:
+                return True
+        except OSError:
+            return True
+    return False
+
+class dependencies_t( object ):
+    """collects "#include" directives of the generated files and saves the dependencies"""
+
+    def __init__( self, file_name, include_dirs=None ):
+        """
+        :param file_name: JSON manifest file name, the depfile name is
+                          created from it by replacing the extension with ".d"
+        :param include_dirs: directories, the included headers are searched in
+        """
+        object.__init__( self )
+        self.__file_name = file_name
+        self.__include_dirs = include_dirs or []
+        self.__files = {} #generated file path : list of included headers
+        self.__previous_files = {}
+        if os.path.exists( file_name ):
+            try:
+                with open( file_name, 'r' ) as f:
+                    self.__previous_files = json.load( f ).get( 'files', {} )
+            except ( ValueError, IOError ):
+                pass
+
+    @property
+    def file_name( self ):
+        """JSON manifest file name"""
+        return self.__file_name
+
+    @property
+    def depfile_name( self ):
+        """Make\\Ninja depfile name"""
+        return os.path.splitext( self.__file_name )[0] + '.d'
+
+    def add_file( self, fpath, content=None ):
+        """registers generated file and headers it includes
+
+        :param content: the file content, if None the file is read from the disk
+        """
+        if None is content:
+            headers = []
+            with open( fpath, 'r' ) as f:
+                for line in f:
+                    headers.extend( INCLUDE_RE.findall( line ) )
+        else:
+            headers = INCLUDE_RE.findall( content )
+        self.__files[ os.path.normpath( fpath ) ] = headers
+
+    def keep_file( self, fpath ):
+        """registers generated file, which was not changed since the previous run"""
+        fpath = os.path.normpath( fpath )
+        self.__files[ fpath ] = self.__previous_files.get( fpath, [] )
+
+    def __resolve( self, fpath, header ):
+        if os.path.isabs( header ):
+            candidates = [ header ]
+        else:
+            candidates = [ os.path.join( os.path.dirname( fpath ), header ) ]
+            candidates.extend( [ os.path.join( dir_, header ) for dir_ in self.__include_dirs ] )
+        for candidate in candidates:
+            candidate = os.path.normpath( candidate )
+            if candidate in self.__files or os.path.exists( candidate ):
+                return candidate
+        return None #system or unknown header
+
+    def __direct_dependencies( self ):
+        answer = {}
+        for fpath, headers in self.__files.items():
+            resolved = [ self.__resolve( fpath, header ) for header in headers ]
+            answer[ fpath ] = [ header for header in resolved if header ]
+        return answer
+
+    def create_translation_units( self ):
+        """
+        returns dictionary, which maps every generated translation unit to the
+        dictionary with "input_headers" and "generated_headers" lists
+        """
+        direct = self.__direct_dependencies()
+        answer = {}
+        for fpath in sorted( direct ):
+            if os.path.splitext( fpath )[1] not in TRANSLATION_UNIT_EXTENSIONS:
+                continue
+            input_headers = set()
+            generated_headers = set()
+            to_be_visited = list( direct[ fpath ] )
+            while to_be_visited:
+                header = to_be_visited.pop()
+                if header in generated_headers or header in input_headers:
+                    continue
+                if header in direct:
+                    generated_headers.add( header )
+                    to_be_visited.extend( direct[ header ] )
+                else:
+                    input_headers.add( header )
+            answer[ fpath ] = { 'input_headers' : sorted( input_headers )
+                                , 'generated_headers' : sorted( generated_headers ) }
+        return answer
+
+    def save( self ):
+        """writes the JSON manifest and the depfile"""
+        units = self.create_translation_units()
+        input_headers = {}
+        for unit in units.values():
+            for header in unit[ 'input_headers' ]:
+                input_headers[ header ] = os.path.getmtime( header )
+
+        data = { 'files' : self.__files
+                 , 'translation_units' : units
+                 , 'input_headers' : input_headers }
+        _replace_file( self.__file_name, json.dumps( data, indent=1, sort_keys=True ) )
+
+        lines = []
+        for fpath, unit in sorted( units.items() ):
+            dependencies = unit[ 'input_headers' ] + unit[ 'generated_headers' ]
+            target = _escape_depfile_path( os.path.abspath( fpath ) )
+            prerequisites = [ _escape_depfile_path( os.path.abspath( header ) ) for header in dependencies ]
+            lines.append( ' \\\n  '.join( [ target + ':' ] + prerequisites ) )
+        content = '\n'.join( lines )
+        if lines:
+            content += '\n'
+        _replace_file( self.depfile_name, content )
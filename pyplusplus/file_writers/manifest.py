@@ -0,0 +1,131 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""
+defines content addressed manifest of the generated files
+
+For every generated file the manifest keeps:
+
+  * the fingerprint of the code creators, the file content was generated from
+  * the hash of the file content
+  * the file modification time and size
+
+If the fingerprint of the code creators was not changed and the file was not
+touched since the previous run, the writer skips both rendering and hashing
+of the file content.
+
+The manifest is stored in "JSON lines" format, one file per line.
+"""
+
+import os
+import json
+from . import md5sum_repository
+
+class entry_t( object ):
+    """describes single generated file"""
+
+    __slots__ = ( 'file_name', 'fingerprint', 'hash', 'mtime', 'size' )
+
+    def __init__( self, file_name, fingerprint=None, hash=None, mtime=None, size=None ):
+        self.file_name = file_name
+        self.fingerprint = fingerprint
+        self.hash = hash
+        self.mtime = mtime
+        self.size = size
+
+    def to_dict( self ):
+        return dict( [ ( name, getattr( self, name ) ) for name in self.__slots__ ] )
+
+class manifest_t( md5sum_repository.repository_t ):
+    """content addressed manifest of the generated files
+
+    The class implements :class:`repository_t` interface, so it could be used
+    as "files sum repository" by any writer.
+    """
+
+    tracks_fingerprints = True
+
+    def __init__( self, file_name ):
+        md5sum_repository.repository_t.__init__( self )
+        self.__file_name = file_name
+        self.__directory = os.path.dirname( file_name )
+        self.__entries = {} #file name : entry_t
+        self.__used = set()
+        if os.path.exists( self.__file_name ):
+            self.__load()
+
+    def __load( self ):
+        with open( self.__file_name, 'r' ) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = entry_t( **json.loads( line ) )
+                except ( ValueError, TypeError ):
+                    continue #corrupted line, the file will be regenerated
+                self.__entries[ entry.file_name ] = entry
+
+    @property
+    def file_name( self ):
+        """file name, the manifest is stored in"""
+        return self.__file_name
+
+    def __get_entry( self, fname ):
+        self.__used.add( fname )
+        if fname not in self.__entries:
+            self.__entries[ fname ] = entry_t( fname )
+        return self.__entries[ fname ]
+
+    def get_file_value( self, fpath ):
+        entry = self.__entries.get( fpath )
+        if entry:
+            self.__used.add( fpath )
+            return entry.hash
+        return None
+
+    def get_text_value( self, text ):
+        return md5sum_repository.get_md5_text_value( text )
+
+    def create_text_hasher( self ):
+        return md5sum_repository.md5_text_hasher_t()
+
+    def update_value( self, fpath, hash_value ):
+        self.__get_entry( fpath ).hash = hash_value
+
+    def is_up_to_date( self, fpath, fingerprint ):
+        fname = os.path.basename( fpath )
+        entry = self.__entries.get( fname )
+        if not entry or None is entry.hash or entry.fingerprint != fingerprint:
+            return False
+        try:
+            stat = os.stat( fpath )
+        except OSError:
+            return False
+        if ( entry.mtime, entry.size ) != ( stat.st_mtime, stat.st_size ):
+            return False
+        self.__used.add( fname )
+        return True
+
+    def update_fingerprint( self, fpath, fingerprint ):
+        entry = self.__get_entry( os.path.basename( fpath ) )
+        entry.fingerprint = fingerprint
+        try:
+            stat = os.stat( fpath )
+            entry.mtime, entry.size = stat.st_mtime, stat.st_size
+        except OSError:
+            entry.mtime, entry.size = None, None
+
+    def save_values( self ):
+        lines = []
+        for fname in sorted( self.__used ):
+            lines.append( json.dumps( self.__entries[ fname ].to_dict(), sort_keys=True ) )
+        #write to temporary file and rename it, so the manifest is never left half written
+        tmp_file_name = self.__file_name + '.tmp'
+        with open( tmp_file_name, 'w+' ) as f:
+            f.write( '\n'.join( lines ) )
+            if lines:
+                f.write( '\n' )
+        os.replace( tmp_file_name, self.__file_name )
@@ -20,6 +20,21 @@ def get_md5_text_value( text ):
     m.update( data )
     return m.hexdigest() 
 
+class md5_text_hasher_t( object ):
+    """calculates the same value :func:`get_md5_text_value` does, piece by piece"""
+
+    def __init__( self ):
+        object.__init__( self )
+        self.__md5 = md5()
+
+    def update( self, text ):
+        if isinstance(text, str):
+            text = text.encode()
+        self.__md5.update( text )
+
+    def hexdigest( self ):
+        return self.__md5.hexdigest()
+
 def get_md5_file_value( fpath ):
     if not os.path.exists( fpath ):
         return None #file does not exist
@@ -29,8 +44,26 @@ def get_md5_file_value( fpath ):
     return get_md5_text_value( fcontent )
 
 class repository_t( object ):
+    #True, if the repository keeps fingerprints of the code creators, the files were generated from
+    tracks_fingerprints = False
+
     def __init__( self ):
         object.__init__( self )
+
+    def is_up_to_date( self, fpath, fingerprint ):
+        """returns True, if the file was generated from the code creators with the same fingerprint"""
+        return False
+
+    def update_fingerprint( self, fpath, fingerprint ):
+        pass
+
+    def create_text_hasher( self ):
+        """
+        returns object with "update( text )" and "hexdigest()" methods, which
+        calculates the same value :meth:`get_text_value` does, or None if the
+        repository does not support it
+        """
+        return None
         
     def get_file_value( self, fpath ):
         return NotImplementedError( self.__class__.__name__ )
@@ -53,6 +86,9 @@ class dummy_repository_t( repository_t ):
         
     def get_text_value( self, text ):
         return get_md5_text_value( text )
+
+    def create_text_hasher( self ):
+        return md5_text_hasher_t()
         
     def update_value( self, fpath, hash_value ):
         pass
@@ -88,6 +124,9 @@ class cached_repository_t( repository_t ):
     def get_text_value( self, text ):
         return get_md5_text_value( text )
 
+    def create_text_hasher( self ):
+        return md5_text_hasher_t()
+
     def update_value( self, fpath, hash_value ):
         self.__repository[ fpath ] = hash_value
         
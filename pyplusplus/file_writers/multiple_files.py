@@ -7,6 +7,9 @@
 
 import os
 from . import writer
+from . import dependencies
+from . import creators_cache
+from . import md5sum_repository
 from pyplusplus import messages
 from pyplusplus import _logging_
 from pygccxml import declarations
@@ -22,7 +25,7 @@ class multiple_files_t(writer.writer_t):
     HEADER_EXT = '.pypp.hpp'
     SOURCE_EXT = '.pypp.cpp'
 
-    def __init__(self, extmodule, directory_path, write_main=True, files_sum_repository=None, encoding='ascii'):
+    def __init__(self, extmodule, directory_path, write_main=True, files_sum_repository=None, encoding='ascii', dependencies_file=None):
         """
         :param extmodule: code creators tree root
         :type extmodule: :class:`code_creators.bpmodule_t`
@@ -30,6 +33,9 @@ class multiple_files_t(writer.writer_t):
         :type directory_path: str
         :param write_main:  if True, the class will write out a main file that calls all the registration methods.
         :type write_main: boolean
+        :param dependencies_file: if given, the class will write out JSON manifest and Make\\Ninja
+                                  depfile with dependencies of every generated translation unit.
+        :type dependencies_file: str
         """
         writer.writer_t.__init__( self, extmodule, files_sum_repository, encoding=encoding )
         self.__directory_path = directory_path
@@ -43,9 +49,13 @@ class multiple_files_t(writer.writer_t):
         self.__predefined_include_creators \
             = [creator for creator in self.extmodule.creators if isinstance( creator, code_creators.include_t )]
         self.__value_traits = [x for x in self.extmodule.creators if isinstance(x, code_creators.value_traits_t)]
+        self.__input_context = None
+        self.dependencies = None
+        if dependencies_file:
+            include_dirs = self.extmodule.user_defined_directories + self.extmodule.std_directories
+            self.dependencies = dependencies.dependencies_t( dependencies_file, include_dirs )
 
-
-    def write_file( self, fpath, content ):
+    def __register_file( self, fpath ):
         if fpath in self.written_files:
             msg = ['`Py++` is going to write different content to the same file(%s).' % fpath]
             msg.append('The following is a short list of possible explanations for this behaviour:' )
@@ -56,7 +66,55 @@ class multiple_files_t(writer.writer_t):
             raise RuntimeError( os.linesep.join(msg) )
 
         self.written_files.append( fpath )
+
+    def write_file( self, fpath, content, fingerprint=None ):
+        self.__register_file( fpath )
         writer.writer_t.write_file( fpath, content, self.files_sum_repository, self.encoding )
+        if self.dependencies:
+            if isinstance( content, str ):
+                self.dependencies.add_file( fpath, content )
+            else:
+                self.dependencies.add_file( fpath )
+        if fingerprint:
+            self.files_sum_repository.update_fingerprint( fpath, fingerprint )
+
+    def create_input_fingerprint( self, function_name, registration_creators ):
+        """
+        returns fingerprint of the code creators, the files with "register"
+        function are generated from, or None if files sum repository does not
+        track fingerprints
+        """
+        if not self.files_sum_repository.tracks_fingerprints:
+            return None
+        if None is self.__input_context:
+            context = [ self.__class__.__name__
+                        , creators_cache.create_context( self.extmodule ) ]
+            if self.extmodule.license:
+                context.append( self.extmodule.license.create() )
+            context.extend( [ cc.create() for cc in self.__predefined_include_creators ] )
+            self.__input_context = os.linesep.join( context )
+        creators = registration_creators + self.get_declaration_creators( registration_creators )
+        description = creators_cache.describe_creators( creators )
+        return md5sum_repository.get_md5_text_value(
+            os.linesep.join( [ self.__input_context, function_name, description ] ) )
+
+    def skip_unchanged_files( self, fpaths, fingerprint ):
+        """
+        returns True, if all files were generated from the code creators with
+        the same fingerprint and were not changed since then. In this case the
+        files are considered as written.
+        """
+        if None is fingerprint:
+            return False
+        for fpath in fpaths:
+            if not self.files_sum_repository.is_up_to_date( fpath, fingerprint ):
+                return False
+        for fpath in fpaths:
+            self.__register_file( fpath )
+            if self.dependencies:
+                self.dependencies.keep_file( fpath )
+            self.logger.debug( 'file "%s" was not changed( fingerprint )' % fpath )
+        return True
 
     def create_dir( self, directory_path ):
         """Create the output directory if it doesn't already exist.
@@ -101,6 +159,19 @@ class multiple_files_t(writer.writer_t):
         associated_creators = [associated_creator for associated_creator in associated_creators if associated_creator.parent is self.extmodule]
         return associated_creators
 
+    def get_declaration_creators( self, registration_creators ):
+        """returns unique list of declaration code creators, associated with the registration ones"""
+        declaration_creators = []
+        for rc in registration_creators:
+            declaration_creators.extend( self.associated_decl_creators( rc ) )
+        return self.get_unique_creators( declaration_creators )
+
+    def consume_declaration_creators( self, declaration_creators ):
+        """replaces create method of declaration code creators, which were written to a file"""
+        for creator in declaration_creators:
+            if not isinstance( creator, self.ref_count_creators ):
+                creator.create = lambda: ''
+
     def create_function_code( self, function_name ):
         return "void %s();" % function_name
 
@@ -204,9 +275,14 @@ class multiple_files_t(writer.writer_t):
         else:
             return os.linesep.join( [creator.create() for creator in ns_creators] )
 
-    def create_source( self, file_name, function_name, registration_creators ):
+    def write_source( self, sink, file_name, function_name, registration_creators ):
         """
-        return the content of a cpp file.
+        writes the content of a cpp file to the sink.
+
+        The code of every code creator is written as soon as it is created, so
+        the whole file content is never held in memory.
+
+        :param sink: :class:`code_creators.sink_t` instance
 
         :param file_name: The base name of the corresponding include file (without extension)
         :type file_name: str
@@ -216,55 +292,64 @@ class multiple_files_t(writer.writer_t):
 
         :param creators: "register" function code creators
         :type creators: list of :class:`code_creators.code_creator_t`
-        :rtype: str
         """
-        declaration_creators = []
-        for rc in registration_creators:
-            declaration_creators.extend( self.associated_decl_creators( rc ) )
-        declaration_creators = self.get_unique_creators( declaration_creators )
+        declaration_creators = self.get_declaration_creators( registration_creators )
 
         creators = registration_creators + declaration_creators
 
-        answer = []
         if self.extmodule.license:
-            answer.append( self.extmodule.license.create() )
+            sink.write( self.extmodule.license.create() + os.linesep )
 
         head_headers = [ file_name + self.HEADER_EXT ]
-        answer.append( self.create_include_code( creators, tail_headers=head_headers ) )
+        sink.write( self.create_include_code( creators, tail_headers=head_headers ) + os.linesep )
 
-        answer.append( '' )
-        answer.append( self.create_namespaces_code( creators ) )
+        sink.write( os.linesep )
+        sink.write( self.create_namespaces_code( creators ) + os.linesep )
 
         # Write wrapper classes...
         for creator in declaration_creators:
-            answer.append( '' )
-            answer.append( creator.create() )
-            if not isinstance( creator, self.ref_count_creators ):
-                creator.create = lambda: ''
+            sink.write( os.linesep )
+            creator.write( sink )
+            sink.write( os.linesep )
+        self.consume_declaration_creators( declaration_creators )
 
         # Write the register() function...
-        answer.append( '' )
-        answer.append( 'void %s(){' % function_name )
-        answer.append( '' )
+        sink.write( os.linesep + 'void %s(){' % function_name + os.linesep + os.linesep )
         for creator in registration_creators:
-            answer.append( code_creators.code_creator_t.indent( creator.create() ) )
-            answer.append( '' )
-        answer.append( '}' )
-        return os.linesep.join( answer )
+            sink.write( code_creators.code_creator_t.indent( creator.create() ) + os.linesep * 2 )
+        sink.write( '}' )
+
+    def create_source( self, file_name, function_name, registration_creators ):
+        """
+        return the content of a cpp file.
+
+        See :meth:`write_source` for the arguments description.
+
+        :rtype: str
+        """
+        sink = code_creators.string_sink_t()
+        self.write_source( sink, file_name, function_name, registration_creators )
+        return sink.get_value()
 
     def split_class_impl( self, class_creator):
         function_name = 'register_' + self.extmodule.body.name + '_%s_class' % class_creator.alias
         file_path = os.path.join( self.directory_path, class_creator.alias )
         # Write the .h file...
         header_name = file_path + self.HEADER_EXT
-        self.write_file( header_name
-                         , self.create_header( class_creator.alias
-                                               , self.create_function_code( function_name ) ) )
-
-        # Write the .cpp file...
-        cpp_code = self.create_source( class_creator.alias, function_name, [class_creator] )
+        source_name = file_path + self.SOURCE_EXT
+        fingerprint = self.create_input_fingerprint( function_name, [class_creator] )
+        if self.skip_unchanged_files( [ header_name, source_name ], fingerprint ):
+            self.consume_declaration_creators( self.get_declaration_creators( [class_creator] ) )
+        else:
+            self.write_file( header_name
+                             , self.create_header( class_creator.alias
+                                                   , self.create_function_code( function_name ) )
+                             , fingerprint )
 
-        self.write_file( file_path + self.SOURCE_EXT, cpp_code )
+            # Write the .cpp file...
+            self.write_file( source_name
+                             , lambda sink: self.write_source( sink, class_creator.alias, function_name, [class_creator] )
+                             , fingerprint )
 
         # Replace the create() method so that only the register() method is called
         # (this is called later for the main source file).
@@ -340,10 +425,17 @@ class multiple_files_t(writer.writer_t):
         file_pattern = self.extmodule.body.name + pattern
         file_path = os.path.join( self.directory_path, file_pattern )
         header_name = file_path + self.HEADER_EXT
-        self.write_file( header_name
-                         , self.create_header( file_pattern, self.create_function_code( function_name ) ) )
-        self.write_file( file_path + self.SOURCE_EXT
-                         , self.create_source( file_pattern, function_name, creators ))
+        source_name = file_path + self.SOURCE_EXT
+        fingerprint = self.create_input_fingerprint( function_name, creators )
+        if self.skip_unchanged_files( [ header_name, source_name ], fingerprint ):
+            self.consume_declaration_creators( self.get_declaration_creators( creators ) )
+        else:
+            self.write_file( header_name
+                             , self.create_header( file_pattern, self.create_function_code( function_name ) )
+                             , fingerprint )
+            self.write_file( source_name
+                             , lambda sink: self.write_source( sink, file_pattern, function_name, creators )
+                             , fingerprint )
 
         for creator in creators:
             creator.create = lambda: ''
@@ -403,5 +495,10 @@ class multiple_files_t(writer.writer_t):
             for creator in self.include_creators:
                 self.extmodule.adopt_include( creator )
             main_cpp = os.path.join( self.directory_path, self.extmodule.body.name + '.main.cpp' )
-            self.write_file( main_cpp, self.extmodule.create() + os.linesep )
+            def write_main( sink ):
+                self.extmodule.write( sink )
+                sink.write( os.linesep )
+            self.write_file( main_cpp, write_main )
         self.files_sum_repository.save_values()
+        if self.dependencies:
+            self.dependencies.save()
@@ -0,0 +1,119 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""
+defines functionality, which renders independent code creators in parallel
+
+Rendering of class and class wrapper code creators is a pure CPU bound work.
+The code creators tree is shared with forked worker processes, every worker
+renders the code of some creators and sends the result back. The generated code
+is "installed" on the creators and the writers assemble the files in the same,
+deterministic, order they do it without parallel rendering.
+"""
+
+import multiprocessing
+from pyplusplus import _logging_
+from pyplusplus import code_creators
+from . import creators_cache as creators_cache_module
+
+#the creators to be rendered by the worker processes, inherited on "fork"
+_creators = []
+_creators_cache = None
+_profiler = None
+
+def _init_worker():
+    if _profiler:
+        #forget the data, collected by the main process before the fork
+        _profiler.pop_state()
+        code_creators.code_creator_t.renderer = _profiler.create_renderer()
+
+def _render( index ):
+    code = _creators[ index ].create()
+    state = None
+    if _creators_cache:
+        state = _creators_cache.pop_state()
+    profile = None
+    if _profiler:
+        renderer = code_creators.code_creator_t.renderer
+        _profiler.add_phase_time( 'parallel rendering: workers', renderer.rendering_time )
+        renderer.rendering_time = 0.0
+        profile = _profiler.pop_state()
+    return code, state, profile
+
+def _create_prerendered( code ):
+    def prerendered():
+        return code
+    return prerendered
+
+def find_renderable_creators( extmodule, exclude=None ):
+    """returns list of code creators, which could be rendered in parallel
+
+    :param exclude: declarations, the creators of which should be rendered as is.
+                    For example classes, which are split to few files.
+    """
+    exclude = exclude or []
+    class_types = ( code_creators.class_t, code_creators.class_declaration_t )
+    answer = []
+    for creator in extmodule.body.creators:
+        if not isinstance( creator, class_types ):
+            continue
+        if creator.declaration.already_exposed or creator.declaration in exclude:
+            continue
+        answer.append( creator )
+        if isinstance( creator, code_creators.class_t ) and creator.wrapper:
+            answer.append( creator.wrapper )
+    answer = [ cc for cc in answer if creators_cache_module.is_cacheable( cc ) ]
+    return answer
+
+def prerender( extmodule, jobs, exclude=None, creators_cache=None, profiler=None ):
+    """renders class and class wrapper code creators using `jobs` worker processes
+
+    After this call :meth:`code_creators.code_creator_t.create` method of the
+    rendered creators returns the generated code.
+
+    :param jobs: number of worker processes
+    :param exclude: declarations, the creators of which should not be rendered
+    :param creators_cache: :class:`creators_cache_t` instance, applied on the module
+    :param profiler: :class:`utils.profiler_t` instance, the worker processes
+                     report the time they spent on rendering to it
+    :returns: number of rendered creators
+    """
+    global _creators, _creators_cache, _profiler
+    logger = _logging_.loggers.file_writer
+    if not jobs or jobs < 2:
+        return 0
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        logger.info( 'parallel rendering is not supported on this platform, "jobs" argument is ignored' )
+        return 0
+
+    creators = find_renderable_creators( extmodule, exclude )
+    if len( creators ) < 2:
+        return 0
+
+    _creators = creators
+    _creators_cache = creators_cache
+    if profiler and profiler.enabled:
+        _profiler = profiler
+    try:
+        context = multiprocessing.get_context( 'fork' )
+        pool = context.Pool( min( jobs, len( creators ) ), _init_worker )
+        try:
+            results = pool.map( _render, range( len( creators ) ) )
+        finally:
+            pool.close()
+            pool.join()
+    finally:
+        _creators = []
+        _creators_cache = None
+        _profiler = None
+
+    for creator, ( code, state, profile ) in zip( creators, results ):
+        creator.create = _create_prerendered( code )
+        if creators_cache and state:
+            creators_cache.merge_state( state )
+        if profile:
+            profiler.merge_state( profile )
+    logger.debug( '%d code creators were rendered using %d processes' % ( len( creators ), jobs ) )
+    return len( creators )
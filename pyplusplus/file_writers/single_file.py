@@ -29,5 +29,5 @@ class single_file_t(writer.writer_t):
         for header in headers:
             self.extmodule.add_include( header )
         self.write_code_repository( target_dir )
-        self.write_file( self.file_name, self.extmodule.create(), encoding=self.encoding )
+        self.write_file( self.file_name, self.extmodule.write, encoding=self.encoding )
         self.save_exposed_decls_db( target_dir )
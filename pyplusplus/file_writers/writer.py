@@ -9,6 +9,7 @@ import os
 import sys
 import time
 import codecs
+import filecmp
 from . import md5sum_repository
 from pyplusplus import utils
 from pyplusplus import _logging_
@@ -20,6 +21,22 @@ if sys.version_info.major == 3:
 else:
     timer = time.clock
 
+class file_sink_t( code_creators.sink_t ):
+    """writes code to a file and, optionally, calculates its hash on the fly"""
+
+    def __init__( self, fpath, encoding='ascii', hasher=None ):
+        code_creators.sink_t.__init__( self )
+        self.__file = codecs.open( fpath, 'w+b', encoding )
+        self.__hasher = hasher
+
+    def _write_impl( self, text ):
+        self.__file.write( text )
+        if self.__hasher:
+            self.__hasher.update( text )
+
+    def close( self ):
+        self.__file.close()
+
 class writer_t(object):
     """Base class for all module/code writers.
 
@@ -100,6 +117,13 @@ class writer_t(object):
                     self.write_file( destination_path, fdepend.code )
                     visited.add( fdepend.file_name )
 
+    @staticmethod
+    def create_file_header( fpath ):
+        if os.path.splitext( fpath )[1] == '.py':
+            return '# This file has been generated by Py++.' + os.linesep * 2
+        else:
+            return '// This file has been generated by Py++.' + os.linesep * 2
+
     @staticmethod
     def write_file( fpath, content, files_sum_repository=None, encoding='ascii' ):
         """Write a source file.
@@ -108,20 +132,32 @@ class writer_t(object):
         An additional fixed header is written at the top of the file before
         content.
 
+        If the content is a callable, it is called with :class:`file_sink_t`
+        instance and the code is streamed to the disk, without building it in
+        memory.
+
         :param fpath: File name
         :type fpath: str
-        :param content: The content of the file
-        :type content: str
+        :param content: The content of the file or callable, which writes it to a sink
+        :type content: str or callable
         """
+        if not isinstance( content, str ):
+            hasher = None
+            if files_sum_repository:
+                hasher = files_sum_repository.create_text_hasher()
+            if files_sum_repository and None is hasher:
+                #the repository is not able to calculate the hash piece by piece
+                sink = code_creators.string_sink_t()
+                content( sink )
+                content = sink.get_value()
+            else:
+                writer_t.__stream_file( fpath, content, files_sum_repository, hasher, encoding )
+                return
         fname = os.path.split( fpath )[1]
         writer_t.logger.debug( 'write code to file "%s" - started' % fpath )
         start_time = timer()
         fcontent_new = []
-        if os.path.splitext( fpath )[1] == '.py':
-            fcontent_new.append( '# This file has been generated by Py++.' )
-        else:
-            fcontent_new.append( '// This file has been generated by Py++.' )
-        fcontent_new.append( os.linesep * 2 )
+        fcontent_new.append( writer_t.create_file_header( fpath ) )
         fcontent_new.append( content )
         fcontent_new.append( os.linesep ) #keep gcc happy
         fcontent_new = ''.join( fcontent_new )
@@ -146,6 +182,8 @@ class writer_t(object):
             fcontent = f.read()
             f.close()
             if fcontent == fcontent_new:
+                if new_hash_value:
+                    files_sum_repository.update_value( fname, new_hash_value )
                 writer_t.logger.debug( 'file was not changed( content ) - done( %f seconds )'
                                        % ( timer() - start_time ) )
                 return
@@ -160,6 +198,51 @@ class writer_t(object):
             files_sum_repository.update_value( fname, new_hash_value )
         writer_t.logger.info( 'file "%s" - updated( %f seconds )' % ( fname, timer() - start_time ) )
 
+    @staticmethod
+    def __stream_file( fpath, content, files_sum_repository, hasher, encoding ):
+        fname = os.path.split( fpath )[1]
+        writer_t.logger.debug( 'stream code to file "%s" - started' % fpath )
+        start_time = timer()
+        tmp_fpath = fpath + '.tmp'
+        try:
+            sink = file_sink_t( tmp_fpath, encoding, hasher )
+            try:
+                sink.write( writer_t.create_file_header( fpath ) )
+                content( sink )
+                sink.write( os.linesep ) #keep gcc happy
+            finally:
+                sink.close()
+
+            new_hash_value = None
+            curr_hash_value = None
+            if files_sum_repository:
+                new_hash_value  = hasher.hexdigest()
+                curr_hash_value = files_sum_repository.get_file_value( fname )
+                if new_hash_value == curr_hash_value:
+                    writer_t.logger.debug( 'file was not changed( hash ) - done( %f seconds )'
+                                           % ( timer() - start_time ) )
+                    return
+
+            if None is curr_hash_value and os.path.exists( fpath ) \
+               and filecmp.cmp( fpath, tmp_fpath, shallow=False ):
+                if new_hash_value:
+                    files_sum_repository.update_value( fname, new_hash_value )
+                writer_t.logger.debug( 'file was not changed( content ) - done( %f seconds )'
+                                       % ( timer() - start_time ) )
+                return
+
+            writer_t.logger.debug( 'file changed or it does not exist' )
+
+            writer_t.create_backup( fpath )
+            os.replace( tmp_fpath, fpath )
+        finally:
+            #the file was not changed or the write failed
+            if os.path.exists( tmp_fpath ):
+                os.remove( tmp_fpath )
+        if new_hash_value:
+            files_sum_repository.update_value( fname, new_hash_value )
+        writer_t.logger.info( 'file "%s" - updated( %f seconds )' % ( fname, timer() - start_time ) )
+
     def get_user_headers( self, creators ):
         headers = []
         creators = [creator for creator in creators if isinstance( creator, code_creators.declaration_based_t )]
@@ -5,6 +5,7 @@
 from .transformer import transformer_t
 from . import transformers
 from .function_transformation import function_transformation_t
+from .transformers import OUTPUT_LIST, OUTPUT_MEMORYVIEW, OUTPUT_CALLER_BUFFER
 
 def output( *args, **keywd ):
     def creator( function ):
@@ -61,6 +62,11 @@ def input_c_buffer( *args, **keywd ):
         return transformers.input_c_buffer_t( function, *args, **keywd )
     return creator
 
+def input_buffer( *args, **keywd ):
+    def creator( function ):
+        return transformers.input_buffer_t( function, *args, **keywd )
+    return creator
+
 def transfer_ownership( *args, **keywd ):
     def creator( function ):
         return transformers.transfer_ownership_t( function, *args, **keywd )
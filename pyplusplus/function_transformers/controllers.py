@@ -146,6 +146,7 @@ class sealed_fun_controller_t( controller_base_t ):
         self.__pre_call = []
         self.__post_call = []
         self.__arg_expressions = [ arg.name for arg in function.arguments ]
+        self.__gil_release_var = None
 
     @property
     def variables( self ):
@@ -160,6 +161,13 @@ class sealed_fun_controller_t( controller_base_t ):
     @property 
     def result_variable( self ):
         return self.__result_var
+
+    @property
+    def gil_release_variable( self ):
+        """name of the variable, which releases the GIL during the function call"""
+        if None is self.__gil_release_var:
+            self.__gil_release_var = self.register_variable_name( 'gil_release' )
+        return self.__gil_release_var
     
     @property
     def template( self ):
@@ -10,6 +10,17 @@ from . import controllers
 from pygccxml import declarations
 from pyplusplus import code_repository
 
+def create_unique_name( function ):
+    """returns valid C++ identifier, unique for the function, which could be used as function wrapper name"""
+    obj = hashlib.md5()
+    if function.mangled: # free functions don't have a mangled value
+        obj.update( function.mangled.encode() )
+    else:
+        obj.update( function.decl_string.encode() )
+        obj.update( function.location.file_name.encode() )
+        obj.update( str( function.location.line ).encode() )
+    return function.name + '_' + obj.hexdigest()
+
 class function_transformation_t:
     """the class holds function transformation definition - all transformations that should be applied"""
     def __init__(self, function, transformer_creator, **keywd):
@@ -33,14 +44,7 @@ class function_transformation_t:
     @property
     def unique_name( self ):
         if None is self.__unique_name:
-            obj = hashlib.md5()
-            if self.__function.mangled: # free functions don't have a mangled value
-                obj.update( self.__function.mangled.encode() )
-            else:
-                obj.update( self.__function.decl_string.encode() )
-                obj.update( self.__function.location.file_name.encode() )
-                obj.update( str( self.__function.location.line ).encode() )
-            self.__unique_name = self.__function.name + '_' + obj.hexdigest ()
+            self.__unique_name = create_unique_name( self.__function )
         return self.__unique_name
 
     @property
@@ -66,6 +70,8 @@ class function_transformation_t:
             headers.extend( transformer.required_headers() )
         if self.__function.call_policies:
             headers.append( code_repository.call_policies.file_name )
+        if self.__function.does_release_gil():
+            headers.append( code_repository.gil_guard.file_name )
         return headers
 
     @property
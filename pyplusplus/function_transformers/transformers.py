@@ -341,6 +341,62 @@ class input_static_array_t(transformer.transformer_t):
         self.__configure_v_mem_fun_default( controller.default_controller )
 
 
+#result modes of "output_static_array" and "output_static_matrix" transformers:
+#  * OUTPUT_LIST - the output is copied to Python list
+#  * OUTPUT_MEMORYVIEW - the function writes directly to bytearray, which is
+#    returned as memoryview
+#  * OUTPUT_CALLER_BUFFER - the function writes directly to writable object,
+#    which supports buffer protocol and is passed by the caller
+OUTPUT_LIST = 'list'
+OUTPUT_MEMORYVIEW = 'memoryview'
+OUTPUT_CALLER_BUFFER = 'caller_buffer'
+OUTPUT_MODES = ( OUTPUT_LIST, OUTPUT_MEMORYVIEW, OUTPUT_CALLER_BUFFER )
+
+def _check_output_mode( function, transformation, arg, item_type, mode ):
+    from pyplusplus.decl_wrappers import python_traits
+    if mode not in OUTPUT_MODES:
+        raise ValueError( '%s\nunknown "%s" transformation mode "%s". Expected one of %s.' \
+                          % ( function, transformation, mode, ', '.join( OUTPUT_MODES ) ) )
+    if OUTPUT_LIST != mode and not python_traits.is_buffer_item( item_type ):
+        raise ValueError( '%s\nin order to use "%s" transformation in "%s" mode, argument %s items type must be a fundamental type (got %s).' \
+                          % ( function, transformation, mode, arg.name, item_type ) )
+
+def _configure_buffer_output( controller, arg, arg_index, item_type, mode, rows, columns=None ):
+    """configures the function wrapper, created for OUTPUT_MEMORYVIEW and OUTPUT_CALLER_BUFFER modes"""
+    if OUTPUT_MEMORYVIEW == mode:
+        controller.remove_wrapper_arg( arg.name )
+        if None is columns:
+            shape = '%d' % rows
+        else:
+            shape = '%d, %d' % ( rows, columns )
+        native_buffer = controller.declare_variable(
+                              declarations.dummy_type_t( "pyplusplus::buffers::output_buffer_t< %s >" % item_type.decl_string )
+                            , "native_" + arg.name
+                            , '( %s )' % shape )
+    else:
+        w_arg = controller.find_wrapper_arg( arg.name )
+        w_arg.decl_type = declarations.dummy_type_t( "boost::python::object" )
+        size = rows
+        if None is not columns:
+            size = rows * columns
+        native_buffer = controller.declare_variable(
+                              declarations.dummy_type_t( "pyplusplus::buffers::input_buffer_t< %s >" % item_type.decl_string )
+                            , "native_" + arg.name
+                            , '( %s, false, %d )' % ( w_arg.name, size ) )
+
+    if None is columns:
+        controller.modify_arg_expression( arg_index, '%s.data()' % native_buffer )
+    else:
+        controller.modify_arg_expression( arg_index
+                                          , 'reinterpret_cast< %s (*)[%d] >( %s.data() )'
+                                            % ( item_type.decl_string, columns, native_buffer ) )
+
+    if OUTPUT_MEMORYVIEW == mode:
+        py_buffer = controller.declare_variable( declarations.dummy_type_t( "boost::python::object" )
+                                                 , 'py_' + arg.name )
+        controller.add_post_call_code( '%s = %s.memoryview();' % ( py_buffer, native_buffer ) )
+        controller.return_variable( py_buffer )
+
 # s - static
 class output_static_array_t(transformer.transformer_t):
     """Handles an output array of a fixed size.
@@ -349,13 +405,15 @@ class output_static_array_t(transformer.transformer_t):
     # v will be a list with 3 floats
     """
 
-    def __init__(self, function, arg_ref, size):
+    def __init__(self, function, arg_ref, size, mode=OUTPUT_LIST):
         """Constructor.
 
         :param arg_ref: Index of the argument that is an output array
         :type arg_ref: int        
         :param size: The fixed size of the output array
         :type size: int
+        :param mode: how the output is returned to Python, one of :const:`OUTPUT_MODES`
+        :type mode: str
         """
         transformer.transformer_t.__init__( self, function )
         self.arg = self.get_argument( arg_ref )
@@ -367,16 +425,28 @@ class output_static_array_t(transformer.transformer_t):
 
         self.array_size = size
         self.array_item_type = declarations.array_item_type( self.arg.decl_type )
+        _check_output_mode( function, 'output_array', self.arg, self.array_item_type, mode )
+        self.mode = mode
 
     def __str__(self):
-        return "output_array(%s,%d)"%( self.arg.name, self.array_size)
+        if OUTPUT_LIST == self.mode:
+            return "output_array(%s,%d)"%( self.arg.name, self.array_size)
+        else:
+            return "output_array(%s,%d,%s)"%( self.arg.name, self.array_size, self.mode)
 
     def required_headers( self ):
         """Returns list of header files that transformer generated code depends on."""
-        return [ code_repository.convenience.file_name ]
+        if OUTPUT_LIST == self.mode:
+            return [ code_repository.convenience.file_name ]
+        else:
+            return [ code_repository.buffers.file_name ]
 
     def __configure_sealed(self, controller):
         global _arr2seq
+        if OUTPUT_LIST != self.mode:
+            _configure_buffer_output( controller, self.arg, self.arg_index
+                                      , self.array_item_type, self.mode, self.array_size )
+            return
         #removing arg from the function wrapper definition
         controller.remove_wrapper_arg( self.arg.name )
 
@@ -428,6 +498,8 @@ class output_static_array_t(transformer.transformer_t):
         self.__configure_sealed( controller )
 
     def configure_virtual_mem_fun( self, controller ):
+        if OUTPUT_CALLER_BUFFER == self.mode:
+            raise RuntimeError( '"output_static_array" transformation does not support virtual functions in "%s" mode.' % self.mode )
         self.__configure_v_mem_fun_override( controller.override_controller )
         self.__configure_v_mem_fun_default( controller.default_controller )
 
@@ -630,13 +702,15 @@ class output_static_matrix_t(transformer.transformer_t):
     # m will be a sequence of 3 sequences of 3 floats
     """
 
-    def __init__(self, function, arg_ref, rows, columns):
+    def __init__(self, function, arg_ref, rows, columns, mode=OUTPUT_LIST):
         """Constructor.
 
         :param arg_ref: Index of the argument that is an output matrix
         :type arg_ref: int
         :param rows, columns: The fixed size of the output matrix
         :type rows, columns: int
+        :param mode: how the output is returned to Python, one of :const:`OUTPUT_MODES`
+        :type mode: str
         
         """
         transformer.transformer_t.__init__( self, function )
@@ -651,16 +725,28 @@ class output_static_matrix_t(transformer.transformer_t):
         self.rows = rows
         self.columns = columns
         self.matrix_item_type = declarations.remove_const( declarations.array_item_type( declarations.array_item_type( self.arg.decl_type ) ) )
+        _check_output_mode( function, 'output_matrix', self.arg, self.matrix_item_type, mode )
+        self.mode = mode
 
     def __str__(self):
-        return "output_matrix(%s,%d,%d)"%( self.arg.name, self.rows, self.columns)
+        if OUTPUT_LIST == self.mode:
+            return "output_matrix(%s,%d,%d)"%( self.arg.name, self.rows, self.columns)
+        else:
+            return "output_matrix(%s,%d,%d,%s)"%( self.arg.name, self.rows, self.columns, self.mode)
 
     def required_headers( self ):
         """Returns list of header files that transformer generated code depends on."""
-        return [ code_repository.convenience.file_name ]
+        if OUTPUT_LIST == self.mode:
+            return [ code_repository.convenience.file_name ]
+        else:
+            return [ code_repository.buffers.file_name ]
 
     def __configure_sealed(self, controller):
         global _cmatrix2pymatrix
+        if OUTPUT_LIST != self.mode:
+            _configure_buffer_output( controller, self.arg, self.arg_index
+                                      , self.matrix_item_type, self.mode, self.rows, self.columns )
+            return
         #removing arg from the function wrapper definition
         controller.remove_wrapper_arg( self.arg.name )
 
@@ -917,6 +1003,98 @@ class input_c_buffer_t(transformer.transformer_t):
         self.__configure_v_mem_fun_override( controller.override_controller )
         self.__configure_v_mem_fun_default( controller.default_controller )
 
+# input_buffer_t
+class input_buffer_t(transformer.transformer_t):
+    """
+    handles an input of C buffer, using Python buffer protocol:
+
+    void write( byte \\*buffer, int size ) -> void write( object, which supports buffer protocol )
+
+    The buffer items type, the memory contiguity and the length are validated
+    and the pointer to the object memory is passed to the function, without
+    copying. If `allow_copy` is True, non contiguous objects are copied.
+    """
+
+    def __init__(self, function, buffer_arg_ref, size_arg_ref=None, allow_copy=False):
+        """Constructor.
+
+        :param buffer_arg_ref: "reference" to the buffer argument
+        :param size_arg_ref: "reference" to argument, which holds buffer size.
+                             It could be omitted, if the buffer argument is an array.
+        :param allow_copy: if True, non contiguous objects are copied to temporary buffer
+        """
+        transformer.transformer_t.__init__( self, function )
+        from pyplusplus.decl_wrappers import python_traits
+
+        self.buffer_arg = self.get_argument( buffer_arg_ref )
+        self.buffer_arg_index = self.function.arguments.index( self.buffer_arg )
+
+        if not is_ptr_or_array( self.buffer_arg.decl_type ):
+            raise ValueError( '%s\nin order to use "input_buffer" transformation, "buffer" argument %s type must be a array or a pointer (got %s).' \
+                              % ( function, self.buffer_arg.name, self.buffer_arg.decl_type ) )
+
+        self.buffer_item_type = declarations.array_item_type( self.buffer_arg.decl_type )
+        if not python_traits.is_buffer_item( self.buffer_item_type ):
+            raise ValueError( '%s\nin order to use "input_buffer" transformation, "buffer" argument %s items type must be a fundamental type (got %s).' \
+                              % ( function, self.buffer_arg.name, self.buffer_item_type ) )
+
+        self.size_arg = None
+        self.size_arg_index = None
+        if None is not size_arg_ref:
+            self.size_arg = self.get_argument( size_arg_ref )
+            self.size_arg_index = self.function.arguments.index( self.size_arg )
+            if not declarations.is_integral( self.size_arg.decl_type ):
+                raise ValueError( '%s\nin order to use "input_buffer" transformation, "size" argument %s type must be an integral type (got %s).' \
+                                  % ( function, self.size_arg.name, self.size_arg.decl_type ) )
+            self.buffer_size = -1
+        elif declarations.is_array( self.buffer_arg.decl_type ):
+            self.buffer_size = declarations.array_size( self.buffer_arg.decl_type )
+        else:
+            raise ValueError( '%s\nin order to use "input_buffer" transformation, "size" argument should be specified for pointer argument %s.' \
+                              % ( function, self.buffer_arg.name ) )
+
+        self.allow_copy = allow_copy
+
+    def __str__(self):
+        if self.size_arg:
+            return "input_buffer(buffer arg=%s, size arg=%s)" \
+                   % ( self.buffer_arg.name, self.size_arg.name)
+        else:
+            return "input_buffer(buffer arg=%s)" % self.buffer_arg.name
+
+    def required_headers( self ):
+        """Returns list of header files that transformer generated code depends on."""
+        return [ code_repository.buffers.file_name ]
+
+    def __configure_sealed(self, controller):
+        w_buffer_arg = controller.find_wrapper_arg( self.buffer_arg.name )
+        w_buffer_arg.decl_type = declarations.dummy_type_t( "boost::python::object" )
+
+        buffer_type = declarations.dummy_type_t( "pyplusplus::buffers::input_buffer_t< %s >"
+                                                 % self.buffer_item_type.decl_string )
+        buffer_var = controller.declare_variable(
+                          buffer_type
+                        , "native_" + self.buffer_arg.name
+                        , '( %s, %s, %d )' % ( w_buffer_arg.name
+                                               , str( bool( self.allow_copy ) ).lower()
+                                               , self.buffer_size ) )
+
+        controller.modify_arg_expression( self.buffer_arg_index, '%s.data()' % buffer_var )
+        if self.size_arg:
+            controller.remove_wrapper_arg( self.size_arg.name )
+            size_type = declarations.remove_const( declarations.remove_reference( self.size_arg.decl_type ) )
+            controller.modify_arg_expression( self.size_arg_index
+                                              , 'static_cast< %s >( %s.size() )' % ( size_type.decl_string, buffer_var ) )
+
+    def configure_mem_fun( self, controller ):
+        self.__configure_sealed( controller )
+
+    def configure_free_fun(self, controller ):
+        self.__configure_sealed( controller )
+
+    def configure_virtual_mem_fun( self, controller ):
+        raise NotImplementedError( '"input_buffer" transformation does not support virtual functions yet.' )
+
 class transfer_ownership_t(type_modifier_t):
     """see http://boost.org/libs/python/doc/v2/faq.html#ownership
     """
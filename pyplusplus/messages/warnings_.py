@@ -257,6 +257,29 @@ W1065 = code_generation_error(
             'Use `wrapper_alias` property to change class wrapper alias value'
             'Other classes : %s' )
 
+W1066 = warning(
+            'Classes depend on each other: %s. '
+            '`Py++` can not find out the registration order, which satisfies all dependencies. '
+            'Default values of some function arguments could be unavailable during the registration.' )
+
+W1067 = warning(
+            '`Py++` will not release the GIL during the function call - the function works on Python object of "%s" type.' )
+
+W1068 = warning(
+            '`Py++` will not release the GIL during the function call - the function is virtual and could be overridden in Python.' )
+
+W1069 = warning(
+            '`Py++` can not expose the variable using buffer protocol - its type is "%s". '
+            'Only one and two dimensional arrays of fundamental types, which are members of a class, are supported.' )
+
+W1070 = warning(
+            '`Py++` will not generate bulk access methods for "%s" container. '
+            'Only "std::vector" of fundamental types, except "bool", is supported.' )
+
+W1071 = warning(
+            '`Py++` will not generate thread safe override of the virtual function - the function has transformations. '
+            'The override could be called only from the thread, which holds the GIL.' )
+
 warnings = globals()
 
 all_warning_msgs = []
@@ -9,6 +9,9 @@ import time
 import types
 import warnings
 from . import module_builder
+from . import decls_snapshot
+from . import xml_generator_pool
+from . import location_scope
 
 from pygccxml import parser
 from pygccxml.utils import utils as pygccxml_utils
@@ -51,7 +54,11 @@ class builder_t(module_builder.module_builder_t):
                   , encoding='ascii'
                   , compiler=None
                   , gccxml_config=None
-                  , xml_generator_config=None):
+                  , xml_generator_config=None
+                  , profile=False
+                  , parse_jobs=1
+                  , xml_cache_dir=None
+                  , prune_out_of_scope=False):
         """
         :param files: list of files, declarations from them you want to export
         :type files: list of strings or :class:`parser.file_configuration_t` instances
@@ -76,11 +83,35 @@ class builder_t(module_builder.module_builder_t):
                               xml generator configuration. You can use this
                               argument instead of passing the compiler configuration separately.
 
+        :param profile: if True, `Py++` will measure time and number of calls of every code generation
+                        phase and code creator class. See :meth:`save_profile`.
+        :type profile: bool
+
+        :param parse_jobs: number of XML generator processes, which run concurrently in "file by file"
+                           compilation mode. The declarations trees are merged in the order of the files.
+        :type parse_jobs: int
+
+        :param xml_cache_dir: directory, where the generated XML files are kept and reused by the next runs,
+                              if the configuration and the parsed files were not changed.
+        :type xml_cache_dir: str
+
+        :param prune_out_of_scope: if True, declarations, which do not come from the parsed files or
+                                   directories, are removed from the declarations tree right after
+                                   parsing, unless declarations from the parsed files depend on them.
+                                   The declarations, which stay, are excluded as usual. See
+                                   :meth:`location_scope.location_scope_t.prune`.
+        :type prune_out_of_scope: bool
+
         :param gccxml_path: DEPRECATED
         :param gccxml_config: DEPRECATED
         """
         module_builder.module_builder_t.__init__( self, global_ns=None, encoding=encoding )
 
+        if profile:
+            self.__profiler = utils.profiler_t()
+        else:
+            self.__profiler = utils.dummy_profiler_t()
+
         # handle deprecated parameters
         if not gccxml_path == '' and xml_generator_path == '':
             xml_generator_path = gccxml_path
@@ -103,17 +134,22 @@ class builder_t(module_builder.module_builder_t):
                                    , parser.project_reader_t.get_os_file_names( files ) ))
         tmp = [os.path.split( file_ )[0] for file_ in self.__parsed_files]
         self.__parsed_dirs = [_f for _f in tmp if _f]
+        self.__location_scope = None
 
         self.global_ns = self.__parse_declarations( files
                                                     , xml_generator_config
                                                     , compilation_mode
                                                     , cache
-                                                    , indexing_suite_version)
+                                                    , indexing_suite_version
+                                                    , parse_jobs
+                                                    , xml_cache_dir
+                                                    , prune_out_of_scope)
         self.global_ns.decls(recursive=True, allow_empty=True)._code_generator = decl_wrappers.CODE_GENERATOR_TYPES.CTYPES
 
         self.__code_creator = None
         if optimize_queries:
-            self.run_query_optimizer()
+            with self.__profiler.phase( 'query optimizer' ):
+                self.run_query_optimizer()
 
         self.__declarations_code_head = []
         self.__declarations_code_tail = []
@@ -143,22 +179,44 @@ class builder_t(module_builder.module_builder_t):
         db.update_decls( self.global_ns )
 
 
-    def __parse_declarations( self, files, xml_generator_config, compilation_mode, cache, indexing_suite_version ):
+    def __parse_declarations( self, files, xml_generator_config, compilation_mode, cache, indexing_suite_version
+                              , parse_jobs=1, xml_cache_dir=None, prune_out_of_scope=False ):
         if None is xml_generator_config:
             xml_generator_config = parser.xml_generator_configuration_t()
         if None is compilation_mode:
             compilation_mode = parser.COMPILATION_MODE.FILE_BY_FILE
         start_time = timer()
         self.logger.debug( 'parsing files - started' )
-        reader = parser.project_reader_t( xml_generator_config, cache, decl_wrappers.dwfactory_t() )
-        decls = reader.read_files( files, compilation_mode )
+        generator_pool = None
+        if ( 1 < parse_jobs or xml_cache_dir ) \
+           and compilation_mode == parser.COMPILATION_MODE.FILE_BY_FILE:
+            generator_pool = xml_generator_pool.xml_generator_pool_t( xml_generator_config
+                                                                      , parse_jobs
+                                                                      , xml_cache_dir )
+        try:
+            if generator_pool:
+                with self.__profiler.phase( 'xml generation' ):
+                    files = generator_pool.generate( files )
+            with self.__profiler.phase( 'parsing' ):
+                reader = parser.project_reader_t( xml_generator_config, cache, decl_wrappers.dwfactory_t() )
+                decls = reader.read_files( files, compilation_mode )
+        finally:
+            if generator_pool:
+                generator_pool.cleanup()
 
         self.logger.debug( 'parsing files - done( %f seconds )' % ( timer() - start_time ) )
-        self.logger.debug( 'settings declarations defaults - started' )
 
         global_ns = decls_package.matcher.get_single(
                 decls_package.namespace_matcher_t( name='::' )
                 , decls )
+        if prune_out_of_scope:
+            start_time = timer()
+            with self.__profiler.phase( 'location scoping' ):
+                removed = self.location_scope.prune( global_ns )
+            self.logger.debug( 'removing out of scope declarations - done( %d declarations, %f seconds )'
+                               % ( removed, timer() - start_time ) )
+
+        self.logger.debug( 'settings declarations defaults - started' )
         if indexing_suite_version != 1:
             for cls in global_ns.classes():
                 cls.indexing_suite_version = indexing_suite_version
@@ -166,41 +224,125 @@ class builder_t(module_builder.module_builder_t):
                 cls.indexing_suite_version = indexing_suite_version
 
         start_time = timer()
-        self.__apply_decls_defaults(decls)
+        with self.__profiler.phase( 'declarations defaults' ):
+            self.__apply_decls_defaults(decls)
         self.logger.debug( 'settings declarations defaults - done( %f seconds )'
                            % ( timer() - start_time ) )
         return global_ns
 
-    def __filter_by_location( self, flatten_decls ):
-        for declaration in flatten_decls:
-            if not declaration.location:
-                continue
-            fpath = pygccxml_utils.normalize_path( declaration.location.file_name )
-            if pygccxml_utils.contains_parent_dir( fpath, self.__parsed_dirs ):
-                continue
-            if fpath in self.__parsed_files:
-                continue
-            found = False
-            for pfile in self.__parsed_files:
-                if fpath.endswith( pfile ):
-                    found = True
-                    break
-            if not found:
-                declaration.exclude()
-
     def __apply_decls_defaults(self, decls):
-        flatten_decls = decls_package.make_flatten( decls )
-        self.__filter_by_location( flatten_decls )
+        scope = self.location_scope
         call_policies_resolver = creators_factory.built_in_resolver_t()
-        calldefs = [declaration for declaration in flatten_decls if isinstance( declaration, decls_package.calldef_t )]
-        for calldef in calldefs:
-            calldef.set_call_policies( call_policies_resolver( calldef ) )
-        mem_vars = [declaration for declaration in flatten_decls if isinstance( declaration, decls_package.variable_t )
-                                        and isinstance( declaration.parent, decls_package.class_t )]
-        for mem_var in mem_vars:
-            mem_var.set_getter_call_policies( call_policies_resolver( mem_var, 'get' ) )
-        for mem_var in mem_vars:
-            mem_var.set_setter_call_policies( call_policies_resolver( mem_var, 'set' ) )
+        calldef_type = decls_package.calldef_t
+        variable_type = decls_package.variable_t
+        class_type = decls_package.class_t
+        for declaration in decls_package.make_flatten( decls ):
+            if not scope.is_decl_in_scope( declaration ):
+                declaration.exclude()
+            if isinstance( declaration, calldef_type ):
+                declaration.set_call_policies( call_policies_resolver( declaration ) )
+            elif isinstance( declaration, variable_type ) \
+                 and isinstance( declaration.parent, class_type ):
+                declaration.set_getter_call_policies( call_policies_resolver( declaration, 'get' ) )
+                declaration.set_setter_call_policies( call_policies_resolver( declaration, 'set' ) )
+
+    @property
+    def location_scope( self ):
+        """
+        reference to :class:`location_scope.location_scope_t` instance, which
+        decides whether the declaration comes from the parsed files or directories
+        """
+        if None is self.__location_scope:
+            self.__location_scope = location_scope.location_scope_t( self.__parsed_files
+                                                                     , self.__parsed_dirs )
+        return self.__location_scope
+
+    @property
+    def profiler( self ):
+        """reference to :class:`utils.profiler_t` instance, if profiling is enabled"""
+        return self.__profiler
+
+    def save_profile( self, file_name ):
+        """
+        writes time and number of calls of every code generation phase, code creator
+        class and the slowest declarations to the file
+
+        The report is written in JSON format, if the file has ".json" extension,
+        and as text otherwise.
+        """
+        if not self.__profiler.enabled:
+            raise RuntimeError( "Profiling is disabled. Did you forget to pass profile=True to the constructor?" )
+        self.__profiler.save( file_name )
+
+    #state, which is not saved to the declarations snapshot
+    __NOT_SNAPSHOT_STATE = ( 'logger', '_builder_t__profiler', '_builder_t__code_creator'
+                             , '_builder_t__location_scope' )
+
+    def save_snapshot( self, file_name, dependencies=None ):
+        """
+        writes the configured declarations tree - including all `Py++` settings
+        and the user code - to the file. Next time, :meth:`load_snapshot` restores
+        the builder, without parsing the files and running the configuration code.
+
+        .. code-block:: python
+
+           mb = module_builder_t.load_snapshot( 'my_module.snapshot', dependencies=[ __file__ ] )
+           if not mb:
+               mb = module_builder_t( files, ... )
+               ...configure the declarations...
+               mb.save_snapshot( 'my_module.snapshot', dependencies=[ __file__ ] )
+           mb.build_code_creator( 'my_module' )
+
+        :param dependencies: files, the configuration depends on, usually the
+                             code generation script. The parsed files and the
+                             files, the declarations come from, are tracked
+                             automatically.
+        :type dependencies: list of strings
+        """
+        optimized = self.global_ns._optimized
+        if optimized:
+            self.global_ns.clear_optimizer()
+        try:
+            state = dict( [ ( name, value ) for name, value in self.__dict__.items()
+                            if name not in self.__NOT_SNAPSHOT_STATE ] )
+            state[ 'query_optimizer' ] = optimized
+            files = decls_snapshot.collect_files( self.global_ns, self.__parsed_files, dependencies )
+            decls_snapshot.save( file_name, state, files )
+        finally:
+            if optimized:
+                self.global_ns.init_optimizer()
+
+    @staticmethod
+    def load_snapshot( file_name, dependencies=None, profile=False ):
+        """
+        restores the builder, saved by :meth:`save_snapshot`
+
+        Returns None, if the snapshot does not exist or the files it depends
+        on were changed.
+
+        :param dependencies: the same files, passed to :meth:`save_snapshot`
+        :param profile: see :meth:`__init__` documentation
+        :rtype: :class:`builder_t` or None
+        """
+        if profile:
+            profiler = utils.profiler_t()
+        else:
+            profiler = utils.dummy_profiler_t()
+        with profiler.phase( 'loading snapshot' ):
+            state = decls_snapshot.load( file_name, dependencies )
+        if None is state:
+            return None
+        optimized = state.pop( 'query_optimizer' )
+        mb = builder_t.__new__( builder_t )
+        mb.__dict__.update( state )
+        mb.logger = _logging_.loggers.module_builder
+        mb.__profiler = profiler
+        mb.__code_creator = None
+        mb.__location_scope = None
+        if optimized:
+            with mb.__profiler.phase( 'query optimizer' ):
+                mb.run_query_optimizer()
+        return mb
 
     @property
     def declarations_code_head( self ):
@@ -229,7 +371,10 @@ class builder_t(module_builder.module_builder_t):
                        , types_db=None
                        , target_configuration=None
                        , enable_indexing_suite=True
-                       , doc_extractor=None):
+                       , doc_extractor=None
+                       , order_overloads=False
+                       , calls_profile=None
+                       , count_calls=False):
         """
         Creates :class:`code_creators.bpmodule_t` code creator.
 
@@ -244,7 +389,18 @@ class builder_t(module_builder.module_builder_t):
 
         :param doc_extractor: callable, that takes as argument reference to declaration and returns documentation string
         :type doc_extractor: callable or None
+
+        :param order_overloads: register overloaded functions in the order, which makes Boost.Python to try the most specific overload first
+        :type order_overloads: bool
+
+        :param calls_profile: number of calls of the exposed functions. The frequently called overloads are tried first. It implies "order_overloads".
+        :type calls_profile: :class:`utils.call_profile_t` or file name
+
+        :param count_calls: generate code, which counts calls of the exposed functions and the time spent on them. The statistics is returned by "__pypp_stats__" module function, it could be saved in JSON format and used as "calls_profile".
+        :type count_calls: bool
         """
+        if calls_profile and not isinstance( calls_profile, utils.call_profile_t ):
+            calls_profile = utils.call_profile_t.load( calls_profile )
 
         creator = creators_factory.bpcreator_t( self.global_ns
                                                 , module_name
@@ -252,12 +408,46 @@ class builder_t(module_builder.module_builder_t):
                                                 , call_policies_resolver_
                                                 , types_db
                                                 , target_configuration
-                                                , enable_indexing_suite )
+                                                , enable_indexing_suite
+                                                , self.__profiler
+                                                , order_overloads
+                                                , calls_profile
+                                                , count_calls )
         self.__code_creator = creator.create()
         self.__code_creator.replace_included_headers(self.__parsed_files)
-        self.__code_creator.update_documentation( doc_extractor )
+        with self.__profiler.phase( 'documentation' ):
+            self.__code_creator.update_documentation( doc_extractor )
         return self.__code_creator
 
+    def hot_calldefs( self, calls_profile, min_calls=1, count=None ):
+        """
+        returns functions, which were called at least "min_calls" times, the
+        most frequently called functions come first.
+
+        The result could be used to configure the hot functions: release the
+        GIL, apply zero-copy transformations, etc.
+
+        .. code-block:: python
+
+           mb.hot_calldefs( 'calls_profile.json', count=100 ).release_gil = True
+
+        :param calls_profile: number of calls of the exposed functions
+        :type calls_profile: :class:`utils.call_profile_t` or file name
+        :param count: the maximal number of functions to return, all if None
+        :rtype: :class:`pygccxml.declarations.mdecl_wrapper_t`
+        """
+        if not isinstance( calls_profile, utils.call_profile_t ):
+            calls_profile = utils.call_profile_t.load( calls_profile )
+        calls = []
+        for calldef in self.global_ns.calldefs( allow_empty=True ):
+            calldef_calls = calls_profile.calls( calldef )
+            if calldef_calls and min_calls <= calldef_calls:
+                calls.append( ( calldef_calls, calldef ) )
+        calls.sort( key=lambda item: -item[0] )
+        if None is not count:
+            calls = calls[ : count ]
+        return decls_package.mdecl_wrapper_t( [ calldef for calldef_calls, calldef in calls ] )
+
     @property
     def code_creator( self ):
         "reference to :class:`code_creators.bpmodule_t` instance"
@@ -313,6 +503,10 @@ class builder_t(module_builder.module_builder_t):
 
 
     def __merge_user_code( self ):
+        with self.__profiler.phase( 'merging user code' ):
+            self.__merge_user_code_impl()
+
+    def __merge_user_code_impl( self ):
         for code in self.__declarations_code_tail:
             self.code_creator.add_declaration_code( code, -1 )
 
@@ -328,18 +522,59 @@ class builder_t(module_builder.module_builder_t):
             body.adopt_creator( code_creators.custom_text_t( code ), 0 )
 
 
-    def write_module( self, file_name ):
+    def __create_files_sum_repository( self, dir_name, use_files_sum_repository, use_manifest ):
+        if use_manifest:
+            cache_file = os.path.join( dir_name, self.code_creator.body.name + '.manifest' )
+            return file_writers.manifest_t( cache_file )
+        if use_files_sum_repository:
+            cache_file = os.path.join( dir_name, self.code_creator.body.name + '.md5.sum' )
+            return file_writers.cached_repository_t( cache_file )
+        return None
+
+    def __create_creators_cache( self, cache_file, use_creators_cache ):
+        if not use_creators_cache:
+            return None
+        with self.__profiler.phase( 'creators cache' ):
+            creators_cache = file_writers.creators_cache_t( cache_file )
+            creators_cache.apply( self.code_creator )
+        return creators_cache
+
+    def __save_creators_cache( self, creators_cache ):
+        if creators_cache:
+            with self.__profiler.phase( 'creators cache' ):
+                creators_cache.save()
+
+    def __prerender( self, jobs, exclude=None, creators_cache=None ):
+        with self.__profiler.phase( 'parallel rendering' ):
+            file_writers.prerender( self.code_creator, jobs, exclude, creators_cache, self.__profiler )
+
+    def __create_dependencies_file_name( self, dir_name, write_dependencies ):
+        if not write_dependencies:
+            return None
+        return os.path.join( dir_name, self.code_creator.body.name + '.deps.json' )
+
+    def write_module( self, file_name, use_creators_cache=False ):
         """
         Writes module to a single file
 
         :param file_name: file name
         :type file_name: string
 
+        :param use_creators_cache: `Py++` can save the code, generated by every class and
+                                   free function code creator, to a file. Next time you generate
+                                   code, the code of unchanged declarations will be taken from the file.
         """
         self.__merge_user_code()
-        file_writers.write_file( self.code_creator, file_name, encoding=self.encoding )
+        creators_cache = self.__create_creators_cache( file_name + '.creators.cache', use_creators_cache )
+        with self.__profiler.rendering_phase( 'writing files' ):
+            file_writers.write_file( self.code_creator, file_name, encoding=self.encoding )
+        self.__save_creators_cache( creators_cache )
 
     def __work_on_unused_files( self, dir_name, written_files, on_unused_file_found ):
+        with self.__profiler.phase( 'unused files' ):
+            self.__work_on_unused_files_impl( dir_name, written_files, on_unused_file_found )
+
+    def __work_on_unused_files_impl( self, dir_name, written_files, on_unused_file_found ):
         all_files = os.listdir( dir_name )
         all_files = [os.path.join( dir_name, fname ) for fname in all_files]
         all_files = list(filter( file_writers.has_pypp_extenstion, all_files ))
@@ -357,7 +592,11 @@ class builder_t(module_builder.module_builder_t):
                       , dir_name
                       , huge_classes=None
                       , on_unused_file_found=os.remove
-                      , use_files_sum_repository=False):
+                      , use_files_sum_repository=False
+                      , use_creators_cache=False
+                      , jobs=1
+                      , write_dependencies=False
+                      , use_manifest=False):
         """
         writes module to multiple files
 
@@ -372,28 +611,56 @@ class builder_t(module_builder.module_builder_t):
         :param use_files_sum_repository: `Py++` can generate file, which will contain `md5` sum of every generated file.
                                           Next time you generate code, md5sum will be loaded from the file and compared.
                                           This could speed-up code generation process by 10-15%.
+
+        :param use_manifest: `Py++` can generate "<module name>.manifest" file instead of "<module name>.md5.sum" one.
+                             The manifest also contains fingerprint of the code creators, every file was generated from.
+                             Next time you generate code, the files, generated from unchanged code creators,
+                             are neither rendered nor written. The option implies `use_files_sum_repository`.
+
+        :param use_creators_cache: `Py++` can save the code, generated by every class and
+                                   free function code creator, to a file. Next time you generate
+                                   code, the code of unchanged declarations will be taken from the file.
+
+        :param jobs: number of processes, used to render the code of classes. The files are
+                     written in the same order and with the same content as without this option.
+
+        :param write_dependencies: if True, `Py++` will write "<module name>.deps.json" file, which maps
+                                   every generated translation unit to the input and generated headers it
+                                   includes, and "<module name>.deps.d" Make\\Ninja depfile.
+                                   :func:`file_writers.is_generation_required` uses the JSON file to
+                                   tell whether the code should be generated again.
         """
         self.__merge_user_code()
 
-        files_sum_repository = None
-        if use_files_sum_repository:
-            cache_file = os.path.join( dir_name, self.code_creator.body.name + '.md5.sum' )
-            files_sum_repository = file_writers.cached_repository_t( cache_file )
+        files_sum_repository = self.__create_files_sum_repository( dir_name
+                                                                   , use_files_sum_repository
+                                                                   , use_manifest )
+
+        creators_cache = self.__create_creators_cache(
+            os.path.join( dir_name, self.code_creator.body.name + '.creators.cache' )
+            , use_creators_cache )
+        self.__prerender( jobs, huge_classes, creators_cache )
+
+        dependencies_file = self.__create_dependencies_file_name( dir_name, write_dependencies )
 
         written_files = []
-        if None is huge_classes:
-            written_files = file_writers.write_multiple_files(
-                                self.code_creator
-                                , dir_name
-                                , files_sum_repository=files_sum_repository
-                                , encoding=self.encoding)
-        else:
-            written_files = file_writers.write_class_multiple_files(
-                                self.code_creator
-                                , dir_name
-                                , huge_classes
-                                , files_sum_repository=files_sum_repository
-                                , encoding=self.encoding)
+        with self.__profiler.rendering_phase( 'writing files' ):
+            if None is huge_classes:
+                written_files = file_writers.write_multiple_files(
+                                    self.code_creator
+                                    , dir_name
+                                    , files_sum_repository=files_sum_repository
+                                    , encoding=self.encoding
+                                    , dependencies_file=dependencies_file)
+            else:
+                written_files = file_writers.write_class_multiple_files(
+                                    self.code_creator
+                                    , dir_name
+                                    , huge_classes
+                                    , files_sum_repository=files_sum_repository
+                                    , encoding=self.encoding
+                                    , dependencies_file=dependencies_file)
+        self.__save_creators_cache( creators_cache )
         self.__work_on_unused_files( dir_name, written_files, on_unused_file_found )
 
         return written_files
@@ -402,7 +669,13 @@ class builder_t(module_builder.module_builder_t):
                                , dir_name
                                , number_of_files
                                , on_unused_file_found=os.remove
-                               , use_files_sum_repository=False):
+                               , use_files_sum_repository=False
+                               , use_creators_cache=False
+                               , jobs=1
+                               , write_dependencies=False
+                               , balancing='count'
+                               , compile_times=None
+                               , use_manifest=False):
         """
         Writes module to fixed number of multiple cpp files
 
@@ -418,19 +691,56 @@ class builder_t(module_builder.module_builder_t):
         :param use_files_sum_repository: `Py++` can generate file, which will contain md5 sum of every generated file.
                                           Next time you generate code, md5sum will be loaded from the file and compared.
                                           This could speed-up code generation process by 10-15%.
+
+        :param use_manifest: `Py++` can generate "<module name>.manifest" file instead of "<module name>.md5.sum" one.
+                             The manifest also contains fingerprint of the code creators, every file was generated from.
+                             Next time you generate code, the files, generated from unchanged code creators,
+                             are neither rendered nor written. The option implies `use_files_sum_repository`.
+
+        :param use_creators_cache: `Py++` can save the code, generated by every class and
+                                   free function code creator, to a file. Next time you generate
+                                   code, the code of unchanged declarations will be taken from the file.
+
+        :param jobs: number of processes, used to render the code of classes. The files are
+                     written in the same order and with the same content as without this option.
+
+        :param write_dependencies: if True, `Py++` will write "<module name>.deps.json" file, which maps
+                                   every generated translation unit to the input and generated headers it
+                                   includes, and "<module name>.deps.d" Make\\Ninja depfile.
+                                   :func:`file_writers.is_generation_required` uses the JSON file to
+                                   tell whether the code should be generated again.
+
+        :param balancing: "count" - every file contains the same number of classes,
+                          "cost" - every file contains classes with the same estimated compile cost
+        :type balancing: str
+
+        :param compile_times: compile time, in seconds, of every source file, generated by the previous run.
+                              It is used to correct the estimated compile cost of classes, when balancing is "cost".
+        :type compile_times: dictionary { file name : seconds } or JSON file name
         """
         self.__merge_user_code()
 
-        files_sum_repository = None
-        if use_files_sum_repository:
-            cache_file = os.path.join( dir_name, self.code_creator.body.name + '.md5.sum' )
-            files_sum_repository = file_writers.cached_repository_t( cache_file )
-
-        written_files = file_writers.write_balanced_files( self.code_creator
-                                                           , dir_name
-                                                           , number_of_buckets=number_of_files
-                                                           , files_sum_repository=files_sum_repository
-                                                           , encoding=self.encoding)
+        files_sum_repository = self.__create_files_sum_repository( dir_name
+                                                                   , use_files_sum_repository
+                                                                   , use_manifest )
+
+        creators_cache = self.__create_creators_cache(
+            os.path.join( dir_name, self.code_creator.body.name + '.creators.cache' )
+            , use_creators_cache )
+        self.__prerender( jobs, creators_cache=creators_cache )
+
+        dependencies_file = self.__create_dependencies_file_name( dir_name, write_dependencies )
+
+        with self.__profiler.rendering_phase( 'writing files' ):
+            written_files = file_writers.write_balanced_files( self.code_creator
+                                                               , dir_name
+                                                               , number_of_buckets=number_of_files
+                                                               , files_sum_repository=files_sum_repository
+                                                               , encoding=self.encoding
+                                                               , dependencies_file=dependencies_file
+                                                               , balancing=balancing
+                                                               , compile_times=compile_times)
+        self.__save_creators_cache( creators_cache )
 
         self.__work_on_unused_files( dir_name, written_files, on_unused_file_found )
 
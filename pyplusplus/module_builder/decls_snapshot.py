@@ -0,0 +1,109 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""
+defines functionality, which saves and restores the configured declarations
+tree
+
+The snapshot contains the declarations tree, including all `Py++` settings
+(ignore, alias, call policies, transformations, user code, disabled messages,
+...), and signatures of the files it depends on: the parsed files, files
+the declarations come from and the files, provided by user - usually the code
+generation script. The snapshot is valid, while all those files are unchanged.
+"""
+
+import os
+import sys
+import gzip
+import pickle
+import hashlib
+import pygccxml
+import pyplusplus
+from pygccxml import declarations
+from pygccxml.utils import utils as pygccxml_utils
+from pyplusplus import _logging_
+
+SNAPSHOT_VERSION = 1
+
+#deep declarations trees exceed the default limit
+RECURSION_LIMIT = 20000
+
+def file_signature( file_name ):
+    """returns md5 of the file content or None, if the file does not exist"""
+    if not os.path.isfile( file_name ):
+        return None
+    md5 = hashlib.md5()
+    with open( file_name, 'rb' ) as f:
+        md5.update( f.read() )
+    return md5.hexdigest()
+
+def _normalize( file_name ):
+    return pygccxml_utils.normalize_path( os.path.abspath( file_name ) )
+
+def collect_files( global_ns, parsed_files, dependencies=None ):
+    """returns set of files, the declarations tree depends on"""
+    files = set( [ _normalize( f ) for f in parsed_files ] )
+    files.update( [ _normalize( f ) for f in dependencies or [] ] )
+    for decl in declarations.make_flatten( global_ns ):
+        if decl.location and decl.location.file_name:
+            files.add( _normalize( decl.location.file_name ) )
+    return files
+
+class _recursion_limit_t( object ):
+    def __enter__( self ):
+        self.limit = sys.getrecursionlimit()
+        sys.setrecursionlimit( max( self.limit, RECURSION_LIMIT ) )
+        return self
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        sys.setrecursionlimit( self.limit )
+        return False
+
+def save( file_name, state, files ):
+    """
+    writes the snapshot to the file
+
+    :param state: picklable object, which contains the declarations tree
+    :param files: files, the state depends on
+    """
+    snapshot = dict( version=SNAPSHOT_VERSION
+                     , pyplusplus_version=pyplusplus.__version__
+                     , pygccxml_version=pygccxml.__version__
+                     , signatures=dict( [ ( f, file_signature( f ) ) for f in files ] )
+                     , state=state )
+    with _recursion_limit_t():
+        with gzip.open( file_name, 'wb', compresslevel=1 ) as f:
+            pickle.dump( snapshot, f, pickle.HIGHEST_PROTOCOL )
+
+def load( file_name, dependencies=None ):
+    """
+    returns the state, saved by :func:`save`, or None if the snapshot does not
+    exist or it is out of date
+    """
+    logger = _logging_.loggers.module_builder
+    if not os.path.exists( file_name ):
+        return None
+    try:
+        with _recursion_limit_t():
+            with gzip.open( file_name, 'rb' ) as f:
+                snapshot = pickle.load( f )
+    except Exception as error:
+        logger.info( 'unable to load declarations snapshot "%s": %s' % ( file_name, error ) )
+        return None
+    if snapshot.get( 'version' ) != SNAPSHOT_VERSION \
+       or snapshot.get( 'pyplusplus_version' ) != pyplusplus.__version__ \
+       or snapshot.get( 'pygccxml_version' ) != pygccxml.__version__:
+        logger.info( 'declarations snapshot "%s" was created by another version' % file_name )
+        return None
+    signatures = snapshot[ 'signatures' ]
+    for dependency in dependencies or []:
+        if _normalize( dependency ) not in signatures:
+            logger.info( 'declarations snapshot "%s" does not depend on "%s"' % ( file_name, dependency ) )
+            return None
+    for f, signature in signatures.items():
+        if signature != file_signature( f ):
+            logger.info( 'declarations snapshot "%s" is out of date: "%s" was changed' % ( file_name, f ) )
+            return None
+    return snapshot[ 'state' ]
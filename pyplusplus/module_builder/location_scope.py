@@ -0,0 +1,161 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""
+defines class, which decides whether the declaration location belongs to the
+parsed files and directories, and removes the declarations, which do not
+belong to them, from the declarations tree
+"""
+
+from pygccxml import declarations
+from pygccxml.utils import utils as pygccxml_utils
+
+class _trie_t( object ):
+    """character based trie, which answers whether one of the strings is a prefix of the given string"""
+
+    #the key, which marks the end of the string
+    END = None
+
+    def __init__( self, strings=None ):
+        object.__init__( self )
+        self.__root = {}
+        for string in strings or []:
+            self.add( string )
+
+    def add( self, string ):
+        node = self.__root
+        for ch in string:
+            node = node.setdefault( ch, {} )
+        node[ self.END ] = True
+
+    def has_prefix_of( self, string ):
+        """returns True, if one of the strings is a prefix of the given string"""
+        node = self.__root
+        if self.END in node:
+            return True
+        for ch in string:
+            node = node.get( ch )
+            if None is node:
+                return False
+            if self.END in node:
+                return True
+        return False
+
+class location_scope_t( object ):
+    """
+    decides whether the file belongs to the parsed files or directories
+
+    The file is in the scope, if its normalized path starts with one of the
+    parsed directories or ends with one of the parsed files. The answers are
+    memoized per file name, so the paths are normalized and matched once per
+    file and not once per declaration.
+    """
+
+    def __init__( self, parsed_files, parsed_dirs ):
+        object.__init__( self )
+        self.__dirs = _trie_t( parsed_dirs )
+        #suffixes are matched by walking the reversed strings
+        self.__files = _trie_t( [ f[::-1] for f in parsed_files ] )
+        self.__answers = {}
+
+    def __is_in_scope( self, file_name ):
+        fpath = pygccxml_utils.normalize_path( file_name )
+        return self.__dirs.has_prefix_of( fpath ) or self.__files.has_prefix_of( fpath[::-1] )
+
+    def is_in_scope( self, file_name ):
+        """returns True, if the file belongs to the parsed files or directories"""
+        try:
+            return self.__answers[ file_name ]
+        except KeyError:
+            answer = self.__answers[ file_name ] = self.__is_in_scope( file_name )
+            return answer
+
+    def is_decl_in_scope( self, decl ):
+        """returns True, if the declaration has no location or its file is in the scope"""
+        location = decl.location
+        if not location:
+            return True
+        return self.is_in_scope( location.file_name )
+
+    @staticmethod
+    def __dig_declarations( type_ ):
+        #unlike declarations.dependency_info_t.find_out_depend_on_it_declarations,
+        #typedefs are reported too, so they stay in the tree
+        while True:
+            if isinstance( type_, declarations.declaration_t ):
+                return [ type_ ]
+            elif isinstance( type_, declarations.declarated_t ):
+                return [ type_.declaration ]
+            elif isinstance( type_, declarations.compound_t ):
+                type_ = type_.base
+            elif isinstance( type_, declarations.calldef_type_t ):
+                answer = location_scope_t.__dig_declarations( type_.return_type )
+                for arg_type in type_.arguments_types:
+                    answer.extend( location_scope_t.__dig_declarations( arg_type ) )
+                if isinstance( type_, declarations.member_function_type_t ):
+                    answer.extend( location_scope_t.__dig_declarations( type_.class_inst ) )
+                return answer
+            else:
+                return []
+
+    def prune( self, global_ns ):
+        """
+        removes the declarations, which do not belong to the scope, from the
+        declarations tree
+
+        The declarations out of the scope, the declarations from the scope depend
+        on, directly or indirectly, stay in the tree. Classes stay with all their
+        members. Namespaces stay, if they contain declarations, which stay.
+
+        Returns the number of removed declarations.
+        """
+        kept = set()
+        pending = []
+
+        def keep( decl ):
+            if id( decl ) in kept:
+                return
+            kept.add( id( decl ) )
+            pending.append( decl )
+            parent = decl.parent
+            while parent and id( parent ) not in kept:
+                if isinstance( parent, declarations.class_t ):
+                    keep( parent )
+                    break
+                kept.add( id( parent ) )
+                parent = parent.parent
+
+        for decl in declarations.make_flatten( global_ns ):
+            if not isinstance( decl, declarations.namespace_t ) and self.is_decl_in_scope( decl ):
+                keep( decl )
+
+        classes = []
+        while pending:
+            decl = pending.pop()
+            if isinstance( decl, declarations.class_t ):
+                classes.append( decl )
+                for member in decl.declarations:
+                    keep( member )
+            for dependency in declarations.get_dependencies_from_decl( decl, recursive=False ):
+                for ddecl in self.__dig_declarations( dependency.depend_on_it ):
+                    keep( ddecl )
+
+        removed = 0
+        namespaces = [ global_ns ]
+        while namespaces:
+            ns = namespaces.pop()
+            decls = []
+            for decl in ns.declarations:
+                if id( decl ) not in kept:
+                    removed += len( declarations.make_flatten( decl ) )
+                    continue
+                decls.append( decl )
+                if isinstance( decl, declarations.namespace_t ):
+                    namespaces.append( decl )
+            ns.declarations = decls
+        for class_ in classes:
+            class_.derived = [ hi for hi in class_.derived if id( hi.related_class ) in kept ]
+        global_ns.clear_optimizer()
+        return removed
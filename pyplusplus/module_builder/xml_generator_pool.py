@@ -0,0 +1,185 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""
+defines class, which runs the XML generator on the project files concurrently
+
+In "file by file" compilation mode, pygccxml invokes the XML generator once per
+file, sequentially. The XML generator invocations are independent processes,
+so they are started concurrently, before pygccxml reads the files. The source
+files are replaced by the generated XML files in the same order, so pygccxml
+reads and merges the declarations trees exactly as it does without the pool.
+
+The generated files could be kept in the cache directory and reused by the
+next runs. The cached file is valid, if the configuration is the same and the
+source file and all the files it includes were not modified since the file was
+generated.
+"""
+
+import os
+import re
+import json
+import shutil
+import hashlib
+import tempfile
+from multiprocessing.pool import ThreadPool
+from xml.sax.saxutils import unescape
+from pygccxml import parser
+from pyplusplus import _logging_
+
+FC = parser.file_configuration_t
+
+class xml_generator_pool_t( object ):
+    """
+    generates XML files for the project files, using few XML generator
+    processes concurrently
+    """
+
+    DEPENDENCIES_EXT = '.deps'
+
+    def __init__( self, config, jobs=1, cache_dir=None ):
+        """
+        :param config: :class:`parser.xml_generator_configuration_t` instance
+        :param jobs: number of XML generator processes to run concurrently
+        :param cache_dir: directory, where the generated files are kept between
+                          runs. If None, the files are generated in the temporary
+                          directory and removed by :meth:`cleanup`.
+        """
+        object.__init__( self )
+        self.logger = _logging_.loggers.module_builder
+        self.__config = config
+        self.__jobs = max( 1, jobs or 1 )
+        self.__cache_dir = cache_dir
+        self.__temp_dir = None
+        self.hits = 0
+        self.misses = 0
+
+    def __find_file( self, file_name ):
+        if os.path.isfile( file_name ):
+            return os.path.abspath( file_name )
+        search_dirs = [ self.__config.working_directory ] + list( self.__config.include_paths )
+        for dir_ in search_dirs:
+            file_path = os.path.join( dir_, file_name )
+            if os.path.isfile( file_path ):
+                return os.path.abspath( file_path )
+        raise RuntimeError( "file '%s' does not exist" % file_name )
+
+    def __create_config( self, start_with_declarations ):
+        config = self.__config.clone()
+        del config.start_with_declarations[:]
+        config.start_with_declarations.extend( start_with_declarations )
+        return config
+
+    @staticmethod
+    def create_key( config, source_file ):
+        """returns the string, which identifies the XML file, generated from the source file"""
+        items = [ source_file ]
+        for name in ( 'xml_generator', 'xml_generator_path', 'working_directory'
+                      , 'include_paths', 'define_symbols', 'undefine_symbols'
+                      , 'start_with_declarations', 'cflags', 'ccflags', 'compiler'
+                      , 'compiler_path', 'castxml_epic_version' ):
+            items.append( repr( getattr( config, name, None ) ) )
+        return hashlib.md5( '\n'.join( items ).encode( 'utf-8' ) ).hexdigest()
+
+    def __get_dir( self ):
+        if self.__cache_dir:
+            if not os.path.exists( self.__cache_dir ):
+                os.makedirs( self.__cache_dir )
+            return self.__cache_dir
+        if not self.__temp_dir:
+            self.__temp_dir = tempfile.mkdtemp( prefix='pypp-xml-' )
+        return self.__temp_dir
+
+    @staticmethod
+    def read_dependencies( xml_file ):
+        """returns list of files, the XML file was generated from"""
+        with open( xml_file, 'r' ) as f:
+            content = f.read()
+        files = re.findall( r'<File\s+id="[^"]*"\s+name="([^"]*)"', content )
+        return [ unescape( name, { '&quot;' : '"' } ) for name in files ]
+
+    def is_up_to_date( self, xml_file ):
+        """returns True, if the XML file is newer than all the files it was generated from"""
+        deps_file = xml_file + self.DEPENDENCIES_EXT
+        if not os.path.exists( xml_file ) or not os.path.exists( deps_file ):
+            return False
+        xml_mtime = os.path.getmtime( xml_file )
+        with open( deps_file, 'r' ) as f:
+            dependencies = json.load( f )
+        for dependency in dependencies:
+            if not os.path.isfile( dependency ):
+                if dependency.startswith( '<' ): #<builtin>, <command line>
+                    continue
+                return False
+            if xml_mtime < os.path.getmtime( dependency ):
+                return False
+        return True
+
+    def __generate( self, task ):
+        config, source_file, xml_file = task
+        reader = parser.source_reader_t( config )
+        reader.create_xml_file( source_file, xml_file )
+        if self.__cache_dir:
+            with open( xml_file + self.DEPENDENCIES_EXT, 'w+' ) as f:
+                json.dump( self.read_dependencies( xml_file ), f )
+
+    def generate( self, files ):
+        """
+        generates XML files and returns new list of files, where the source
+        files are replaced by the XML files configurations
+
+        :param files: list of strings and\\or :class:`parser.file_configuration_t` instances
+        """
+        answer = []
+        tasks = []
+        for prj_file in files:
+            if isinstance( prj_file, FC ):
+                if FC.CONTENT_TYPE.CACHED_SOURCE_FILE == prj_file.content_type:
+                    if not os.path.exists( prj_file.cached_source_file ):
+                        config = self.__create_config( prj_file.start_with_declarations )
+                        dir_ = os.path.split( prj_file.cached_source_file )[0]
+                        if dir_ and not os.path.exists( dir_ ):
+                            os.makedirs( dir_ )
+                        tasks.append( ( config, self.__find_file( prj_file.data ), prj_file.cached_source_file ) )
+                    answer.append( prj_file )
+                    continue
+                elif FC.CONTENT_TYPE.STANDARD_SOURCE_FILE != prj_file.content_type:
+                    answer.append( prj_file )
+                    continue
+                config = self.__create_config( prj_file.start_with_declarations )
+                source_file = prj_file.data
+            else:
+                config = self.__config
+                source_file = prj_file
+            source_file = self.__find_file( source_file )
+            name = os.path.splitext( os.path.basename( source_file ) )[0]
+            xml_file = os.path.join( self.__get_dir()
+                                     , '%s-%s.xml' % ( name, self.create_key( config, source_file ) ) )
+            if self.__cache_dir and self.is_up_to_date( xml_file ):
+                self.hits += 1
+            else:
+                self.misses += 1
+                tasks.append( ( config, source_file, xml_file ) )
+            answer.append( parser.create_gccxml_fc( xml_file ) )
+
+        if 1 == self.__jobs or len( tasks ) < 2:
+            for task in tasks:
+                self.__generate( task )
+        else:
+            pool = ThreadPool( min( self.__jobs, len( tasks ) ) )
+            try:
+                pool.map( self.__generate, tasks )
+            finally:
+                pool.close()
+                pool.join()
+        self.logger.debug( 'XML generator: %d files were generated, %d files were found in cache'
+                           % ( len( tasks ), self.hits ) )
+        return answer
+
+    def cleanup( self ):
+        """removes generated XML files, which are not kept in the cache directory"""
+        if self.__temp_dir and not self.__config.keep_xml:
+            shutil.rmtree( self.__temp_dir, ignore_errors=True )
+        self.__temp_dir = None
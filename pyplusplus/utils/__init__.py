@@ -11,6 +11,9 @@ import os
 import math
 from pygccxml import declarations
 from pyplusplus import code_creators
+from .profiler import profiler_t
+from .profiler import dummy_profiler_t
+from .call_profile import call_profile_t
 
 class missing_call_policies:
     @staticmethod
@@ -53,6 +56,34 @@ def split_sequence(seq, bucket_size):
         buckets.append( seq[ from_ : to ] )
     return buckets
 
+def split_sequence_by_cost(seq, costs, max_buckets):
+    #split sequence to maximum max_buckets buckets, preserving the items order,
+    #so the maximal total cost of a bucket is minimal
+    if not seq:
+        return []
+
+    def split( max_cost ):
+        buckets = [[]]
+        total = 0.0
+        for item, cost in zip( seq, costs ):
+            if buckets[-1] and total + cost > max_cost:
+                buckets.append( [] )
+                total = 0.0
+            buckets[-1].append( item )
+            total += cost
+        return buckets
+
+    low = float( max( costs ) )
+    high = float( sum( costs ) )
+    for i in range( 64 ):
+        if high - low <= high * 1e-9:
+            break
+        middle = ( low + high ) / 2
+        if len( split( middle ) ) <= max_buckets:
+            high = middle
+        else:
+            low = middle
+    return split( high )
 
 class exposed_decls_db_t( object ):
     DEFAULT_FILE_NAME = 'exposed_decl.pypp.txt'
@@ -0,0 +1,74 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""
+defines class, which keeps the number of calls of the exposed functions
+
+The profile is used by `Py++` to estimate, how frequently the function is
+called from Python. The file format is JSON::
+
+  { "functions" : [ { "name" : "::ns::f(int)", "calls" : 1024 }, ... ] }
+
+Plain dictionary - `{ "::ns::f(int)" : 1024, ... }` - is also accepted.
+The function name is created by :meth:`call_profile_t.key` method.
+"""
+
+import json
+from pygccxml import declarations
+
+class call_profile_t( object ):
+    """number of calls of the exposed functions"""
+
+    def __init__( self, calls=None ):
+        """
+        :param calls: dictionary { function key : number of calls }
+        """
+        object.__init__( self )
+        self.__calls = {}
+        if calls:
+            self.__calls.update( calls )
+
+    @staticmethod
+    def key( calldef ):
+        """returns the string, which identifies the function in the profile"""
+        args = [ arg.decl_type.decl_string for arg in calldef.arguments ]
+        key = '%s(%s)' % ( declarations.full_name( calldef ), ', '.join( args ) )
+        if getattr( calldef, 'has_const', False ):
+            key += ' const'
+        return key
+
+    def calls( self, calldef ):
+        """returns number of calls of the function, 0 if the function is not in the profile"""
+        return self.__calls.get( self.key( calldef ), 0 )
+
+    def add_calls( self, calldef, calls ):
+        key = self.key( calldef )
+        self.__calls[ key ] = self.__calls.get( key, 0 ) + calls
+
+    def __len__( self ):
+        return len( self.__calls )
+
+    def create_report( self ):
+        """returns the profile as dictionary, ready to be saved in JSON format"""
+        functions = [ dict( name=name, calls=calls ) for name, calls in self.__calls.items() ]
+        functions.sort( key=lambda item: ( -item[ 'calls' ], item[ 'name' ] ) )
+        return dict( functions=functions )
+
+    def save( self, file_name ):
+        with open( file_name, 'w+' ) as f:
+            json.dump( self.create_report(), f, indent=1, sort_keys=True )
+
+    @staticmethod
+    def load( file_name ):
+        """loads the profile from the file"""
+        with open( file_name, 'r' ) as f:
+            data = json.load( f )
+        if 'functions' in data and isinstance( data[ 'functions' ], list ):
+            calls = {}
+            for item in data[ 'functions' ]:
+                calls[ item[ 'name' ] ] = calls.get( item[ 'name' ], 0 ) + int( item[ 'calls' ] )
+        else:
+            calls = dict( [ ( name, int( count ) ) for name, count in data.items() ] )
+        return call_profile_t( calls )
@@ -0,0 +1,289 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""
+defines classes, which measure time spent by `Py++` on code generation
+
+The profiler records:
+
+  * wall time and number of calls of every code generation phase
+  * time and number of calls of :meth:`code_creators.code_creator_t.create`
+    method per code creator class. The time of the nested creators is not
+    included.
+    The code creators, rendered by the worker processes, are included too.
+  * the slowest declarations: time spent to create their code creators and
+    to render them
+"""
+
+import os
+import sys
+import time
+import json
+from pyplusplus import code_creators
+
+if sys.version_info.major == 3:
+    timer = time.perf_counter
+else:
+    timer = time.clock
+
+class _phase_t( object ):
+    def __init__( self, profiler, name ):
+        object.__init__( self )
+        self.__profiler = profiler
+        self.__name = name
+        self.__start_time = None
+
+    def __enter__( self ):
+        self.__start_time = timer()
+        return self
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        self.__profiler.add_phase_time( self.__name, timer() - self.__start_time )
+        return False
+
+class _renderer_t( object ):
+    """
+    measures the time spent by the code creators in the "create" method
+
+    :meth:`code_creators.code_creator_t.create` passes the rendering to the
+    installed renderer. The time of the nested creators is subtracted from the
+    time of their parent.
+    """
+    def __init__( self, profiler ):
+        object.__init__( self )
+        self.__profiler = profiler
+        self.__nested = [] #time of the nested creators
+        self.rendering_time = 0.0
+
+    def render( self, creator, create ):
+        self.__nested.append( 0.0 )
+        start_time = timer()
+        try:
+            return create()
+        finally:
+            elapsed = timer() - start_time
+            nested_time = self.__nested.pop()
+            if self.__nested:
+                self.__nested[-1] += elapsed
+            else:
+                self.rendering_time += elapsed
+            self.__profiler.add_creator_time( creator, elapsed - nested_time )
+
+class _rendering_phase_t( object ):
+    def __init__( self, profiler, name ):
+        object.__init__( self )
+        self.__profiler = profiler
+        self.__name = name
+        self.__start_time = None
+        self.__renderer = profiler.create_renderer()
+        self.__previous_renderer = None
+
+    def __enter__( self ):
+        self.__previous_renderer = code_creators.code_creator_t.renderer
+        code_creators.code_creator_t.renderer = self.__renderer
+        self.__start_time = timer()
+        return self
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        code_creators.code_creator_t.renderer = self.__previous_renderer
+        elapsed = timer() - self.__start_time
+        rendering_time = self.__renderer.rendering_time
+        self.__profiler.add_phase_time( self.__name, elapsed )
+        self.__profiler.add_phase_time( self.__name + ': rendering', rendering_time )
+        self.__profiler.add_phase_time( self.__name + ': file i/o', elapsed - rendering_time )
+        return False
+
+class _dummy_phase_t( object ):
+    def __enter__( self ):
+        return self
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        return False
+
+_dummy_phase = _dummy_phase_t()
+
+class dummy_profiler_t( object ):
+    """profiler, which does nothing. It is used when profiling is disabled"""
+
+    enabled = False
+
+    def phase( self, name ):
+        return _dummy_phase
+
+    def rendering_phase( self, name ):
+        return _dummy_phase
+
+    def add_phase_time( self, name, seconds ):
+        pass
+
+    def add_creator_time( self, creator, seconds ):
+        pass
+
+    def add_declaration_time( self, declaration, seconds ):
+        pass
+
+    def create_renderer( self ):
+        return None
+
+    def pop_state( self ):
+        return None
+
+    def merge_state( self, state ):
+        pass
+
+class profiler_t( dummy_profiler_t ):
+    """
+    collects time spent by `Py++` on code generation phases, code creators and
+    declarations
+
+    Usage example::
+
+      profiler = profiler_t()
+      with profiler.phase( 'parsing' ):
+          ...
+      with profiler.rendering_phase( 'writing files' ):
+          ...write code creators tree to file(s)...
+      profiler.save( 'profile.json' )
+    """
+
+    enabled = True
+
+    def __init__( self, slowest_count=20 ):
+        """
+        :param slowest_count: number of the slowest declarations to report
+        """
+        dummy_profiler_t.__init__( self )
+        self.slowest_count = slowest_count
+        self.__phases = {} #name : [ calls, seconds ]
+        self.__phases_order = []
+        self.__creators = {} #class name : [ calls, seconds ]
+        self.__declarations = {} #id( declaration ) : [ declaration or its name, seconds ]
+
+    def phase( self, name ):
+        """returns context manager, which measures time of the code generation phase"""
+        return _phase_t( self, name )
+
+    def rendering_phase( self, name ):
+        """
+        returns context manager, which measures time of the code generation phase
+        and time, spent in :meth:`code_creators.code_creator_t.create` method of
+        every code creator, during it.
+
+        The context manager installs a renderer on :class:`code_creators.code_creator_t`
+        class, which is called explicitly by the "create" method. The creators,
+        which "create" method was replaced by the file writers, return the code
+        rendered earlier, or by the worker processes, which report their time
+        separately.
+
+        Two additional phases are reported: "<name>: rendering" - time spent by the
+        code creators and "<name>: file i/o" - the rest of the time.
+        """
+        return _rendering_phase_t( self, name )
+
+    def add_phase_time( self, name, seconds ):
+        if name not in self.__phases:
+            self.__phases[ name ] = [ 0, 0.0 ]
+            self.__phases_order.append( name )
+        self.__phases[ name ][0] += 1
+        self.__phases[ name ][1] += seconds
+
+    def add_creator_time( self, creator, seconds ):
+        name = creator.__class__.__name__
+        if name not in self.__creators:
+            self.__creators[ name ] = [ 0, 0.0 ]
+        self.__creators[ name ][0] += 1
+        self.__creators[ name ][1] += seconds
+        if isinstance( creator, code_creators.declaration_based_t ):
+            self.add_declaration_time( creator.declaration, seconds )
+
+    def add_declaration_time( self, declaration, seconds ):
+        key = id( declaration )
+        if key not in self.__declarations:
+            self.__declarations[ key ] = [ declaration, 0.0 ]
+        self.__declarations[ key ][1] += seconds
+
+    def create_renderer( self ):
+        """
+        returns an object, which measures the time spent by the code creators
+        in :meth:`code_creators.code_creator_t.create` method, when it is set to
+        :attr:`code_creators.code_creator_t.renderer`
+        """
+        return _renderer_t( self )
+
+    def pop_state( self ):
+        """
+        returns the data collected since the previous call and forgets it
+
+        The forked worker processes use this method to send the time spent on
+        rendering back to the main process. The declarations are sent by name.
+        """
+        declarations = dict( [ ( key, ( str( declaration ), seconds ) )
+                               for key, ( declaration, seconds ) in self.__declarations.items() ] )
+        state = dict( phases=[ ( name, self.__phases[ name ] ) for name in self.__phases_order ]
+                      , creators=self.__creators
+                      , declarations=declarations )
+        self.__phases = {}
+        self.__phases_order = []
+        self.__creators = {}
+        self.__declarations = {}
+        return state
+
+    def merge_state( self, state ):
+        """merges the data, returned by :meth:`pop_state` in a forked worker process"""
+        for name, ( calls, seconds ) in state[ 'phases' ]:
+            if name not in self.__phases:
+                self.__phases[ name ] = [ 0, 0.0 ]
+                self.__phases_order.append( name )
+            self.__phases[ name ][0] += calls
+            self.__phases[ name ][1] += seconds
+        for name, ( calls, seconds ) in state[ 'creators' ].items():
+            if name not in self.__creators:
+                self.__creators[ name ] = [ 0, 0.0 ]
+            self.__creators[ name ][0] += calls
+            self.__creators[ name ][1] += seconds
+        #the worker processes are forked, so the declarations have the same ids
+        for key, ( name, seconds ) in state[ 'declarations' ].items():
+            if key not in self.__declarations:
+                self.__declarations[ key ] = [ name, 0.0 ]
+            self.__declarations[ key ][1] += seconds
+
+    def create_report( self ):
+        """returns the collected data as dictionary"""
+        phases = [ dict( name=name, calls=self.__phases[ name ][0], seconds=self.__phases[ name ][1] )
+                   for name in self.__phases_order ]
+
+        creators = [ dict( name=name, calls=calls, seconds=seconds )
+                     for name, ( calls, seconds ) in self.__creators.items() ]
+        creators.sort( key=lambda item: ( -item[ 'seconds' ], item[ 'name' ] ) )
+
+        declarations = [ dict( name=str( declaration ), seconds=seconds )
+                         for declaration, seconds in self.__declarations.values() ]
+        declarations.sort( key=lambda item: ( -item[ 'seconds' ], item[ 'name' ] ) )
+
+        return dict( phases=phases
+                     , creators=creators
+                     , slowest_declarations=declarations[ : self.slowest_count ] )
+
+    def create_text_report( self ):
+        """returns the collected data as human readable text"""
+        report = self.create_report()
+        lines = []
+        for title, items in ( ( 'phases', report[ 'phases' ] )
+                              , ( 'code creators', report[ 'creators' ] ) ):
+            lines.append( '%s:' % title )
+            for item in items:
+                lines.append( '    %10.4f s %8d calls    %s' % ( item[ 'seconds' ], item[ 'calls' ], item[ 'name' ] ) )
+        lines.append( 'slowest declarations:' )
+        for item in report[ 'slowest_declarations' ]:
+            lines.append( '    %10.4f s    %s' % ( item[ 'seconds' ], item[ 'name' ] ) )
+        return os.linesep.join( lines ) + os.linesep
+
+    def save( self, file_name ):
+        """writes the report to the file, in JSON format if the file has ".json" extension, as text otherwise"""
+        with open( file_name, 'w+' ) as f:
+            if os.path.splitext( file_name )[1].lower() == '.json':
+                json.dump( self.create_report(), f, indent=1, sort_keys=True )
+            else:
+                f.write( self.create_text_report() )
@@ -56,6 +56,70 @@ class creator_finder_tester_t( unittest.TestCase ):
             , recursive=True)
         self.assertTrue( enum_found )
 
+    def test_indexes(self):
+        mb = module_builder.module_builder_t(
+            [ module_builder.create_text_fc( 'namespace enums{ enum color{ red = 1}; struct data{ int x; }; }' )]
+            , xml_generator_config=autoconfig.xml_generator_config)
+        mb.namespace( name='::enums' ).include()
+        mb.build_code_creator('dummy')
+        flatten = code_creators.make_flatten( mb.code_creator.creators )
+        for what in ( code_creators.enum_t, code_creators.declaration_based_t ):
+            found = code_creators.creator_finder.find_by_class_instance( what, mb.code_creator.creators )
+            self.assertEqual( found, [ inst for inst in flatten if isinstance( inst, what ) ] )
+        color = mb.enum( 'color' )
+        found = code_creators.creator_finder.find_by_declaration( color, mb.code_creator.creators )
+        self.assertTrue( found and found[0].declaration is color )
+        self.assertEqual( found
+                          , code_creators.creator_finder.find_by_declaration( lambda decl: decl is color
+                                                                             , mb.code_creator.creators ) )
+        body = mb.code_creator.body
+        body.remove_creator( found[0] )
+        self.assertTrue( not body.find_descendants_by_declaration( color ) )
+        self.assertTrue( not mb.code_creator.find_descendants_by_declaration( color ) )
+
+class create_identifier_tester_t( unittest.TestCase ):
+    def test(self):
+        mb = module_builder.module_builder_t(
+            [ module_builder.create_text_fc( 'namespace enums{ enum color{ red = 1}; }' )]
+            , xml_generator_config=autoconfig.xml_generator_config)
+        mb.namespace( name='::enums' ).include()
+        mb.build_code_creator('dummy')
+        extmodule = mb.code_creator
+        extmodule.adopt_creator( code_creators.namespace_alias_t( 'e', '::enums' ), 0 )
+        enum_creator = code_creators.creator_finder.find_by_class_instance( code_creators.enum_t
+                                                                           , extmodule.body.creators )[0]
+        self.assertEqual( 'e::color', code_creators.create_identifier( enum_creator, '::enums::color' ) )
+        self.assertEqual( 'std::string', code_creators.create_identifier( enum_creator, '::std::string' ) )
+        #aliases, defined after the creator, do not affect it
+        extmodule.body.adopt_creator( code_creators.namespace_alias_t( 'x', '::enums' ) )
+        self.assertEqual( 'e::color', code_creators.create_identifier( enum_creator, '::enums::color' ) )
+        for creator in code_creators.make_flatten( extmodule ):
+            aliases = [ inst for inst in code_creators.creators_affect_on_me( creator )
+                        if isinstance( inst, code_creators.namespace_alias_t ) ]
+            self.assertEqual( aliases, code_creators.namespace_aliases_affect_on_me( creator ) )
+
+class sink_tester_t( unittest.TestCase ):
+    def test_blocks(self):
+        sink = code_creators.string_sink_t()
+        sink.write( 'a' )
+        sink.begin_block( os.linesep, indent=True )
+        self.assertTrue( not sink.end_block() )
+        sink.begin_block( os.linesep, indent=True )
+        sink.write( 'b' + os.linesep + 'c' )
+        self.assertTrue( sink.end_block() )
+        expected = 'a' + os.linesep + code_creators.code_creator_t.indent( 'b' + os.linesep + 'c' )
+        self.assertEqual( expected, sink.get_value() )
+
+    def test_module(self):
+        mb = module_builder.module_builder_t(
+            [ module_builder.create_text_fc( 'namespace enums{ enum color{ red = 1}; struct data{ int x; }; }' )]
+            , xml_generator_config=autoconfig.xml_generator_config)
+        mb.namespace( name='::enums' ).include()
+        mb.build_code_creator('dummy')
+        sink = code_creators.string_sink_t()
+        mb.code_creator.write( sink )
+        self.assertEqual( mb.code_creator.create(), sink.get_value() )
+
 class class_organizer_tester_t(unittest.TestCase):
     def __init__(self, *args ):
         unittest.TestCase.__init__(self, *args)
@@ -92,6 +156,21 @@ class class_organizer_tester_t(unittest.TestCase):
             self.assertTrue( bases.issubset( exported )
                              , 'for derived class %s not all base classes have been exported' % dorder[i].name )
 
+class class_organizer_cycles_tester_t(unittest.TestCase):
+    def test(self):
+        code = []
+        code.append('struct a;')
+        code.append('struct b{ void f( a* x=(a*)1 ); };')
+        code.append('struct a{ void f( b* x=(b*)1 ); };')
+        code.append('struct c : public a{};')
+
+        global_ns = parser.parse_string( os.linesep.join( code ), autoconfig.xml_generator_config )
+        decls = global_ns[0].declarations
+        organizer = creators_factory.sort_algorithms.class_organizer_t( decls )
+        self.assertTrue( [ [ '::a', '::b' ] ] == organizer.cycles )
+        dorder = [ cls.name for cls in organizer.desired_order() ]
+        self.assertTrue( [ 'b', 'a', 'c' ] == dorder )
+
 class exclude_function_with_array_arg_tester_t( unittest.TestCase ):
     def test(self):
         mb = module_builder.module_builder_t(
@@ -219,6 +298,16 @@ class split_sequence_tester_t(unittest.TestCase):
         self.assertTrue( [[1,2,3]] == split( seq, 3 ) )
         self.assertTrue( [[1,2,3]] == split( seq, 4 ) )
 
+class split_sequence_by_cost_tester_t(unittest.TestCase):
+    def test(self):
+        split = pypp_utils.split_sequence_by_cost
+        seq = [ 1,2,3,4,5,6,7 ]
+        costs = [ 1,9,1,1,1,5,1 ]
+        self.assertTrue( [[1],[2],[3,4,5,6,7]] == split( seq, costs, 3 ) )
+        self.assertTrue( [seq] == split( seq, costs, 1 ) )
+        self.assertTrue( [[1],[2],[3,4,5],[6],[7]] == split( [ 1,2,3,4,5,6,7 ], [ 5,5,2,2,1,5,5 ], 5 ) )
+        self.assertTrue( [] == split( [], [], 2 ) )
+
 class doc_extractor_tester_t( unittest.TestCase ):
     def test( self ):
         escaped_doc = module_builder.doc_extractor_i.escape_doc('Hello "Py++"')
@@ -308,13 +397,17 @@ def create_suite():
     suite = unittest.TestSuite()
     suite.addTest( unittest.makeSuite(doc_extractor_tester_t))
     suite.addTest( unittest.makeSuite(class_organizer_tester_t))
+    suite.addTest( unittest.makeSuite(class_organizer_cycles_tester_t))
     suite.addTest( unittest.makeSuite(indent_tester_t))
     suite.addTest( unittest.makeSuite(make_flatten_tester_t))
     suite.addTest( unittest.makeSuite(creator_finder_tester_t))
+    suite.addTest( unittest.makeSuite(create_identifier_tester_t))
+    suite.addTest( unittest.makeSuite(sink_tester_t))
     suite.addTest( unittest.makeSuite(exclude_function_with_array_arg_tester_t))
     suite.addTest( unittest.makeSuite(class_multiple_files_tester_t))
     suite.addTest( unittest.makeSuite(readme_tester_t))
     suite.addTest( unittest.makeSuite(split_sequence_tester_t))
+    suite.addTest( unittest.makeSuite(split_sequence_by_cost_tester_t))
     suite.addTest( unittest.makeSuite(exclude_erronious_tester_t))
     suite.addTest( unittest.makeSuite(use_function_signature_bug_tester_t))
     suite.addTest( unittest.makeSuite(exclude_ellipsis_tester_t))
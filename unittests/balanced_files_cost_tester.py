@@ -0,0 +1,144 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import os
+import sys
+import json
+import shutil
+import unittest
+import autoconfig
+from pyplusplus import code_creators
+from pyplusplus import file_writers
+from pyplusplus import module_builder
+
+class tester_t(unittest.TestCase):
+    MODULE_NAME = 'balanced_cost'
+
+    CODE = \
+    """
+    namespace balanced_cost{
+        struct a_t{};
+        struct b_t{
+            int f1();
+            int f2();
+            int f3();
+            int f4();
+        };
+        struct c_t{};
+        struct d_t{};
+        struct e_t{};
+        struct f_t{};
+    }
+    """
+
+    TEMPLATE_CODE = \
+    """
+    namespace balanced_cost{
+        template< class T >
+        struct tag_t{
+            T value;
+        };
+
+        inline void instantiate(){
+            sizeof( tag_t< int > );
+        }
+    }
+    """
+
+    def setUp( self ):
+        self.dir_path = os.path.join( autoconfig.build_dir, self.MODULE_NAME )
+        if os.path.exists( self.dir_path ):
+            shutil.rmtree( self.dir_path )
+        os.makedirs( self.dir_path )
+
+    def create_module_builder( self, code ):
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( code ) ]
+                , xml_generator_config=autoconfig.xml_generator_config )
+        mb.namespace( name='balanced_cost' ).include()
+        mb.build_code_creator( self.MODULE_NAME )
+        return mb
+
+    def source_file( self, index ):
+        return self.MODULE_NAME + '_classes_%d' % index + file_writers.balanced_files_t.SOURCE_EXT
+
+    def class_costs( self, writer, mb ):
+        return dict( [ ( cc.declaration.name, writer.estimate_compile_cost( cc ) )
+                       for cc in mb.code_creator.body.creators if isinstance( cc, code_creators.class_t ) ] )
+
+    def load_buckets( self ):
+        buckets_file = os.path.join( self.dir_path, self.MODULE_NAME + '.buckets.json' )
+        with open( buckets_file, 'r' ) as f:
+            buckets = json.load( f )
+        answer = {}
+        for file_name, class2cost in buckets.items():
+            answer[ file_name ] = sorted( [ name.split( '::' )[-1] for name in class2cost.keys() ] )
+        return answer
+
+    def test_estimate_compile_cost(self):
+        mb = self.create_module_builder( self.CODE )
+        writer = file_writers.balanced_files_t( mb.code_creator, self.dir_path, 2, balancing='cost' )
+        costs = self.class_costs( writer, mb )
+        self.assertEqual( costs[ 'a_t' ], writer.CLASS_COST )
+        self.assertEqual( costs[ 'b_t' ], writer.CLASS_COST + 4 * writer.CALLDEF_COST )
+
+        mb = self.create_module_builder( self.TEMPLATE_CODE )
+        writer = file_writers.balanced_files_t( mb.code_creator, self.dir_path, 2, balancing='cost' )
+        costs = self.class_costs( writer, mb )
+        self.assertEqual( list( costs.values() ), [ writer.CLASS_COST * ( 1 + writer.TEMPLATE_DEPTH_FACTOR ) ] )
+
+    def test_estimated_buckets(self):
+        mb = self.create_module_builder( self.CODE )
+        mb.balanced_split_module( self.dir_path, 2, balancing='cost' )
+        self.assertEqual( self.load_buckets()
+                          , { self.source_file( 1 ) : [ 'a_t', 'b_t' ]
+                              , self.source_file( 2 ) : [ 'c_t', 'd_t', 'e_t', 'f_t' ] } )
+        with open( os.path.join( self.dir_path, self.source_file( 1 ) ), 'r' ) as f:
+            self.assertTrue( '"b_t"' in f.read() )
+
+        mb = self.create_module_builder( self.CODE )
+        mb.balanced_split_module( self.dir_path, 2 )
+        with open( os.path.join( self.dir_path, self.source_file( 2 ) ), 'r' ) as f:
+            code = f.read()
+        self.assertTrue( '"d_t"' in code and '"b_t"' not in code )
+
+    def test_learned_buckets(self):
+        mb = self.create_module_builder( self.CODE )
+        mb.balanced_split_module( self.dir_path, 2, balancing='cost' )
+
+        #the second file was compiled much longer than estimated, so its classes are
+        #learned to be expensive and the first file receives more of them
+        compile_times = { self.source_file( 1 ) : 1.0, self.source_file( 2 ) : 40.0 }
+        compile_times_file = os.path.join( self.dir_path, 'compile_times.json' )
+        with open( compile_times_file, 'w+' ) as f:
+            json.dump( compile_times, f )
+        mb = self.create_module_builder( self.CODE )
+        mb.balanced_split_module( self.dir_path, 2, balancing='cost', compile_times=compile_times_file )
+        self.assertEqual( self.load_buckets()
+                          , { self.source_file( 1 ) : [ 'a_t', 'b_t', 'c_t', 'd_t' ]
+                              , self.source_file( 2 ) : [ 'e_t', 'f_t' ] } )
+
+    def test_broken_buckets_file(self):
+        buckets_file = os.path.join( self.dir_path, self.MODULE_NAME + '.buckets.json' )
+        with open( buckets_file, 'w+' ) as f:
+            f.write( '{ broken' )
+        mb = self.create_module_builder( self.CODE )
+        mb.balanced_split_module( self.dir_path, 2, balancing='cost'
+                                  , compile_times={ self.source_file( 1 ) : 1.0, self.source_file( 2 ) : 40.0 } )
+        #the previous layout is unknown, so the estimated costs are used
+        self.assertEqual( self.load_buckets()
+                          , { self.source_file( 1 ) : [ 'a_t', 'b_t' ]
+                              , self.source_file( 2 ) : [ 'c_t', 'd_t', 'e_t', 'f_t' ] } )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
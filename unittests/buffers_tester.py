@@ -0,0 +1,313 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import os
+import sys
+import array
+import unittest
+import autoconfig
+import fundamental_tester_base
+from pygccxml import declarations
+from pyplusplus import code_creators
+from pyplusplus import module_builder
+from pyplusplus.module_builder import call_policies
+from pyplusplus import function_transformers as ft
+from pyplusplus.decl_wrappers import python_traits
+
+class python_traits_tester_t(unittest.TestCase):
+    def test(self):
+        shape = python_traits.buffer_shape
+        self.assertEqual( shape( declarations.array_t( declarations.float_t(), 4 ) ), [4] )
+        matrix = declarations.array_t( declarations.array_t( declarations.const_t( declarations.int_t() ), 4 ), 3 )
+        self.assertEqual( shape( matrix ), [3, 4] )
+        self.assertEqual( shape( declarations.array_t( declarations.wchar_t(), 4 ) ), None )
+        self.assertEqual( shape( declarations.array_t( matrix, 2 ) ), None )
+        self.assertEqual( shape( declarations.int_t() ), None )
+        self.assertTrue( not python_traits.is_trivial_class( declarations.int_t() ) )
+
+class array_mv_tester_t(unittest.TestCase):
+    CODE = \
+    """
+    namespace buffers{
+        struct item_t{
+            float values[4096];
+            const int matrix[3][4];
+            static double table[8];
+            wchar_t names[8];
+        };
+    }
+    """
+
+    def test(self):
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , xml_generator_config=autoconfig.xml_generator_config )
+        item = mb.class_( 'item_t' )
+        item.include()
+        item.variables().expose_as_buffer = True
+        mb.build_code_creator( 'buffers' )
+        code = mb.code_creator.create()
+
+        exposed = mb.code_creator.find_descendants_by_class( code_creators.array_mv_buffer_t )
+        self.assertEqual( set( [ creator.declaration.name for creator in exposed ] )
+                          , set( [ 'values', 'matrix', 'table' ] ) )
+        self.assertTrue( 'make_memoryview( &self.values[0], 4096, inst.ptr() )' in code )
+        self.assertTrue( 'make_memoryview( &self.matrix[0][0], 3, 4, inst.ptr() )' in code )
+        self.assertTrue( 'make_memoryview( &::buffers::item_t::table[0], 8, 0 )' in code )
+        self.assertTrue( 'array_1_t< wchar_t, 8>' in code )
+        self.assertTrue( [ msg for msg in item.variable( 'names' ).readme() if msg.identifier == 'W1069' ] )
+
+class input_buffer_tester_t(unittest.TestCase):
+    CODE = \
+    """
+    namespace buffers{
+        void write( const char* buffer, int size );
+        void fill( double values[16] );
+        void scale( double* values, unsigned int count, double factor );
+    }
+    """
+
+    def test(self):
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , xml_generator_config=autoconfig.xml_generator_config )
+        ns = mb.namespace( 'buffers' )
+        ns.include()
+        ns.free_function( 'write' ).add_transformation( ft.input_buffer( 'buffer', 'size', allow_copy=True ) )
+        ns.free_function( 'fill' ).add_transformation( ft.input_buffer( 'values' ) )
+        ns.free_function( 'scale' ).add_transformation( ft.input_buffer( 0, 1 ) )
+        self.assertRaises( ValueError, ft.input_buffer( 'values' ), ns.free_function( 'scale' ) )
+        mb.build_code_creator( 'buffers' )
+        code = mb.code_creator.create()
+
+        self.assertTrue( '__buffers.pypp.hpp' in code )
+        self.assertTrue( 'pyplusplus::buffers::input_buffer_t< char const > native_buffer( buffer, true, -1 );' in code )
+        self.assertTrue( 'static_cast< int >( native_buffer.size() )' in code )
+        self.assertTrue( 'pyplusplus::buffers::input_buffer_t< double > native_values( values, false, 16 );' in code )
+        self.assertTrue( 'static_cast< unsigned int >( native_values.size() ), factor' in code )
+
+class input_buffer_module_tester_t(fundamental_tester_base.fundamental_tester_base_t):
+    EXTENSION_NAME = 'input_buffer'
+
+    def __init__( self, *args ):
+        fundamental_tester_base.fundamental_tester_base_t.__init__(
+            self
+            , input_buffer_module_tester_t.EXTENSION_NAME
+            , *args )
+
+    def customize(self, mb ):
+        mb.free_function( 'sum' ).add_transformation( ft.input_buffer( 'buffer', 'size', allow_copy=True ) )
+        mb.free_function( 'fill' ).add_transformation( ft.input_buffer( 'values' ) )
+        mb.free_function( 'scale' ).add_transformation( ft.input_buffer( 0, 1 ) )
+
+    def run_tests(self, module):
+        values = array.array( 'd', [ 9.0 ] * 4 )
+        module.fill( values )
+        self.assertEqual( list( values ), [ 0.0, 1.0, 2.0, 3.0 ] )
+
+        self.assertRaises( BufferError, module.fill, memoryview( array.array( 'd', [ 0.0 ] * 4 ) ).toreadonly() )
+        self.assertRaises( ValueError, module.fill, array.array( 'd', [ 0.0 ] * 3 ) )
+        self.assertRaises( TypeError, module.fill, array.array( 'f', [ 0.0 ] * 4 ) )
+        self.assertRaises( TypeError, module.fill, [ 0.0 ] * 4 )
+
+        values = array.array( 'd', [ 1.0, 2.0 ] )
+        module.scale( values, 2.0 )
+        self.assertEqual( list( values ), [ 2.0, 4.0 ] )
+
+        #read-only and not contiguous buffers are copied
+        self.assertEqual( module.sum( b'\x01\x02\x03' ), 6 )
+        self.assertEqual( module.sum( memoryview( b'\x01\x02\x03\x04' )[::2] ), 4 )
+
+class output_buffer_tester_t(unittest.TestCase):
+    CODE = \
+    """
+    namespace buffers{
+        void get_vec3( double* v );
+        void get_vec4( int v[4] );
+        void get_matrix( float m[4][4] );
+        void fill_matrix( float m[4][4] );
+        void get_names( wchar_t* names );
+    }
+    """
+
+    def test(self):
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , xml_generator_config=autoconfig.xml_generator_config )
+        ns = mb.namespace( 'buffers' )
+        ns.include()
+        ns.free_function( 'get_vec3' ).add_transformation( ft.output_static_array( 'v', 3, mode=ft.OUTPUT_MEMORYVIEW ) )
+        ns.free_function( 'get_vec4' ).add_transformation( ft.output_static_array( 'v', 4, mode=ft.OUTPUT_CALLER_BUFFER ) )
+        ns.free_function( 'get_matrix' ).add_transformation( ft.output_static_matrix( 'm', 4, 4, mode=ft.OUTPUT_MEMORYVIEW ) )
+        ns.free_function( 'fill_matrix' ).add_transformation( ft.output_static_matrix( 'm', 4, 4, mode=ft.OUTPUT_CALLER_BUFFER ) )
+        self.assertRaises( ValueError
+                           , ft.output_static_array( 'names', 8, mode=ft.OUTPUT_MEMORYVIEW )
+                           , ns.free_function( 'get_names' ) )
+        self.assertRaises( ValueError
+                           , ft.output_static_array( 'v', 3, mode='tuple' )
+                           , ns.free_function( 'get_vec3' ) )
+        mb.build_code_creator( 'buffers' )
+        code = mb.code_creator.create()
+
+        self.assertTrue( 'pyplusplus::buffers::output_buffer_t< double > native_v( 3 );' in code )
+        self.assertTrue( 'py_v = native_v.memoryview();' in code )
+        self.assertTrue( 'pyplusplus::buffers::input_buffer_t< int > native_v( v, false, 4 );' in code )
+        self.assertTrue( 'pyplusplus::buffers::output_buffer_t< float > native_m( 4, 4 );' in code )
+        self.assertTrue( 'pyplusplus::buffers::input_buffer_t< float > native_m( m, false, 16 );' in code )
+        self.assertTrue( 'reinterpret_cast< float (*)[4] >( native_m.data() )' in code )
+
+class output_buffer_module_tester_t(fundamental_tester_base.fundamental_tester_base_t):
+    EXTENSION_NAME = 'output_buffer'
+
+    def __init__( self, *args ):
+        fundamental_tester_base.fundamental_tester_base_t.__init__(
+            self
+            , output_buffer_module_tester_t.EXTENSION_NAME
+            , *args )
+
+    def customize(self, mb ):
+        mb.free_function( 'get_vec3' ).add_transformation( ft.output_static_array( 'v', 3, mode=ft.OUTPUT_MEMORYVIEW ) )
+        mb.free_function( 'get_vec4' ).add_transformation( ft.output_static_array( 'v', 4, mode=ft.OUTPUT_CALLER_BUFFER ) )
+        mb.free_function( 'get_matrix' ).add_transformation( ft.output_static_matrix( 'm', 2, 3, mode=ft.OUTPUT_MEMORYVIEW ) )
+        mb.free_function( 'fill_matrix' ).add_transformation( ft.output_static_matrix( 'm', 2, 3, mode=ft.OUTPUT_CALLER_BUFFER ) )
+
+    def run_tests(self, module):
+        v = module.get_vec3()
+        self.assertTrue( isinstance( v, memoryview ) )
+        self.assertEqual( ( v.format, v.shape, v.readonly ), ( 'd', ( 3, ), False ) )
+        self.assertEqual( v.tolist(), [ 0.5, 1.5, 2.5 ] )
+
+        m = module.get_matrix()
+        self.assertEqual( ( m.format, m.shape ), ( 'f', ( 2, 3 ) ) )
+        self.assertEqual( m.tolist(), [ [ 0.0, 1.0, 2.0 ], [ 10.0, 11.0, 12.0 ] ] )
+
+        v = array.array( 'i', [ 0 ] * 4 )
+        self.assertEqual( module.get_vec4( v ), None )
+        self.assertEqual( list( v ), [ 0, 2, 4, 6 ] )
+        self.assertRaises( ValueError, module.get_vec4, array.array( 'i', [ 0 ] * 3 ) )
+        self.assertRaises( BufferError, module.get_vec4, bytes( 4 * v.itemsize ) )
+
+        m = array.array( 'f', [ 0.0 ] * 6 )
+        module.fill_matrix( m )
+        self.assertEqual( list( m ), [ 0.0, 1.0, 2.0, 10.0, 11.0, 12.0 ] )
+        self.assertRaises( TypeError, module.fill_matrix, array.array( 'd', [ 0.0 ] * 6 ) )
+
+class return_range_buffer_tester_t(unittest.TestCase):
+    CODE = \
+    """
+    namespace buffers{
+        struct pixel_t{ unsigned char r, g, b; };
+        struct shape_t{ virtual ~shape_t(); };
+        struct name_t{ ~name_t(); char* value; };
+        struct image_t{
+            const float* values() const;
+            pixel_t* pixels();
+            static double* table();
+            shape_t* shapes();
+            name_t* names();
+        };
+    }
+    """
+
+    def test(self):
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , xml_generator_config=autoconfig.xml_generator_config )
+        image = mb.class_( 'image_t' )
+        image.include()
+        for name in ( 'values', 'pixels' ):
+            f = image.member_function( name )
+            f.call_policies = call_policies.return_range( f, 'size_getter_t', as_buffer=True )
+        table = image.member_function( 'table' )
+        table.call_policies = call_policies.return_range( table, 'size_getter_t', as_buffer=True, custodian=0 )
+        for name in ( 'shapes', 'names' ):
+            self.assertRaises( TypeError, call_policies.return_range
+                               , image.member_function( name ), 'size_getter_t', as_buffer=True )
+        mb.build_code_creator( 'buffers' )
+        code = mb.code_creator.create()
+
+        self.assertTrue( 'return_range_buffer<size_getter_t, float const>()' in code )
+        self.assertTrue( '::buffers::pixel_t, 1, true>()' in code )
+        self.assertTrue( 'return_range_buffer<size_getter_t, double, 0>()' in code )
+
+class return_range_buffer_module_tester_t(fundamental_tester_base.fundamental_tester_base_t):
+    EXTENSION_NAME = 'return_range_buffer'
+
+    SIZE_GETTERS_CODE = \
+    """
+    struct values_size_t{
+        ssize_t
+        operator()( boost::python::tuple args ){
+            return 4;
+        }
+    };
+
+    struct pixels_size_t{
+        ssize_t
+        operator()( boost::python::tuple args ){
+            return 2;
+        }
+    };
+
+    struct table_size_t{
+        ssize_t
+        operator()( boost::python::tuple args ){
+            return 3;
+        }
+    };
+    """
+
+    def __init__( self, *args ):
+        fundamental_tester_base.fundamental_tester_base_t.__init__(
+            self
+            , return_range_buffer_module_tester_t.EXTENSION_NAME
+            , *args )
+
+    def customize(self, mb ):
+        image = mb.class_( 'image_t' )
+        image.add_declaration_code( self.SIZE_GETTERS_CODE )
+        for name, size_getter in ( ( 'get_values', 'values_size_t' ), ( 'get_pixels', 'pixels_size_t' ) ):
+            f = image.member_function( name )
+            f.call_policies = call_policies.return_range( f, size_getter, as_buffer=True )
+        get_table = image.member_function( 'get_table' )
+        get_table.call_policies = call_policies.return_range( get_table, 'table_size_t', as_buffer=True, custodian=0 )
+
+    def run_tests(self, module):
+        image = module.image_t()
+        values = image.get_values()
+        self.assertEqual( ( values.format, values.readonly ), ( 'f', True ) )
+        self.assertEqual( values.tolist(), [ 0.5, 1.5, 2.5, 3.5 ] )
+
+        refcount = sys.getrefcount( image )
+        pixels = image.get_pixels()
+        self.assertTrue( refcount < sys.getrefcount( image ) )
+        self.assertEqual( ( pixels.format, pixels.shape, pixels.readonly ), ( 'B', ( 2, 3 ), False ) )
+        self.assertEqual( pixels.tolist(), [ [ 0, 10, 20 ], [ 1, 11, 21 ] ] )
+        pixels[1, 2] = 77
+        self.assertEqual( image.get_pixels()[1, 2], 77 )
+        #the memoryview keeps the image alive
+        del image
+        self.assertEqual( pixels.tolist()[0], [ 0, 10, 20 ] )
+
+        table = module.image_t.get_table()
+        self.assertEqual( ( table.format, table.tolist() ), ( 'd', [ 1.0, 2.0, 3.0 ] ) )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(python_traits_tester_t))
+    suite.addTest( unittest.makeSuite(array_mv_tester_t))
+    suite.addTest( unittest.makeSuite(input_buffer_tester_t))
+    suite.addTest( unittest.makeSuite(input_buffer_module_tester_t))
+    suite.addTest( unittest.makeSuite(output_buffer_tester_t))
+    suite.addTest( unittest.makeSuite(output_buffer_module_tester_t))
+    suite.addTest( unittest.makeSuite(return_range_buffer_tester_t))
+    suite.addTest( unittest.makeSuite(return_range_buffer_module_tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
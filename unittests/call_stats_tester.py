@@ -0,0 +1,88 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import os
+import sys
+import json
+import unittest
+import tempfile
+import autoconfig
+from pyplusplus import utils
+from pyplusplus import module_builder
+from pyplusplus.module_builder import call_policies
+
+class tester_t(unittest.TestCase):
+    CODE = \
+    """
+    namespace call_stats{
+        struct item_t{
+            item_t(){}
+            int get_value() const { return 1; }
+            int& get_ref(){ return m_value; }
+            int m_value;
+        };
+
+        int do_smth( int x ){ return x; }
+        int do_smth( double x ){ return 0; }
+    }
+    """
+
+    def create_module_builder( self ):
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , xml_generator_config=autoconfig.xml_generator_config )
+        mb.namespace( name='call_stats' ).include()
+        return mb
+
+    def test(self):
+        mb = self.create_module_builder()
+        item = mb.class_( 'item_t' )
+        item.member_function( 'get_ref' ).call_policies \
+            = call_policies.return_value_policy( call_policies.copy_non_const_reference )
+        mb.build_code_creator( 'call_stats', count_calls=True )
+        code = mb.code_creator.create()
+        self.assertTrue( '__call_stats.pypp.hpp' in code )
+        self.assertTrue( 'register_stats( "__pypp_stats__" );' in code )
+        self.assertTrue( 'entry( "::call_stats::item_t::get_value() const" )' in code )
+        self.assertTrue( 'entry( "::call_stats::do_smth(double)" )' in code )
+        self.assertTrue( 'counting_policies< bp::return_value_policy<bp::copy_non_const_reference> >' in code )
+        #constructors are not counted
+        self.assertEqual( code.count( 'counting_policies' ), 4 )
+
+    def test_disabled(self):
+        mb = self.create_module_builder()
+        mb.build_code_creator( 'call_stats' )
+        code = mb.code_creator.create()
+        self.assertTrue( 'do_smth' in code )
+        for marker in ( 'counting_policies', '__pypp_stats__', '__call_stats.pypp.hpp' ):
+            self.assertFalse( marker in code, marker )
+
+    def test_hot_calldefs(self):
+        mb = self.create_module_builder()
+        stats = { 'functions' : [ dict( name='::call_stats::do_smth(int)', calls=100, seconds=0.1 )
+                                  , dict( name='::call_stats::item_t::get_value() const', calls=10, seconds=0.1 )
+                                  , dict( name='::call_stats::do_smth(double)', calls=1, seconds=0.1 ) ] }
+        fd, file_name = tempfile.mkstemp( suffix='.json' )
+        os.close( fd )
+        try:
+            with open( file_name, 'w' ) as f:
+                json.dump( stats, f )
+            hot = mb.hot_calldefs( file_name, min_calls=5 )
+        finally:
+            os.remove( file_name )
+        self.assertEqual( [ f.name for f in hot ], [ 'do_smth', 'get_value' ] )
+        calls = dict( [ ( item[ 'name' ], item[ 'calls' ] ) for item in stats[ 'functions' ] ] )
+        self.assertEqual( len( mb.hot_calldefs( utils.call_profile_t( calls ), count=1 ) ), 1 )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
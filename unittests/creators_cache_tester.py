@@ -0,0 +1,57 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import os
+import sys
+import unittest
+import autoconfig
+from pyplusplus import file_writers
+from pyplusplus import module_builder
+
+class tester_t(unittest.TestCase):
+    def create_module_builder( self ):
+        mb = module_builder.module_builder_t(
+                [ os.path.join( autoconfig.data_directory, 'creators_cache_to_be_exported.hpp' ) ]
+                , xml_generator_config=autoconfig.xml_generator_config)
+        mb.namespace( name='creators_cache' ).include()
+        return mb
+
+    def generate( self, mb, cache_file ):
+        mb.build_code_creator( 'creators_cache' )
+        cache = file_writers.creators_cache_t( cache_file )
+        cache.apply( mb.code_creator )
+        code = mb.code_creator.create()
+        cache.save()
+        return code, cache
+
+    def test(self):
+        cache_file = os.path.join( autoconfig.build_dir, 'creators_cache.creators.cache' )
+        if os.path.exists( cache_file ):
+            os.remove( cache_file )
+
+        code_1, cache = self.generate( self.create_module_builder(), cache_file )
+        self.assertTrue( 0 == cache.hits )
+        self.assertTrue( cache.misses )
+
+        code_2, cache = self.generate( self.create_module_builder(), cache_file )
+        self.assertTrue( 0 == cache.misses )
+        self.assertTrue( code_1 == code_2 )
+
+        mb = self.create_module_builder()
+        mb.free_function( 'do_smth' ).rename( 'do_something' )
+        code_3, cache = self.generate( mb, cache_file )
+        self.assertTrue( 1 == cache.misses )
+        self.assertTrue( 'do_something' in code_3 )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
@@ -0,0 +1,20 @@
+// Copyright 2004-2008 Roman Yakovenko.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#ifndef __creators_cache_to_be_exported_hpp__
+#define __creators_cache_to_be_exported_hpp__
+
+namespace creators_cache{
+
+struct item_t{
+    int get_value() const { return 1; }
+    void set_value( int ){}
+};
+
+inline int do_smth( int x ){ return x; }
+
+}
+
+#endif//__creators_cache_to_be_exported_hpp__
@@ -0,0 +1,56 @@
+// Copyright 2004-2008 Roman Yakovenko.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#ifndef __declarations_order_bug_profile_to_be_exported_hpp__
+#define __declarations_order_bug_profile_to_be_exported_hpp__
+
+
+struct declarations_order_bug_profile{
+
+struct base_t{};
+
+struct derived_t : base_t{};
+
+struct tester_t{
+    tester_t()
+    {}
+
+    const char* get( int ){
+        return "get( int )";
+    }
+
+    const char* get( double ){
+        return "get( double )";
+    }
+
+    const char* do_smth( bool ){
+        return "do_smth( bool )";
+    }
+
+    const char* do_smth( int ){
+        return "do_smth( int )";
+    }
+
+    const char* name( const base_t& ){
+        return "name( base_t )";
+    }
+
+    const char* name( const derived_t& ){
+        return "name( derived_t )";
+    }
+
+    const char* find( int ){
+        return "find( int )";
+    }
+
+    const char* find( const char* ){
+        return "find( const char* )";
+    }
+};
+
+};
+
+
+#endif//__declarations_order_bug_profile_to_be_exported_hpp__
@@ -73,6 +73,15 @@ inline void set_value( std::vector<item_t>& vec, unsigned int index, item_t valu
 typedef std::vector<float> fvector;
 fvector empty_fvector(){ return fvector(); }
 
+typedef std::vector<double> dvector;
+dvector create_dvector(){
+    dvector x;
+    for( int i = 0; i < 5; ++i ){
+        x.push_back( i );
+    }
+    return x;
+}
+
 HASH_XXX_NS::hash_map< int, int > get_int_mapping(){
     HASH_XXX_NS::hash_map< int, int > x;
     x[ 1 ] = 1;
@@ -136,6 +145,51 @@ inline protected_items_t create_protected_items(){
     return items;
 }
 
+struct record_t{
+    explicit record_t( int v=0 ) : value( v ){}
+
+    int value;
+
+    bool operator==(record_t const& other) const {
+        return value == other.value;
+    }
+
+    bool operator<(record_t const& other) const {
+        return value < other.value;
+    }
+};
+
+typedef std::vector<record_t> records_t;
+typedef std::vector<unsigned int> ids_t;
+
+//the containers are used only as type of const member variables, so they
+//are exposed as read only
+struct registry_t{
+    registry_t()
+    : records( create_records() )
+      , ids( create_ids() )
+    {}
+
+    const records_t records;
+    const ids_t ids;
+
+private:
+    static records_t create_records(){
+        records_t records;
+        records.push_back( record_t(0) );
+        records.push_back( record_t(1) );
+        return records;
+    }
+
+    static ids_t create_ids(){
+        ids_t ids;
+        for( unsigned int i = 0; i < 3; ++i ){
+            ids.push_back( i );
+        }
+        return ids;
+    }
+};
+
 }
 
 std::ostream& operator<<( std::ostream& o, const indexing_suites2::set_strings_t& x){
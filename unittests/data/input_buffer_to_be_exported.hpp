@@ -0,0 +1,33 @@
+// Copyright 2004-2008 Roman Yakovenko.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#ifndef __input_buffer_to_be_exported_hpp__
+#define __input_buffer_to_be_exported_hpp__
+
+namespace input_buffer{
+
+inline int sum( const char* buffer, int size ){
+    int result = 0;
+    for( int i = 0; i < size; ++i ){
+        result += buffer[i];
+    }
+    return result;
+}
+
+inline void fill( double values[4] ){
+    for( int i = 0; i < 4; ++i ){
+        values[i] = i;
+    }
+}
+
+inline void scale( double* values, unsigned int count, double factor ){
+    for( unsigned int i = 0; i < count; ++i ){
+        values[i] *= factor;
+    }
+}
+
+}
+
+#endif//__input_buffer_to_be_exported_hpp__
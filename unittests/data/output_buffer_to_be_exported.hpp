@@ -0,0 +1,37 @@
+// Copyright 2004-2008 Roman Yakovenko.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#ifndef __output_buffer_to_be_exported_hpp__
+#define __output_buffer_to_be_exported_hpp__
+
+namespace output_buffer{
+
+inline void get_vec3( double* v ){
+    for( int i = 0; i < 3; ++i ){
+        v[i] = i + 0.5;
+    }
+}
+
+inline void get_vec4( int v[4] ){
+    for( int i = 0; i < 4; ++i ){
+        v[i] = i * 2;
+    }
+}
+
+inline void get_matrix( float m[2][3] ){
+    for( int i = 0; i < 2; ++i ){
+        for( int j = 0; j < 3; ++j ){
+            m[i][j] = i * 10 + j;
+        }
+    }
+}
+
+inline void fill_matrix( float m[2][3] ){
+    get_matrix( m );
+}
+
+}
+
+#endif//__output_buffer_to_be_exported_hpp__
@@ -0,0 +1,43 @@
+// Copyright 2004-2008 Roman Yakovenko.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#ifndef __return_range_buffer_to_be_exported_hpp__
+#define __return_range_buffer_to_be_exported_hpp__
+
+namespace return_range_buffer{
+
+struct pixel_t{
+    unsigned char r, g, b;
+};
+
+struct image_t{
+    image_t(){
+        for( int i = 0; i < 4; ++i ){
+            m_values[i] = i + 0.5f;
+        }
+        for( int i = 0; i < 2; ++i ){
+            m_pixels[i].r = i;
+            m_pixels[i].g = i + 10;
+            m_pixels[i].b = i + 20;
+        }
+    }
+
+    const float* get_values() const { return m_values; }
+
+    pixel_t* get_pixels(){ return m_pixels; }
+
+    static double* get_table(){
+        static double table[3] = { 1.0, 2.0, 3.0 };
+        return table;
+    }
+
+private:
+    float m_values[4];
+    pixel_t m_pixels[2];
+};
+
+}
+
+#endif//__return_range_buffer_to_be_exported_hpp__
@@ -6,7 +6,10 @@
 import os
 import sys
 import unittest
+import autoconfig
 import fundamental_tester_base
+from pyplusplus import utils
+from pyplusplus import module_builder
 from pyplusplus.module_builder import call_policies
 from pyplusplus.creators_factory import sort_algorithms
 
@@ -47,10 +50,102 @@ class tester_false_t(tester_base_t):
         self.assertTrue( tester.do_smth( int(0) ) == "do_smth( int )" )
         self.assertTrue( tester.append( chr(10) ) == "append(const char)" )
 
+class tester_profile_t(fundamental_tester_base.fundamental_tester_base_t):
+    EXTENSION_NAME = 'declarations_order_bug_profile'
+
+    def __init__( self, *args ):
+        fundamental_tester_base.fundamental_tester_base_t.__init__(
+            self
+            , tester_profile_t.EXTENSION_NAME
+            , *args )
+
+    def customize( self, mb ):
+        tester = mb.class_( 'tester_t' )
+        #the frequently called overloads, which could take the same Python
+        #arguments as the other ones, are not tried first: "get( int )",
+        #"do_smth( bool )" and "name( derived_t )" still come first
+        calls_profile = utils.call_profile_t()
+        calls_profile.add_calls( tester.member_function( 'get', arg_types=[ 'double' ] ), 1000 )
+        calls_profile.add_calls( tester.member_function( 'do_smth', arg_types=[ 'int' ] ), 1000 )
+        calls_profile.add_calls( tester.member_function( 'name', arg_types=[ '::declarations_order_bug_profile::base_t const &' ] ), 1000 )
+        calls_profile.add_calls( tester.member_function( 'find', arg_types=[ 'char const *' ] ), 1000 )
+        mb.build_code_creator( self.EXTENSION_NAME, calls_profile=calls_profile )
+
+    def run_tests( self, module):
+        tester = module.declarations_order_bug_profile.tester_t()
+        self.assertTrue( tester.get( 1 ) == "get( int )" )
+        self.assertTrue( tester.get( 0.5 ) == "get( double )" )
+        self.assertTrue( tester.do_smth( True ) == "do_smth( bool )" )
+        self.assertTrue( tester.name( module.declarations_order_bug_profile.derived_t() ) == "name( derived_t )" )
+        self.assertTrue( tester.name( module.declarations_order_bug_profile.base_t() ) == "name( base_t )" )
+        self.assertTrue( tester.find( 1 ) == "find( int )" )
+        self.assertTrue( tester.find( "x" ) == "find( const char* )" )
+
+class organizer_tester_t(unittest.TestCase):
+    CODE = \
+    """
+    namespace organizer{
+        struct base_t{};
+        struct derived_t : base_t{};
+        struct other_t{};
+
+        void f( int );
+        void f( double );
+        void f( bool );
+        void f( const char* );
+
+        void g( const base_t& );
+        void g( const derived_t& );
+        void g( const other_t& );
+
+        void h( int );
+        void h( int* );
+        void h( bool* );
+        void h( bool );
+    }
+    """
+
+    def setUp( self ):
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , xml_generator_config=autoconfig.xml_generator_config )
+        self.ns = mb.namespace( 'organizer' )
+
+    def sort( self, name, calls ):
+        calls_profile = utils.call_profile_t()
+        overloads = self.ns.free_functions( name )
+        for f in overloads:
+            calls_profile.add_calls( f, calls.get( f.arguments[0].decl_type.decl_string, 0 ) )
+        organizer = sort_algorithms.calldef_organizer_t( calls_profile )
+        return [ f.arguments[0].decl_type.decl_string for f in organizer.sort_group( list( overloads ) ) ]
+
+    def test_specificity(self):
+        #Boost.Python tries the last registered overload first
+        self.assertEqual( self.sort( 'f', { 'double' : 100 } )
+                          , [ 'char const *', 'double', 'int', 'bool' ] )
+        self.assertEqual( self.sort( 'g', { '::organizer::base_t const &' : 100 } )
+                          , [ '::organizer::other_t const &', '::organizer::base_t const &', '::organizer::derived_t const &' ] )
+
+    def test_disjoint_overloads(self):
+        self.assertEqual( self.sort( 'f', { 'char const *' : 100 } )
+                          , [ 'double', 'int', 'bool', 'char const *' ] )
+        self.assertEqual( self.sort( 'g', { '::organizer::other_t const &' : 100 } )
+                          , [ '::organizer::base_t const &', '::organizer::derived_t const &', '::organizer::other_t const &' ] )
+
+    def test_both_directions(self):
+        #"h( int )" should be registered before "h( int* )" and "h( bool )",
+        #and "h( bool* )" - after "h( int* )" and "h( bool )"
+        for calls in ( {}, { 'int' : 100 }, { 'bool *' : 100, 'int *' : 50 } ):
+            order = self.sort( 'h', calls )
+            self.assertTrue( order.index( 'int' ) < order.index( 'int *' ) < order.index( 'bool *' ) )
+            self.assertTrue( order.index( 'int' ) < order.index( 'bool' ) < order.index( 'bool *' ) )
+
 def create_suite():
     suite = unittest.TestSuite()    
     suite.addTest( unittest.makeSuite(tester_true_t))
     suite.addTest( unittest.makeSuite(tester_false_t))
+    suite.addTest( unittest.makeSuite(tester_profile_t))
+    suite.addTest( unittest.makeSuite(organizer_tester_t))
     return suite
 
 def run_suite():
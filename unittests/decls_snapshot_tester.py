@@ -0,0 +1,67 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import os
+import sys
+import unittest
+import autoconfig
+from pyplusplus import messages
+from pyplusplus import module_builder
+from pyplusplus.module_builder import call_policies
+
+class tester_t(unittest.TestCase):
+    def setUp( self ):
+        self.snapshot = os.path.join( autoconfig.build_directory, 'decls_snapshot_tester.snapshot' )
+        self.script = os.path.join( autoconfig.build_directory, 'decls_snapshot_tester_script.py' )
+        with open( self.script, 'w' ) as f:
+            f.write( '#configuration v1' )
+
+    def tearDown( self ):
+        for f in ( self.snapshot, self.script ):
+            if os.path.exists( f ):
+                os.remove( f )
+
+    def create_module_builder( self ):
+        mb = module_builder.module_builder_t(
+                [ os.path.join( autoconfig.data_directory, 'member_functions_to_be_exported.hpp' ) ]
+                , xml_generator_config=autoconfig.xml_generator_config )
+        mb.namespace( name='member_functions' ).include()
+        calldefs = mb.namespace( name='member_functions' ).calldefs()
+        calldefs.disable_warnings( messages.W1009 )
+        mb.class_( 'protected_mf_t' ).exclude()
+        mb.class_( 'immutable_by_ref_t' ).alias = 'ImmutableByRef'
+        mb.add_registration_code( '//registration code' )
+        return mb
+
+    def test(self):
+        mb = self.create_module_builder()
+        mb.save_snapshot( self.snapshot, dependencies=[ self.script ] )
+        mb.build_code_creator( 'decls_snapshot' )
+        expected = mb.code_creator.create()
+
+        restored = module_builder.module_builder_t.load_snapshot( self.snapshot, dependencies=[ self.script ] )
+        self.assertTrue( restored )
+        self.assertTrue( restored.class_( 'protected_mf_t' ).ignore )
+        self.assertEqual( restored.class_( 'immutable_by_ref_t' ).alias, 'ImmutableByRef' )
+        restored.build_code_creator( 'decls_snapshot' )
+        self.assertEqual( expected, restored.code_creator.create() )
+
+    def test_out_of_date(self):
+        self.create_module_builder().save_snapshot( self.snapshot, dependencies=[ self.script ] )
+        with open( self.script, 'w' ) as f:
+            f.write( '#configuration v2' )
+        self.assertEqual( None, module_builder.module_builder_t.load_snapshot( self.snapshot, dependencies=[ self.script ] ) )
+        self.assertEqual( None, module_builder.module_builder_t.load_snapshot( self.snapshot + '.missing' ) )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
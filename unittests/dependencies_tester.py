@@ -0,0 +1,71 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import os
+import sys
+import shutil
+import unittest
+import autoconfig
+from pyplusplus import file_writers
+
+class tester_t(unittest.TestCase):
+    def setUp( self ):
+        self.dir_path = os.path.join( autoconfig.build_dir, 'dependencies' )
+        if os.path.exists( self.dir_path ):
+            shutil.rmtree( self.dir_path )
+        self.include_dir = os.path.join( self.dir_path, 'include' )
+        os.makedirs( self.include_dir )
+        self.input_header = os.path.join( self.include_dir, 'x.hpp' )
+        self.write( self.input_header, '' )
+
+    def tearDown( self ):
+        #the generated files are not needed after the test
+        shutil.rmtree( self.dir_path, ignore_errors=True )
+
+    def write( self, fpath, content ):
+        with open( fpath, 'w+' ) as f:
+            f.write( content )
+
+    def create_dependencies( self ):
+        deps_file = os.path.join( self.dir_path, 'x.deps.json' )
+        deps = file_writers.dependencies_t( deps_file, [ self.include_dir ] )
+        files = {
+            'x.pypp.hpp' : 'void register_x();'
+            , 'x.pypp.cpp' : '#include "boost/python.hpp"\n#include "x.hpp"\n#include "x.pypp.hpp"\n'
+            , 'x.main.cpp' : '#include "x.pypp.hpp"\n' }
+        for name, content in files.items():
+            fpath = os.path.join( self.dir_path, name )
+            self.write( fpath, content )
+            deps.add_file( fpath, content )
+        deps.save()
+        return deps
+
+    def test(self):
+        deps = self.create_dependencies()
+        units = deps.create_translation_units()
+        x_cpp = os.path.join( self.dir_path, 'x.pypp.cpp' )
+        x_hpp = os.path.join( self.dir_path, 'x.pypp.hpp' )
+        x_main = os.path.join( self.dir_path, 'x.main.cpp' )
+        self.assertTrue( sorted( units.keys() ) == sorted( [ x_cpp, x_main ] ) )
+        self.assertTrue( units[ x_cpp ][ 'input_headers' ] == [ self.input_header ] )
+        self.assertTrue( units[ x_cpp ][ 'generated_headers' ] == [ x_hpp ] )
+        self.assertTrue( units[ x_main ][ 'input_headers' ] == [] )
+
+        self.assertTrue( os.path.exists( deps.depfile_name ) )
+        self.assertTrue( not file_writers.is_generation_required( deps.file_name ) )
+        mtime = os.path.getmtime( self.input_header ) + 10
+        os.utime( self.input_header, ( mtime, mtime ) )
+        self.assertTrue( file_writers.is_generation_required( deps.file_name ) )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
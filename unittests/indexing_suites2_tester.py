@@ -5,6 +5,7 @@
 
 import os
 import sys
+import array
 import unittest
 import fundamental_tester_base
 from pygccxml import declarations
@@ -36,6 +37,16 @@ class tester_t(fundamental_tester_base.fundamental_tester_base_t):
         fvector.indexing_suite.disable_method( 'extend' )
         fvector.indexing_suite.disable_methods_group( 'reorder' )
         #fvector.indexing_suite.call_policies = module_builder.call_policies.default_call_policies()
+        dvector = generator.global_ns.typedef( 'dvector' )
+        dvector = declarations.remove_declarated( dvector.decl_type )
+        dvector.indexing_suite.bulk_access = True
+        self.assertTrue( dvector.indexing_suite.does_bulk_access() )
+        fvector.indexing_suite.bulk_access = True
+        self.assertTrue( fvector.indexing_suite.does_bulk_access() )
+        fvector.indexing_suite.bulk_access = False
+        strings.indexing_suite.bulk_access = True
+        self.assertTrue( not strings.indexing_suite.does_bulk_access() )
+        strings.indexing_suite.bulk_access = False
         items_ptr = generator.global_ns.typedefs( 'items_ptr_t' )[0]
         items_ptr = declarations.remove_declarated( items_ptr.decl_type )
         self.assertTrue( items_ptr.indexing_suite.call_policies.__class__
@@ -95,6 +106,37 @@ class tester_t(fundamental_tester_base.fundamental_tester_base_t):
         values.sort()
         self.assertTrue( [0,1,2,3,4]==values )
 
+        dv = module.create_dvector()
+        self.assertTrue( [0.0, 1.0, 2.0, 3.0, 4.0] == memoryview( dv ).tolist() )
+        dv.extend( array.array( 'd', [5, 6] ) )
+        self.assertTrue( 7 == len( dv ) and 6.0 == dv[6] )
+        dv.extend( [7] )
+        self.assertTrue( 8 == len( dv ) )
+        self.assertTrue( [1.0, 3.0, 5.0] == list( dv[1:7:2] ) )
+        dv[0:2] = array.array( 'd', [10, 11, 12] )
+        self.assertTrue( [10.0, 11.0, 12.0, 2.0] == memoryview( dv ).tolist()[:4] )
+        self.assertRaises( ValueError, dv.__setitem__, slice( 0, 4, 2 ), array.array( 'd', [1] ) )
+
+        view = memoryview( dv )
+        self.assertRaises( BufferError, dv.append, 1 )
+        self.assertRaises( BufferError, dv.extend, array.array( 'd', [1] ) )
+        self.assertRaises( BufferError, dv.insert, 0, 1 )
+        self.assertRaises( BufferError, dv.__delitem__, 0 )
+        self.assertRaises( BufferError, dv.__setitem__, slice( 0, 2 ), array.array( 'd', [1] ) )
+        dv[0] = 20
+        self.assertTrue( 20.0 == view[0] )
+        view.release()
+        dv.append( 13 )
+        self.assertTrue( 10 == len( dv ) )
+
+        registry = module.registry_t()
+        for name in ( 'append', 'extend', 'insert', 'sort', 'reverse', '__setitem__', '__delitem__' ):
+            self.assertTrue( not hasattr( registry.records, name ) )
+            self.assertTrue( not hasattr( registry.ids, name ) )
+        self.assertTrue( 2 == len( registry.records ) )
+        self.assertTrue( 1 == registry.records[1].value )
+        self.assertTrue( [0, 1, 2] == list( registry.ids ) )
+
 def create_suite():
     suite = unittest.TestSuite()    
     suite.addTest( unittest.makeSuite(tester_t))
@@ -0,0 +1,46 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import os
+import sys
+import unittest
+import autoconfig
+from pygccxml.utils import utils as pygccxml_utils
+from pyplusplus.module_builder import location_scope
+
+def normalize( path ):
+    return pygccxml_utils.normalize_path( path )
+
+class tester_t(unittest.TestCase):
+    def setUp( self ):
+        self.parsed_files = [ normalize( '/project/include/lib.hpp' ), 'config.hpp' ]
+        self.parsed_dirs = [ normalize( '/project/include' ) ]
+        self.scope = location_scope.location_scope_t( self.parsed_files, self.parsed_dirs )
+
+    def test_dirs(self):
+        self.assertTrue( self.scope.is_in_scope( '/project/include/detail/impl.hpp' ) )
+        self.assertTrue( self.scope.is_in_scope( '/project/include/../include/other.hpp' ) )
+        self.assertFalse( self.scope.is_in_scope( '/usr/include/vector' ) )
+
+    def test_files(self):
+        self.assertTrue( self.scope.is_in_scope( '/project/include/lib.hpp' ) )
+        self.assertTrue( self.scope.is_in_scope( '/somewhere/config.hpp' ) )
+        self.assertFalse( self.scope.is_in_scope( '/somewhere/config.hpp.in' ) )
+
+    def test_memoization(self):
+        for i in range( 2 ):
+            self.assertFalse( self.scope.is_in_scope( '/usr/include/vector' ) )
+            self.assertTrue( self.scope.is_in_scope( '/somewhere/config.hpp' ) )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
@@ -0,0 +1,68 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import os
+import sys
+import shutil
+import unittest
+import autoconfig
+from pyplusplus import file_writers
+from pyplusplus import module_builder
+
+class tester_t(unittest.TestCase):
+    def setUp( self ):
+        self.dir_path = os.path.join( autoconfig.build_dir, 'manifest' )
+        if os.path.exists( self.dir_path ):
+            shutil.rmtree( self.dir_path )
+        os.makedirs( self.dir_path )
+        self.manifest_file = os.path.join( self.dir_path, 'manifest.manifest' )
+
+    def write( self, alias=None ):
+        mb = module_builder.module_builder_t(
+                [ os.path.join( autoconfig.data_directory, 'manifest_to_be_exported.hpp' ) ]
+                , xml_generator_config=autoconfig.xml_generator_config)
+        mb.namespace( name='manifest' ).include()
+        if alias:
+            mb.class_( 'item_t' ).rename( alias )
+        mb.build_code_creator( 'manifest' )
+
+        manifest = file_writers.manifest_t( self.manifest_file )
+        writer = file_writers.multiple_files_t( mb.code_creator
+                                                , self.dir_path
+                                                , files_sum_repository=manifest )
+        rendered = []
+        write_source = writer.write_source
+        def write_source_spy( sink, file_name, *args ):
+            rendered.append( file_name )
+            return write_source( sink, file_name, *args )
+        writer.write_source = write_source_spy
+        writer.write()
+        return rendered, writer.written_files
+
+    def test(self):
+        rendered, written_files_1 = self.write()
+        self.assertTrue( 'item_t' in rendered and 'other_t' in rendered )
+
+        rendered, written_files_2 = self.write()
+        self.assertTrue( not rendered )
+        self.assertTrue( sorted( written_files_1 ) == sorted( written_files_2 ) )
+
+        rendered, written_files = self.write( 'item' )
+        self.assertTrue( [ 'item' ] == rendered )
+
+        os.utime( os.path.join( self.dir_path, 'other_t.pypp.cpp' ), ( 1, 1 ) )
+        rendered, written_files = self.write( 'item' )
+        self.assertTrue( [ 'other_t' ] == rendered )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
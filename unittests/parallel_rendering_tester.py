@@ -0,0 +1,64 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import os
+import sys
+import unittest
+import autoconfig
+from pyplusplus import module_builder
+
+class tester_t(unittest.TestCase):
+    CODE = \
+    """
+    namespace parallel_rendering{
+        struct base_t{
+            virtual int run( int x ){ return x; }
+        };
+
+        struct derived_t : base_t{
+            virtual int run( int x ){ return x + 1; }
+        };
+
+        struct item_t{
+            int get_value() const { return 1; }
+        };
+
+        int do_smth( int x ){ return x; }
+    }
+    """
+
+    def split_module( self, dir_name, jobs ):
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , xml_generator_config=autoconfig.xml_generator_config)
+        mb.namespace( name='parallel_rendering' ).include()
+        mb.build_code_creator( 'parallel_rendering' )
+        dir_path = os.path.join( autoconfig.build_dir, dir_name )
+        files = mb.split_module( dir_path, jobs=jobs )
+        answer = {}
+        for fpath in files:
+            #only the generated code is compared, the list also contains files,
+            #which could be skipped by the files sum repository
+            if fpath.endswith( ( '.pypp.cpp', '.pypp.hpp' ) ):
+                with open( fpath ) as f:
+                    answer[ os.path.basename( fpath ) ] = f.read()
+        return answer
+
+    def test(self):
+        serial = self.split_module( 'parallel_rendering_1', 1 )
+        parallel = self.split_module( 'parallel_rendering_3', 3 )
+        self.assertTrue( serial )
+        self.assertTrue( serial == parallel )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
@@ -0,0 +1,66 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import os
+import sys
+import shutil
+import unittest
+import autoconfig
+from pygccxml import declarations
+from pyplusplus import module_builder
+from pyplusplus.module_builder import xml_generator_pool
+
+class tester_t(unittest.TestCase):
+    FILES = [ 'enums_to_be_exported.hpp'
+              , 'free_functions_to_be_exported.hpp'
+              , 'member_functions_to_be_exported.hpp' ]
+
+    def setUp( self ):
+        self.cache_dir = os.path.join( autoconfig.build_directory, 'parse_jobs_xml_cache' )
+        if os.path.exists( self.cache_dir ):
+            shutil.rmtree( self.cache_dir )
+
+    def tearDown( self ):
+        if os.path.exists( self.cache_dir ):
+            shutil.rmtree( self.cache_dir )
+
+    def create_module_builder( self, **keywds ):
+        files = [ os.path.join( autoconfig.data_directory, f ) for f in self.FILES ]
+        return module_builder.module_builder_t( files
+                                                , xml_generator_config=autoconfig.xml_generator_config
+                                                , **keywds )
+
+    def get_names( self, mb ):
+        return [ declarations.full_name( d ) for d in mb.global_ns.decls( allow_empty=True ) ]
+
+    def test(self):
+        expected = self.get_names( self.create_module_builder() )
+        mb = self.create_module_builder( parse_jobs=3, xml_cache_dir=self.cache_dir )
+        self.assertEqual( expected, self.get_names( mb ) )
+        xml_files = [ f for f in os.listdir( self.cache_dir ) if f.endswith( '.xml' ) ]
+        self.assertEqual( len( xml_files ), len( self.FILES ) )
+
+        #the second run should not invoke the XML generator
+        pool = xml_generator_pool.xml_generator_pool_t( autoconfig.xml_generator_config, 3, self.cache_dir )
+        pool.generate( [ os.path.join( autoconfig.data_directory, f ) for f in self.FILES ] )
+        self.assertEqual( ( pool.hits, pool.misses ), ( len( self.FILES ), 0 ) )
+        mb = self.create_module_builder( parse_jobs=3, xml_cache_dir=self.cache_dir )
+        self.assertEqual( expected, self.get_names( mb ) )
+
+    def test_without_cache(self):
+        expected = self.get_names( self.create_module_builder() )
+        mb = self.create_module_builder( parse_jobs=2 )
+        self.assertEqual( expected, self.get_names( mb ) )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
@@ -0,0 +1,78 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import os
+import sys
+import json
+import shutil
+import unittest
+import autoconfig
+from pyplusplus import code_creators
+from pyplusplus import module_builder
+
+class tester_t(unittest.TestCase):
+    CODE = \
+    """
+    namespace profiler{
+        struct item_t{
+            int get_value() const { return 1; }
+        };
+
+        int do_smth( int x ){ return x; }
+    }
+    """
+
+    def setUp( self ):
+        self.dir_path = os.path.join( autoconfig.build_dir, 'profiler' )
+        if os.path.exists( self.dir_path ):
+            shutil.rmtree( self.dir_path )
+        os.makedirs( self.dir_path )
+
+    def test(self):
+        original_create = code_creators.code_creator_t.create
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , xml_generator_config=autoconfig.xml_generator_config
+                , profile=True )
+        mb.namespace( name='profiler' ).include()
+        mb.build_code_creator( 'profiler' )
+        mb.split_module( self.dir_path )
+        self.assertTrue( original_create is code_creators.code_creator_t.create )
+        self.assertTrue( None is code_creators.code_creator_t.renderer )
+
+        json_report = os.path.join( self.dir_path, 'profile.json' )
+        mb.save_profile( json_report )
+        with open( json_report, 'r' ) as f:
+            report = json.load( f )
+        phases = [ phase[ 'name' ] for phase in report[ 'phases' ] ]
+        for name in ( 'parsing', 'sorting declarations', 'visiting declarations'
+                      , 'writing files', 'writing files: rendering', 'writing files: file i/o' ):
+            self.assertTrue( name in phases, name )
+        creators = dict( [ ( item[ 'name' ], item[ 'calls' ] ) for item in report[ 'creators' ] ] )
+        self.assertTrue( creators.get( 'class_t' ) and creators.get( 'free_function_t' ) )
+        declarations = [ item[ 'name' ] for item in report[ 'slowest_declarations' ] ]
+        self.assertTrue( [ name for name in declarations if 'item_t' in name ] )
+
+        text_report = os.path.join( self.dir_path, 'profile.txt' )
+        mb.save_profile( text_report )
+        with open( text_report, 'r' ) as f:
+            self.assertTrue( 'slowest declarations:' in f.read() )
+
+    def test_disabled(self):
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , xml_generator_config=autoconfig.xml_generator_config )
+        self.assertRaises( RuntimeError, mb.save_profile, os.path.join( self.dir_path, 'profile.txt' ) )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
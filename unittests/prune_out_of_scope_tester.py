@@ -0,0 +1,46 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import os
+import sys
+import unittest
+import autoconfig
+from pygccxml import declarations
+from pyplusplus import module_builder
+
+class tester_t(unittest.TestCase):
+    def create_module_builder( self, prune_out_of_scope ):
+        mb = module_builder.module_builder_t(
+                [ os.path.join( autoconfig.data_directory, 'cppexceptions_to_be_exported.hpp' ) ]
+                , xml_generator_config=autoconfig.xml_generator_config
+                , prune_out_of_scope=prune_out_of_scope )
+        mb.build_code_creator( 'cppexceptions' )
+        return mb
+
+    def test(self):
+        full = self.create_module_builder( False )
+        pruned = self.create_module_builder( True )
+        self.assertTrue( len( declarations.make_flatten( pruned.global_ns ) )
+                         < len( declarations.make_flatten( full.global_ns ) ) )
+        self.assertEqual( full.code_creator.create(), pruned.code_creator.create() )
+
+        #std::string is used by the exposed class, so it stays in the tree - excluded
+        custom_exception = pruned.class_( 'custom_exception_t' )
+        return_type = custom_exception.member_function( 'what' ).return_type
+        string = declarations.class_traits.get_declaration( declarations.remove_alias(
+                    declarations.remove_cv( declarations.remove_reference( return_type ) ) ) )
+        self.assertTrue( string.ignore )
+        self.assertTrue( string in pruned.global_ns.decls( recursive=True ) )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
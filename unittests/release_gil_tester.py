@@ -0,0 +1,152 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import os
+import sys
+import unittest
+import autoconfig
+from pyplusplus import messages
+from pyplusplus import code_creators
+from pyplusplus import module_builder
+from pyplusplus import function_transformers as FT
+
+class tester_t(unittest.TestCase):
+    CODE = \
+    """
+    namespace boost{ namespace python{ class object{}; } }
+
+    namespace release_gil{
+        struct item_t{
+            int get_value() const { return 1; }
+            static int create(){ return 1; }
+            virtual int run( int y ){ return y; }
+        };
+
+        int do_smth( int x ){ return x; }
+        void get_size( int& size ){ size = 1; }
+        void do_python( boost::python::object obj ){}
+    }
+    """
+
+    def create_module_builder( self ):
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , xml_generator_config=autoconfig.xml_generator_config )
+        mb.namespace( name='release_gil' ).include()
+        return mb
+
+    def test(self):
+        mb = self.create_module_builder()
+        ns = mb.namespace( name='release_gil' )
+        ns.calldefs().release_gil = True
+        ns.free_function( 'get_size' ).add_transformation( FT.output( 'size' ) )
+        mb.build_code_creator( 'release_gil' )
+        code = mb.code_creator.create()
+
+        wrappers = mb.code_creator.find_descendants_by_class( code_creators.release_gil_wrapper_t )
+        names = set( [ creator.declaration.name for creator in wrappers ] )
+        self.assertEqual( names, set( [ 'get_value', 'create', 'do_smth' ] ) )
+        self.assertTrue( code_creators.release_gil_wrapper_t( ns.member_function( 'get_value' ) ).has_inst_arg )
+        self.assertTrue( '__gil_guard.pypp.hpp' in code )
+        self.assertFalse( '__override_cache.pypp.hpp' in code )
+        self.assertTrue( 'gil_release.restore();' in code ) #get_size transformation
+
+        self.assertFalse( ns.free_function( 'do_python' ).does_release_gil() )
+        self.assertFalse( ns.member_function( 'run' ).does_release_gil() )
+        self.assertTrue( [ msg for msg in ns.free_function( 'do_python' ).readme()
+                           if msg.identifier == 'W1067' ] )
+        self.assertTrue( [ msg for msg in ns.member_function( 'run' ).readme()
+                           if msg.identifier == 'W1068' ] )
+
+    def test_disabled(self):
+        mb = self.create_module_builder()
+        mb.build_code_creator( 'release_gil' )
+        self.assertFalse( 'gil_release' in mb.code_creator.create() )
+
+class thread_safe_overrides_tester_t(unittest.TestCase):
+    CODE = \
+    """
+    namespace thread_safe{
+        struct base_t{
+            virtual ~base_t(){}
+            virtual int run( int y ){ return y; }
+            virtual int run( double y ){ return 0; }
+            virtual void stop(){}
+            virtual int calculate() const = 0;
+        };
+
+        struct other_t{
+            virtual ~other_t(){}
+            virtual int run( int y ){ return y; }
+            virtual void stop(){}
+        };
+
+        struct protected_t{
+            virtual ~protected_t(){}
+        protected:
+            virtual int run( int y ){ return y; }
+            virtual int calculate() const = 0;
+        private:
+            virtual void stop() = 0;
+        };
+
+        struct transformed_t{
+            virtual ~transformed_t(){}
+            virtual void get_size( int& size ){ size = 0; }
+        };
+    }
+    """
+
+    def test(self):
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , xml_generator_config=autoconfig.xml_generator_config )
+        ns = mb.namespace( name='thread_safe' )
+        ns.include()
+        ns.class_( 'base_t' ).thread_safe_overrides = True
+        ns.class_( 'other_t' ).member_function( 'stop' ).thread_safe_override = True
+        ns.class_( 'protected_t' ).thread_safe_overrides = True
+        transformed = ns.class_( 'transformed_t' )
+        transformed.thread_safe_overrides = True
+        transformed.member_function( 'get_size' ).add_transformation( FT.output( 'size' ) )
+        mb.build_code_creator( 'thread_safe' )
+        code = mb.code_creator.create()
+
+        wrappers = dict( [ ( creator.declaration.name, creator.create() ) for creator
+                           in mb.code_creator.find_descendants_by_class( code_creators.class_wrapper_t ) ] )
+        base_code = wrappers[ 'base_t' ]
+        self.assertEqual( base_code.count( 'override_cache_t m_pypp_run_override;' ), 1 )
+        self.assertEqual( base_code.count( 'override_cache_t m_pypp_stop_override;' ), 1 )
+        self.assertEqual( base_code.count( 'gil_guard_t gil_guard( true );' ), 4 )
+        self.assertTrue( 'override_cache_t::invalidate_all()' in base_code )
+
+        other_code = wrappers[ 'other_t' ]
+        self.assertFalse( 'm_pypp_run_override' in other_code )
+        self.assertTrue( 'm_pypp_stop_override' in other_code )
+        self.assertTrue( '__gil_guard.pypp.hpp' in code )
+        self.assertTrue( '__override_cache.pypp.hpp' in code )
+
+        protected_code = wrappers[ 'protected_t' ]
+        self.assertEqual( protected_code.count( 'override_cache_t m_pypp_run_override;' ), 1 )
+        self.assertFalse( 'm_pypp_stop_override' in protected_code )
+        self.assertEqual( protected_code.count( 'gil_guard_t gil_guard( true );' ), 3 )
+
+        get_size = transformed.member_function( 'get_size' )
+        self.assertFalse( get_size.does_thread_safe_override() )
+        self.assertTrue( [ msg for msg in get_size.readme() if msg.identifier == 'W1071' ] )
+        self.assertFalse( 'gil_guard' in wrappers[ 'transformed_t' ] )
+        self.assertTrue( '__override_cache.pypp.hpp' in code )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    suite.addTest( unittest.makeSuite(thread_safe_overrides_tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
@@ -130,6 +130,19 @@ import ft_inout_static_matrix_tester
 import ft_inout_static_array_tester
 import inner_base_class_tester
 import indexing_suite2_shared_ptr_value_traits_tester
+import creators_cache_tester
+import parallel_rendering_tester
+import manifest_tester
+import dependencies_tester
+import profiler_tester
+import release_gil_tester
+import buffers_tester
+import call_stats_tester
+import parse_jobs_tester
+import decls_snapshot_tester
+import location_scope_tester
+import prune_out_of_scope_tester
+import balanced_files_cost_tester
 
 testers = [
     algorithms_tester
@@ -245,6 +258,19 @@ testers = [
     , ft_inout_static_matrix_tester
     , ft_inout_static_array_tester
     , inner_base_class_tester
+    , creators_cache_tester
+    , parallel_rendering_tester
+    , manifest_tester
+    , dependencies_tester
+    , profiler_tester
+    , release_gil_tester
+    , buffers_tester
+    , call_stats_tester
+    , parse_jobs_tester
+    , decls_snapshot_tester
+    , location_scope_tester
+    , prune_out_of_scope_tester
+    , balanced_files_cost_tester
 #    , indexing_suite2_shared_ptr_value_traits_tester
 #    , ogre_generate_tester too much time
 ]